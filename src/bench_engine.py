@@ -0,0 +1,55 @@
+"""
+Turn throughput benchmark for game_engine.GameEngine.
+
+    python bench_engine.py [--players N] [--turns T] [--seed K]
+
+Plays one match of N random players on the shipped board (each alive
+player picks a random possible action every turn) and prints the
+engine's latency and player-turn statistics.
+"""
+
+import argparse
+import random
+
+from game_board import GameBoard
+from game_engine import ATTACKS, MOVES, GameEngine, Intent
+
+
+def random_intents(engine: GameEngine, rng: random.Random, spread: int = 4):
+    board = engine.board
+    intents = []
+    for pid in engine.alive():
+        player = engine.players[pid]
+        action = rng.choice(engine.possible_actions(pid))
+        target = None
+        if action in MOVES or action in ATTACKS:
+            target = (
+                min(max(player.x + rng.randint(-spread, spread), 0), board.WIDTH - 1),
+                min(max(player.y + rng.randint(-spread, spread), 0), board.HEIGHT - 1),
+            )
+        intents.append(Intent(pid, action, target))
+    return intents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = GameEngine(GameBoard("board.csv"), seed=args.seed)
+    for _ in range(args.players):
+        engine.add_player()
+
+    while engine.turn < args.turns and not engine.is_over():
+        engine.step(random_intents(engine, rng))
+
+    print(f"{args.players} players, {engine.turn} turns, winner={engine.winner}")
+    for key, value in engine.stats().items():
+        print(f"  {key:<24} {value:.3f}" if isinstance(value, float) else f"  {key:<24} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Node-expansion benchmark for the search strategies in search.py.
+
+    python bench_search.py [--queries N] [--size S] [--seed K]
+
+Runs the same random walk queries with every strategy on the shipped
+board and on a synthetic S x S board (plain with scattered water), and
+prints total node expansions and wall time per strategy.
+"""
+
+import argparse
+import random
+import time
+
+from game_board import GameBoard
+from player import MOVEMENT_MODES
+from search import SEARCH_STRATEGIES
+
+
+def synthetic_board(size: int, rng: random.Random) -> GameBoard:
+    board = GameBoard(width=size, height=size, backend="array")
+    for _ in range(size * size // 8):
+        board.set_terrain(rng.randrange(size), rng.randrange(size), sea=True, plain=False)
+    return board
+
+
+def random_queries(board, count: int, max_ap: int, rng: random.Random):
+    walkable = MOVEMENT_MODES["walk"][1]
+    queries = []
+    while len(queries) < count:
+        sx, sy = rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT)
+        ap = rng.randint(1, max_ap)
+        tx = min(max(sx + rng.randint(-ap, ap), 0), board.WIDTH - 1)
+        ty = min(max(sy + rng.randint(-ap, ap), 0), board.HEIGHT - 1)
+        if walkable(board.get_cell(sx, sy)) and walkable(board.get_cell(tx, ty)):
+            queries.append(((sx, sy), (tx, ty), ap))
+    return queries
+
+
+def run(label: str, board, queries) -> None:
+    walkable = MOVEMENT_MODES["walk"][1]
+    print(f"{label}: {board.WIDTH}x{board.HEIGHT}, {len(queries)} queries")
+
+    answers = {}
+    for name, search in SEARCH_STRATEGIES.items():
+        expanded = 0
+        found = []
+        start_time = time.perf_counter()
+        for start, target, ap in queries:
+            result = search(board, start, target, ap, walkable)
+            expanded += result.expanded
+            found.append(result.found)
+        elapsed = time.perf_counter() - start_time
+        answers[name] = found
+        print(f"  {name:<14} expanded={expanded:>10}  time={elapsed * 1000:8.1f} ms")
+
+    reference = answers["bfs"]
+    for name, found in answers.items():
+        if found != reference:
+            print(f"  WARNING: {name} disagrees with bfs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    shipped = GameBoard("board.csv")
+    run("shipped board, AP<=19", shipped, random_queries(shipped, args.queries, 19, rng))
+
+    large = synthetic_board(args.size, rng)
+    run("synthetic board, AP<=40", large, random_queries(large, args.queries, 40, rng))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Bitboard helpers.
+
+A bitboard is a Python int in which bit `y * width + x` stands for
+cell (x, y). Boolean board layers are stored one byte per cell (0/1);
+these helpers convert between the two so whole-board queries run as a
+handful of C-level bytes/int operations instead of per-cell calls.
+"""
+
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+
+# byte value -> ASCII digit ("0" for zero, "1" for anything else)
+_NONZERO_TO_DIGIT = bytes(48 if v == 0 else 49 for v in range(256))
+# ASCII digit -> byte value 0/1
+_DIGIT_TO_BYTE = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def from_layer(buf) -> int:
+    """
+    Bitboard of the non-zero entries of a byte layer.
+    """
+    if len(buf) == 0:
+        return 0
+    return int(bytes(buf).translate(_NONZERO_TO_DIGIT)[::-1], 2)
+
+
+def from_layer_equal(buf, value: int) -> int:
+    """
+    Bitboard of the entries of a byte layer equal to `value`.
+    """
+    if len(buf) == 0:
+        return 0
+    table = bytes(49 if v == value else 48 for v in range(256))
+    return int(bytes(buf).translate(table)[::-1], 2)
+
+
+def to_layer(mask: int, size: int) -> bytes:
+    """
+    Expand a bitboard back into `size` bytes of 0/1.
+    """
+    if mask < 0 or mask >> size:
+        raise ValueError("Mask does not fit the layer")
+    return format(mask, "b").zfill(size)[::-1].encode("ascii").translate(_DIGIT_TO_BYTE)
+
+
+def full_mask(size: int) -> int:
+    return (1 << size) - 1
+
+
+def iter_indices(mask: int) -> Iterator[int]:
+    """
+    Yield the indices of the set bits, in ascending order.
+    """
+    if not mask:
+        return
+    digits = format(mask, "b")[::-1]
+    i = digits.find("1")
+    while i != -1:
+        yield i
+        i = digits.find("1", i + 1)
+
+
+@lru_cache(maxsize=32)
+def column_mask(width: int, height: int, x: int) -> int:
+    """
+    Bitboard with every cell of column `x` set.
+    """
+    row = ["0"] * width
+    row[width - 1 - x] = "1"
+    return int("".join(row) * height, 2)
+
+
+@lru_cache(maxsize=32)
+def edge_masks(width: int, height: int) -> Tuple[int, int, int]:
+    """
+    (all cells, all but the first column, all but the last column).
+    """
+    full = full_mask(width * height)
+    return (
+        full,
+        full & ~column_mask(width, height, 0),
+        full & ~column_mask(width, height, width - 1),
+    )
+
+
+def spread4(mask: int, width: int, height: int) -> int:
+    """
+    Bitboard of all cells orthogonally adjacent to a set cell
+    (the set cells themselves are not included unless adjacent to another).
+    """
+    full, not_first_col, not_last_col = edge_masks(width, height)
+    return (
+        ((mask << 1) & not_first_col)
+        | ((mask >> 1) & not_last_col)
+        | (mask << width)
+        | (mask >> width)
+    ) & full
+
+
+def flood_rings(start: int, passable: int, width: int, height: int, steps: int) -> List[int]:
+    """
+    Bounded flood fill: ring k holds the passable cells first reached
+    after exactly k steps from `start` (ring 0 is `start` itself).
+    Stops early once a step adds nothing.
+    """
+    rings = [start]
+    reached = start
+    frontier = start
+    for _ in range(steps):
+        frontier = spread4(frontier, width, height) & passable & ~reached
+        if not frontier:
+            break
+        reached |= frontier
+        rings.append(frontier)
+    return rings
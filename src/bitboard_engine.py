@@ -0,0 +1,102 @@
+from typing import Dict, Tuple
+
+from bitboard import flood_rings, iter_indices, spread4
+from constants import MOVEMENT_NETWORKS
+from player import MOVEMENT_MODES
+
+
+class BitboardEngine:
+    """
+    Reachability on whole-board bitboards.
+
+    Each network (road, railroad, water, sea, walkable) is one Python
+    int; a search step expands the entire frontier with four shifts and
+    two masks instead of visiting cells one by one, which keeps
+    within-AP queries cheap on very large boards.
+
+    Answers the same questions as Player.reachable_cells and
+    Player.can_get_by_* for boards that provide network_mask.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self._masks: Dict[str, Tuple[int, int]] = {}
+
+    def passable_mask(self, mode: str) -> int:
+        if mode not in MOVEMENT_NETWORKS:
+            raise ValueError(f"Unknown movement mode: {mode!r}")
+
+        generation = self.board.generation
+        cached = self._masks.get(mode)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        mask = self.board.network_mask(MOVEMENT_NETWORKS[mode])
+        self._masks[mode] = (generation, mask)
+        return mask
+
+    def reachable_mask(self, player, mode: str, action_points: int) -> int:
+        """
+        Bitboard of the cells player can reach with `mode` within AP
+        (0 when the start does not qualify, as in reachable_cells).
+        """
+        reached = 0
+        for ring in self._rings(player, mode, action_points):
+            reached |= ring
+        return reached
+
+    def reachable_cells(self, player, mode: str, action_points: int) -> Dict[Tuple[int, int], int]:
+        width = self.board.WIDTH
+        return {
+            (i % width, i // width): d
+            for d, ring in enumerate(self._rings(player, mode, action_points))
+            for i in iter_indices(ring)
+        }
+
+    def can_get_by(self, player, mode: str, target_x: int, target_y: int, action_points: int) -> bool:
+        """
+        Bitboard counterpart of Player.can_get_by_<mode>.
+        """
+        board = self.board
+        passable = self.passable_mask(mode)
+
+        early = player._early_same_cell_check(board, target_x, target_y, action_points)
+        if early is not None:
+            return early
+
+        flag = MOVEMENT_MODES[mode][0]
+        if flag is not None and not getattr(player, flag):
+            return False
+
+        width, height = board.WIDTH, board.HEIGHT
+        start = 1 << (player.y * width + player.x)
+        target = 1 << (target_y * width + target_x)
+        if not (start & passable and target & passable):
+            return False
+
+        reached = frontier = start
+        for _ in range(action_points):
+            frontier = spread4(frontier, width, height) & passable & ~reached
+            if frontier & target:
+                return True
+            if not frontier:
+                return False
+            reached |= frontier
+        return False
+
+    def _rings(self, player, mode: str, action_points: int):
+        board = self.board
+        passable = self.passable_mask(mode)
+
+        if not isinstance(action_points, int) or action_points < 0:
+            return []
+        if not board.is_in_bounds(player.x, player.y):
+            return []
+        flag = MOVEMENT_MODES[mode][0]
+        if flag is not None and not getattr(player, flag):
+            return []
+
+        start = 1 << (player.y * board.WIDTH + player.x)
+        if not start & passable:
+            return []
+        return flood_rings(start, passable, board.WIDTH, board.HEIGHT, action_points)
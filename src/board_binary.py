@@ -0,0 +1,109 @@
+"""
+Binary board format.
+
+Layout (little endian):
+
+    header   magic b"CBRD", version u16, layer count u16,
+             width u32, height u32, crc32 of the payload u32
+    payload  one width*height byte layer per entry of BINARY_LAYERS,
+             in that order (boolean layers hold 0/1, building holds
+             the building type id)
+
+The payload is exactly the BoardLayers layout, so reading maps the file
+and slices it into layer views without parsing or copying.
+"""
+
+import mmap
+import struct
+import zlib
+
+from board_layers import BoardLayers, LAYER_NAMES
+
+
+MAGIC = b"CBRD"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+BINARY_LAYERS = LAYER_NAMES + ("building",)
+
+
+class BoardFormatError(ValueError):
+    pass
+
+
+def write_layers(layers: BoardLayers, path: str) -> None:
+    payload = [bytes(layers.layer(name)) for name in BINARY_LAYERS]
+
+    checksum = 0
+    for chunk in payload:
+        checksum = zlib.crc32(chunk, checksum)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(BINARY_LAYERS), layers.width, layers.height, checksum))
+        for chunk in payload:
+            f.write(chunk)
+
+
+def read_layers(path: str, *, verify: bool = False) -> BoardLayers:
+    """
+    Map a binary board file and return layers viewing the mapping.
+
+    The mapping is copy-on-write: edits (e.g. GameCell.build()) change
+    the in-memory board only, never the file.
+
+    verify=True checks the payload crc32, which touches every page of
+    the file; header and size checks always run.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except ValueError:
+            raise BoardFormatError("Binary board file is empty") from None
+
+    if len(mm) < HEADER.size:
+        raise BoardFormatError("Binary board file is truncated")
+
+    magic, version, layer_count, width, height, checksum = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise BoardFormatError("Not a binary board file")
+    if version != VERSION:
+        raise BoardFormatError(f"Unsupported binary board version: {version}")
+    if layer_count != len(BINARY_LAYERS):
+        raise BoardFormatError(f"Unexpected layer count: {layer_count}")
+
+    size = width * height
+    if len(mm) != HEADER.size + size * layer_count:
+        raise BoardFormatError("Binary board file size does not match header")
+
+    view = memoryview(mm)
+    if verify and zlib.crc32(view[HEADER.size:]) != checksum:
+        raise BoardFormatError("Binary board checksum mismatch")
+
+    buffers = {}
+    offset = HEADER.size
+    for name in BINARY_LAYERS:
+        buffers[name] = view[offset:offset + size]
+        offset += size
+
+    layers = BoardLayers(width, height, buffers)
+    # keep the mapping alive for as long as the layers use it
+    layers.mapping = mm
+    return layers
+
+
+def csv_to_binary(csv_path: str, binary_path: str) -> None:
+    """
+    Convert a board.csv (x,y,sea,...,building schema) to the binary format.
+    """
+    # game_board imports this module for GameBoard.from_binary
+    from game_board import GameBoard
+
+    GameBoard(csv_path, backend="array").save_binary(binary_path)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print("usage: python board_binary.py BOARD_CSV BOARD_BIN")
+        sys.exit(2)
+    csv_to_binary(sys.argv[1], sys.argv[2])
@@ -0,0 +1,168 @@
+from typing import Optional, Tuple
+
+from bitboard import from_layer, from_layer_equal, to_layer
+from constants import TERRAIN_INDEX, BUILDING_TYPE
+from game_cell import GameCell
+
+
+# Boolean layers in terrain tuple order (building is stored separately)
+LAYER_NAMES = ("sea", "swamp", "plain", "forest", "road", "railroad", "shore")
+
+
+class BoardLayers:
+    """
+    Structure-of-arrays terrain storage.
+
+    Every boolean layer is a flat byte buffer holding 0/1 per cell and
+    the building layer holds the building type id per cell (uint8).
+    Cell (x, y) lives at index `y * width + x` in every layer.
+
+    Buffers may be any writable bytes-like object (bytearray, memoryview
+    over an mmap or shared memory block), so the same layout can be
+    wrapped without copying; `numpy.frombuffer(layer, dtype=bool)` gives
+    an array view for callers that have numpy available.
+    """
+
+    def __init__(self, width: int, height: int, buffers: Optional[dict] = None):
+        self.width = int(width)
+        self.height = int(height)
+        self.size = self.width * self.height
+
+        if buffers is None:
+            buffers = {}
+
+        for name in LAYER_NAMES + ("building",):
+            buf = buffers.get(name)
+            if buf is None:
+                buf = bytearray(self.size)
+            elif len(buf) != self.size:
+                raise ValueError(f"Layer {name!r} has {len(buf)} cells, expected {self.size}")
+            setattr(self, name, buf)
+
+    # -------------------------------------------------
+    # Access
+    # -------------------------------------------------
+
+    def layer(self, name: str):
+        if name not in LAYER_NAMES and name != "building":
+            raise ValueError(f"Unknown layer: {name!r}")
+        return getattr(self, name)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def set_terrain(self, i: int, terrain: Tuple) -> None:
+        for name in LAYER_NAMES:
+            self.layer(name)[i] = 1 if terrain[TERRAIN_INDEX[name]] else 0
+        self.building[i] = terrain[TERRAIN_INDEX["building"]]
+
+    def get_terrain(self, i: int) -> Tuple:
+        return tuple(bool(self.layer(name)[i]) for name in LAYER_NAMES) + (self.building[i],)
+
+    # -------------------------------------------------
+    # Whole-layer operations
+    # -------------------------------------------------
+
+    def mask(self, name: str) -> int:
+        """
+        Bitboard of a boolean layer, or of non-empty building cells
+        for "building".
+        """
+        return from_layer(self.layer(name))
+
+    def building_mask(self, building_type: int) -> int:
+        return from_layer_equal(self.building, building_type)
+
+    def set_mask(self, name: str, mask: int) -> None:
+        if name not in LAYER_NAMES:
+            raise ValueError(f"Unknown boolean layer: {name!r}")
+        self.layer(name)[:] = to_layer(mask, self.size)
+
+    def fill(self, name: str, value: int) -> None:
+        self.layer(name)[:] = bytes([value]) * self.size
+
+
+class CellView(GameCell):
+    """
+    Lightweight GameCell facade over one cell of a BoardLayers.
+
+    Reads and writes go straight to the layers, so a view never goes
+    stale and creating one costs a single small object.
+    """
+
+    __slots__ = ("_layers", "_i")
+
+    def __init__(self, layers: BoardLayers, x: int, y: int, observer=None):
+        self.x = x
+        self.y = y
+        self._layers = layers
+        self._i = y * layers.width + x
+        self._observer = observer
+
+    # --- compatibility view ---
+
+    @property
+    def terrain(self) -> Tuple[bool, bool, bool, bool, bool, bool, bool, int]:
+        return self._layers.get_terrain(self._i)
+
+    @terrain.setter
+    def terrain(self, terrain: Tuple[bool, bool, bool, bool, bool, bool, bool, int]) -> None:
+        self._layers.set_terrain(self._i, terrain)
+
+    # --- terrain checks ---
+
+    def is_sea(self) -> bool:
+        return self._layers.sea[self._i] != 0
+
+    def is_swamp(self) -> bool:
+        return self._layers.swamp[self._i] != 0
+
+    def is_plain(self) -> bool:
+        return self._layers.plain[self._i] != 0
+
+    def is_forest(self) -> bool:
+        return self._layers.forest[self._i] != 0
+
+    def is_road(self) -> bool:
+        return self._layers.road[self._i] != 0
+
+    def is_railroad(self) -> bool:
+        return self._layers.railroad[self._i] != 0
+
+    def is_shore(self) -> bool:
+        return self._layers.shore[self._i] != 0
+
+    # --- building checks ---
+
+    def is_building(self) -> bool:
+        return self._layers.building[self._i] != BUILDING_TYPE["none"]
+
+    def get_building_type(self) -> int:
+        return self._layers.building[self._i]
+
+    # --- combined rules ---
+
+    def is_water(self) -> bool:
+        layers, i = self._layers, self._i
+        return layers.sea[i] != 0 or layers.swamp[i] != 0
+
+    def is_shot_passing(self) -> bool:
+        return not self.is_building() and not self.is_forest()
+
+    def is_buildable(self) -> bool:
+        layers, i = self._layers, self._i
+        return not (
+            layers.building[i]
+            or layers.sea[i]
+            or layers.swamp[i]
+            or layers.road[i]
+            or layers.railroad[i]
+        )
+
+    # --- internal helpers ---
+
+    def _set_building(self, value: int) -> None:
+        self._layers.building[self._i] = value
+
+    def _set_flag(self, name: str, value: bool) -> None:
+        self._layers.layer(name)[self._i] = 1 if value else 0
@@ -46,6 +46,15 @@ ASCII_TILE_RULES = [
     ("plain", ".", Ansi.GREEN),
 ]
 
+# Movement mode -> board network it travels on
+MOVEMENT_NETWORKS = {
+    "car": "road",
+    "train": "railroad",
+    "boat": "water",
+    "walk": "walkable",
+    "swim": "sea",
+}
+
 BALANCE = {
     "h2h": {
         "walk_ap": 6,
@@ -59,8 +68,34 @@ BALANCE = {
         "min_range": 2,
         "max_range": 19,
     },
+    # Per-turn action points of one move, by movement mode
+    "move": {
+        "walk_ap": 6,
+        "swim_ap": 3,
+        "stance_ap": 1,
+        "car_ap": 12,
+        "train_ap": 19,
+        "boat_ap": 9,
+    },
+    # Building prices and income
+    "economy": {
+        "heal_price": 200,
+        "car_price": 100,
+        "train_ticket_price": 50,
+        "boat_price": 150,
+        "guns_price": 300,
+        "work_income": 100,
+    },
 }
 
+# -------------------------------------------------
+# Weapon constants
+# -------------------------------------------------
+
+# Weapon items a player must carry together to fire each ranged weapon
+GUN_KIT = ("gun", "bullet")
+ROCKET_KIT = ("rpg", "rocket")
+
 # -------------------------------------------------
 # Helicopter part constants
 # -------------------------------------------------
@@ -1,8 +1,21 @@
-import random
 import csv
+import gc
+import operator
+from array import array
+from itertools import chain, repeat
 from typing import List, Optional
 
+from bitboard import from_layer, full_mask, iter_indices, spread4, to_layer
+from board_binary import read_layers, write_layers
+from board_layers import BoardLayers, CellView, LAYER_NAMES
 from game_cell import GameCell
+from junction_graph import JunctionGraph
+from helicopter_part import HelicopterPart
+from los_index import LineOfSightIndex
+from player_actions import cell_action_mask
+from reachability_cache import ReachabilityCache
+from spatial_index import SpatialIndex
+from spawn_pool import SpawnPool
 from constants import (
     TERRAIN_INDEX,
     BUILDING_TYPE,
@@ -11,6 +24,68 @@ from constants import (
 )
 
 
+BACKENDS = ("cells", "array")
+
+CSV_COLUMNS = (
+    "x", "y",
+    "sea", "swamp", "plain", "forest",
+    "road", "railroad",
+    "building",
+)
+
+_TRUE_TOKENS = ("1", "true", "t", "yes", "y")
+_FALSE_TOKENS = ("0", "false", "f", "no", "n", "")
+
+# "0"/"1" characters -> 0/1 bytes, for whole-column boolean parsing
+_BOOL_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+_INT_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Report at most this many individual problems per category
+MAX_REPORTED_ERRORS = 20
+
+NEIGHBOR_DIRECTIONS = {
+    4: (
+        (1, 0), (-1, 0),
+        (0, 1), (0, -1),
+    ),
+    8: (
+        (1, 0), (-1, 0),
+        (0, 1), (0, -1),
+        (1, 1), (1, -1),
+        (-1, 1), (-1, -1),
+    ),
+}
+
+# Network -> cell membership rule; networks are what the movement modes
+# travel on (constants.MOVEMENT_NETWORKS)
+NETWORK_RULES = {
+    "road": lambda c: c.is_road(),
+    "railroad": lambda c: c.is_railroad(),
+    "water": lambda c: c.is_water(),
+    "sea": lambda c: c.is_sea(),
+    "walkable": lambda c: not c.is_water() or c.is_road(),
+}
+
+EDITABLE_LAYERS = (
+    "sea", "swamp", "plain", "forest",
+    "road", "railroad",
+    "building",
+)
+
+
+class BoardValidationError(ValueError):
+    """
+    Raised by the fast CSV loader; `errors` lists every problem found.
+    """
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        summary = "; ".join(errors[:MAX_REPORTED_ERRORS])
+        if len(errors) > MAX_REPORTED_ERRORS:
+            summary += f"; ... ({len(errors) - MAX_REPORTED_ERRORS} more)"
+        super().__init__(f"Invalid board CSV ({len(errors)} errors): {summary}")
+
+
 class GameBoard:
     WIDTH = 36
     HEIGHT = 36
@@ -21,9 +96,13 @@ class GameBoard:
         *,
         width: Optional[int] = None,
         height: Optional[int] = None,
+        backend: str = "cells",
+        layers: Optional[BoardLayers] = None,
+        fast_csv: bool = False,
+        reach_cache_size: int = 256,
     ):
         """
-        Supports two modes:
+        Supports three modes:
 
         1) CSV mode (default):
            GameBoard() or GameBoard(csv_path="board.csv")
@@ -31,7 +110,47 @@ class GameBoard:
         2) Geometry / test mode:
            GameBoard(width=..., height=...)
            Creates a plain-only board with building=0.
+
+        3) Layer mode:
+           GameBoard(None, layers=BoardLayers(...))
+           Wraps existing layers as-is (array backend, no shore
+           recompute), e.g. a mapped binary board file.
+
+        backend:
+          - "cells" (default): `grid` holds one GameCell per cell
+          - "array": terrain lives in BoardLayers (one flat buffer per
+            layer); `grid` is None and get_cell returns a CellView
+
+        fast_csv: use the column-wise CSV loader (see load_from_csv).
+
+        reach_cache_size: entries kept in `reach_cache`, the LRU of
+        Player.reachable_cells results (0 disables it).
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
+        self.backend = backend
+        self.layers: Optional[BoardLayers] = None
+        self._adjacency_tables: dict[int, List[tuple[int, ...]]] = {}
+        self._spawn_pools: dict[bool, SpawnPool] = {}
+        self._component_labels: dict[str, array] = {}
+        self._junction_graphs: dict[str, JunctionGraph] = {}
+        self._los_index: Optional[LineOfSightIndex] = None
+        self._spatial_index: Optional[SpatialIndex] = None
+        self._action_masks: Optional[List[int]] = None
+
+        # Bumped on every terrain change; keys all derived caches
+        self.generation = 0
+        self.reach_cache = ReachabilityCache(reach_cache_size)
+
+        # Layer mode
+        if layers is not None:
+            self.backend = "array"
+            self.WIDTH = layers.width
+            self.HEIGHT = layers.height
+            self.grid = None
+            self.layers = layers
+            return
+
         # Geometry / test mode
         if width is not None or height is not None:
             if width is None or height is None:
@@ -40,16 +159,16 @@ class GameBoard:
             self.WIDTH = int(width)
             self.HEIGHT = int(height)
 
-            self.grid: List[List[GameCell]] = []
-            for y in range(self.HEIGHT):
-                row: List[GameCell] = []
-                for x in range(self.WIDTH):
-                    terrain = [False] * 8
-                    terrain[TERRAIN_INDEX["plain"]] = True
-                    terrain[TERRAIN_INDEX["building"]] = 0
-                    row.append(GameCell(x, y, tuple(terrain)))
-                self.grid.append(row)
+            terrain = [False] * 8
+            terrain[TERRAIN_INDEX["plain"]] = True
+            terrain[TERRAIN_INDEX["building"]] = 0
+            terrain = tuple(terrain)
 
+            self._init_storage(
+                (x, y, terrain)
+                for y in range(self.HEIGHT)
+                for x in range(self.WIDTH)
+            )
             self._recompute_shores()
             return
 
@@ -57,37 +176,108 @@ class GameBoard:
         if csv_path is None:
             raise ValueError("csv_path cannot be None")
 
-        self.grid: List[List[GameCell]] = []
-        self.load_from_csv(csv_path)
+        self.grid: Optional[List[List[GameCell]]] = []
+        self.load_from_csv(csv_path, fast=fast_csv)
+
+    def _init_storage(self, cells) -> None:
+        """
+        Build the backend storage from (x, y, terrain) triples that
+        cover the whole board.
+        """
+        if self.backend == "array":
+            self.grid = None
+            self.layers = BoardLayers(self.WIDTH, self.HEIGHT)
+            for x, y, terrain in cells:
+                self.layers.set_terrain(y * self.WIDTH + x, terrain)
+            return
+
+        self.layers = None
+        self.grid = [[None] * self.WIDTH for _ in range(self.HEIGHT)]
+        for x, y, terrain in cells:
+            cell = GameCell(x, y, terrain)
+            cell._observer = self
+            self.grid[y][x] = cell
+
+    def _init_storage_from_layers(self, layers: BoardLayers) -> None:
+        if self.backend == "array":
+            self.grid = None
+            self.layers = layers
+            return
+
+        # Pack the 0/1 layers into one terrain byte per cell with big-int
+        # shifts (bit k of every byte comes from layer k), then wrap them
+        size = layers.size
+        packed = 0
+        for name in LAYER_NAMES:
+            packed |= int.from_bytes(layers.layer(name), "little") << TERRAIN_INDEX[name]
+        packed = packed.to_bytes(size, "little")
+
+        width = self.WIDTH
+        self.layers = None
+        self.grid = []
+        # Cells hold no reference cycles among themselves; pausing the
+        # collector avoids repeated full scans while W*H of them are made
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for y in range(self.HEIGHT):
+                start = y * width
+                self.grid.append(list(map(
+                    GameCell._from_bits,
+                    range(width),
+                    repeat(y, width),
+                    packed[start:start + width],
+                    layers.building[start:start + width],
+                    repeat(self, width),
+                )))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
     # -------------------------------------------------
     # CSV loading
     # -------------------------------------------------
 
     @classmethod
-    def from_csv(cls, csv_path: str) -> "GameBoard":
-        return cls(csv_path)
-
-    def load_from_csv(self, csv_path: str) -> None:
-        required = {
-            "x", "y",
-            "sea", "swamp", "plain", "forest",
-            "road", "railroad",
-            "building",
-        }
+    def from_csv(
+        cls,
+        csv_path: str,
+        *,
+        backend: str = "cells",
+        fast: bool = False,
+    ) -> "GameBoard":
+        return cls(csv_path, backend=backend, fast_csv=fast)
+
+    def load_from_csv(self, csv_path: str, *, fast: bool = False) -> None:
+        """
+        Load the x,y,sea,swamp,plain,forest,road,railroad,building schema.
+
+        fast=True parses column-wise and validates in bulk; it produces
+        the same board but reports every problem at once through
+        BoardValidationError instead of stopping at the first one.
+
+        Most of the saving lands on the array backend (over 10x on a
+        512x512 board); the cells backend still pays for one GameCell
+        per cell and gains roughly 7-8x.
+        """
+        if fast:
+            self._load_from_csv_fast(csv_path)
+            return
+
+        required = set(CSV_COLUMNS)
 
         def parse_bool(v: str) -> bool:
             s = str(v).strip().lower()
-            if s in ("1", "true", "t", "yes", "y"):
+            if s in _TRUE_TOKENS:
                 return True
-            if s in ("0", "false", "f", "no", "n", ""):
+            if s in _FALSE_TOKENS:
                 return False
             raise ValueError(f"Invalid boolean value: {v!r}")
 
         def parse_int(v: str) -> int:
             return int(str(v).strip())
 
-        cells: dict[tuple[int, int], GameCell] = {}
+        cells: dict[tuple[int, int], tuple] = {}
 
         with open(csv_path, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
@@ -134,18 +324,264 @@ class GameBoard:
                 if key in cells:
                     raise ValueError(f"Duplicate cell at {key}")
 
-                cells[key] = GameCell(x, y, tuple(terrain))
+                cells[key] = tuple(terrain)
 
         if len(cells) != self.WIDTH * self.HEIGHT:
             raise ValueError("CSV does not contain full board")
 
-        self.grid = [
-            [cells[(x, y)] for x in range(self.WIDTH)]
-            for y in range(self.HEIGHT)
-        ]
+        self._init_storage((x, y, terrain) for (x, y), terrain in cells.items())
 
         self._recompute_shores()
 
+    def _load_from_csv_fast(self, csv_path: str) -> None:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            text = f.read()
+        lines = text.splitlines()
+
+        if not lines or not lines[0]:
+            raise BoardValidationError(["CSV missing header"])
+
+        # Plain comma splitting is only safe without quoting
+        quoted = '"' in text
+        header = next(csv.reader(lines[:1])) if quoted else lines[0].split(",")
+
+        missing = [name for name in CSV_COLUMNS if name not in header]
+        if missing:
+            raise BoardValidationError([f"CSV missing columns: {sorted(missing)}"])
+        positions = {name: header.index(name) for name in CSV_COLUMNS}
+        ncols = len(header)
+
+        errors: List[str] = []
+
+        # Blank lines are skipped like csv.DictReader does
+        body = lines[1:]
+        if all(body):
+            line_numbers = range(2, len(body) + 2)
+        else:
+            line_numbers = [n for n, line in enumerate(body, start=2) if line]
+            body = [line for line in body if line]
+
+        # Happy path: one split over the whole body, columns by slicing.
+        # A "\n" marker field between rows (lines never contain one) shows
+        # every row has exactly ncols fields; a matching total alone would
+        # let a short row and a long row shift the cells in between.
+        stride = ncols + 1
+        flat = None if quoted else ",\n,".join(body).split(",")
+        if (
+            flat is not None
+            and len(flat) == len(body) * stride - 1
+            and flat[ncols::stride].count("\n") == len(body) - 1
+        ):
+            columns = [flat[j::stride] for j in range(ncols)]
+            short = []
+        else:
+            rows = list(csv.reader(body)) if quoted else [line.split(",") for line in body]
+            short = [k for k, row in enumerate(rows) if len(row) < ncols]
+            errors.extend(f"line {line_numbers[k]}: missing fields" for k in short)
+            if short:
+                keep = [k for k, row in enumerate(rows) if len(row) >= ncols]
+                rows = [rows[k] for k in keep]
+                line_numbers = [line_numbers[k] for k in keep]
+            columns = [[row[j] for row in rows] for j in range(ncols)]
+
+        def column(name):
+            return columns[positions[name]]
+
+        width, height = self.WIDTH, self.HEIGHT
+        size = width * height
+
+        # Row-major, complete boards (the usual export) skip coordinate parsing
+        row_major = self._is_row_major(column("x"), column("y"))
+        if not row_major:
+            xs = self._parse_int_column(column("x"), "x", line_numbers, errors)
+            ys = self._parse_int_column(column("y"), "y", line_numbers, errors)
+
+        building = column("building")
+        joined = "".join(building)
+        if len(joined) == len(building) and joined.isdigit():
+            building = joined.encode("ascii").translate(_INT_DIGITS)
+        else:
+            building = self._parse_int_column(building, "building", line_numbers, errors)
+        flags = {
+            name: self._parse_bool_column(column(name), name, line_numbers, errors)
+            for name in LAYER_NAMES
+            if name != "shore"
+        }
+
+        # Digit bytes are always in range; parsed ids may not be
+        if isinstance(building, list):
+            errors.extend(
+                f"line {n}: building id out of range: {b}"
+                for n, b in zip(line_numbers, building)
+                if b is not None and not 0 <= b <= 255
+            )
+
+        # --- bulk geometry validation ---
+        # Runs on every row whose coordinates parsed, so one raise
+        # reports value and geometry problems together
+        if row_major:
+            index = None
+        else:
+            unparsed = None in xs or None in ys
+            in_bounds = bool(xs) and not unparsed and (
+                0 <= min(xs) and max(xs) < width and 0 <= min(ys) and max(ys) < height
+            )
+            if in_bounds:
+                index = list(map(operator.add, map(operator.mul, ys, repeat(width)), xs))
+                complete = len(index) == size and len(set(index)) == size
+            else:
+                complete = False
+
+            if not complete:
+                # Cells of rows skipped above can't be told apart from
+                # missing ones, so those are only counted without skips
+                self._report_geometry_errors(
+                    xs, ys, line_numbers, errors,
+                    count_missing=not (unparsed or short),
+                )
+
+        if errors:
+            raise BoardValidationError(errors)
+
+        # --- scatter columns into layers ---
+        if index is None:
+            layers = BoardLayers(width, height, {
+                **{name: bytearray(values) for name, values in flags.items()},
+                "building": bytearray(building),
+            })
+        else:
+            layers = BoardLayers(width, height)
+            for name, values in flags.items():
+                layer = layers.layer(name)
+                for i, v in zip(index, values):
+                    layer[i] = v
+            for i, v in zip(index, building):
+                layers.building[i] = v
+
+        # Boat rental rule
+        boat_rental = BUILDING_TYPE["boat_rental"]
+        i = layers.building.find(boat_rental)
+        while i != -1:
+            layers.sea[i] = 1
+            layers.plain[i] = 1
+            layers.swamp[i] = 0
+            layers.forest[i] = 0
+            i = layers.building.find(boat_rental, i + 1)
+
+        # Shores are derived on the layers, before any GameCell exists
+        water = layers.mask("sea") | layers.mask("swamp")
+        layers.set_mask("shore", spread4(water, width, height) & ~water)
+
+        self._init_storage_from_layers(layers)
+
+    def _is_row_major(self, xcol, ycol) -> bool:
+        """
+        True when the x/y columns list every cell once, row by row,
+        as canonical decimal strings.
+        """
+        width, height = self.WIDTH, self.HEIGHT
+        if len(xcol) != width * height:
+            return False
+        if list(xcol) != list(map(str, range(width))) * height:
+            return False
+        expected_y = chain.from_iterable(map(repeat, map(str, range(height)), repeat(width)))
+        return list(ycol) == list(expected_y)
+
+    def _report_geometry_errors(
+        self, xs, ys, line_numbers, errors: List[str], *, count_missing: bool = True
+    ) -> None:
+        """
+        Collect out-of-bounds, duplicate and (with count_missing) missing
+        cells; rows whose coordinates did not parse (None) are skipped.
+        """
+        width, height = self.WIDTH, self.HEIGHT
+        size = width * height
+        seen = bytearray(size)
+
+        for n, x, y in zip(line_numbers, xs, ys):
+            if x is None or y is None:
+                continue
+            if not (0 <= x < width and 0 <= y < height):
+                errors.append(f"line {n}: out of bounds cell: ({x},{y})")
+                continue
+            i = y * width + x
+            if seen[i]:
+                errors.append(f"line {n}: duplicate cell at ({x}, {y})")
+            seen[i] = 1
+
+        missing_cells = seen.count(0) if count_missing else 0
+        if missing_cells:
+            first = [(i % width, i // width) for i in range(size) if not seen[i]][:MAX_REPORTED_ERRORS]
+            errors.append(f"CSV does not contain full board: {missing_cells} cells missing, e.g. {first}")
+
+    @staticmethod
+    def _parse_bool_column(values, name: str, line_numbers, errors: List[str]) -> bytes:
+        """
+        Parse a column of boolean tokens into 0/1 bytes.
+
+        The common all-"0"/"1" column is converted in one translate call;
+        anything else falls back to per-token parsing.
+        """
+        joined = "".join(values)
+        if len(joined) == len(values) and not joined.strip("01"):
+            return joined.encode("ascii").translate(_BOOL_DIGITS)
+
+        parsed = bytearray(len(values))
+        for k, v in enumerate(values):
+            token = v.strip().lower()
+            if token in _TRUE_TOKENS:
+                parsed[k] = 1
+            elif token not in _FALSE_TOKENS:
+                errors.append(f"line {line_numbers[k]}: invalid boolean value {v!r} in column {name!r}")
+        return bytes(parsed)
+
+    @staticmethod
+    def _parse_int_column(values, name: str, line_numbers, errors: List[str]) -> List[Optional[int]]:
+        """
+        Parse a column of integers; tokens that don't parse are reported
+        and become None.
+        """
+        try:
+            return list(map(int, values))
+        except ValueError:
+            pass
+
+        parsed = []
+        for k, v in enumerate(values):
+            try:
+                parsed.append(int(v))
+            except ValueError:
+                errors.append(f"line {line_numbers[k]}: invalid integer {v!r} in column {name!r}")
+                parsed.append(None)
+        return parsed
+
+    # -------------------------------------------------
+    # Binary format
+    # -------------------------------------------------
+
+    @classmethod
+    def from_binary(cls, path: str, *, verify: bool = False) -> "GameBoard":
+        """
+        Load a board written by save_binary / board_binary.csv_to_binary.
+        The file is memory-mapped; no per-cell parsing happens.
+        """
+        return cls(None, layers=read_layers(path, verify=verify))
+
+    def save_binary(self, path: str) -> None:
+        write_layers(self.to_layers(), path)
+
+    def to_layers(self) -> BoardLayers:
+        """
+        The board's terrain as BoardLayers (a copy for the cells backend).
+        """
+        if self.layers is not None:
+            return self.layers
+
+        layers = BoardLayers(self.WIDTH, self.HEIGHT)
+        for i, cell in enumerate(self.iter_cells()):
+            layers.set_terrain(i, cell.terrain)
+        return layers
+
     # -------------------------------------------------
     # Geometry helpers
     # -------------------------------------------------
@@ -154,75 +590,414 @@ class GameBoard:
         return 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT
 
     def get_cell(self, x: int, y: int) -> GameCell:
+        if self.grid is None:
+            return CellView(self.layers, x, y, self)
         return self.grid[y][x]
 
+    def iter_cells(self):
+        """
+        Yield every cell in row-major order.
+        """
+        if self.grid is None:
+            for y in range(self.HEIGHT):
+                for x in range(self.WIDTH):
+                    yield CellView(self.layers, x, y, self)
+            return
+        for row in self.grid:
+            yield from row
+
+    def index_of(self, x: int, y: int) -> int:
+        return y * self.WIDTH + x
+
+    def coords_of(self, i: int) -> tuple[int, int]:
+        return i % self.WIDTH, i // self.WIDTH
+
+    def cell_at(self, i: int) -> GameCell:
+        if self.grid is None:
+            return CellView(self.layers, i % self.WIDTH, i // self.WIDTH, self)
+        return self.grid[i // self.WIDTH][i % self.WIDTH]
+
+    def adjacency(self, neighbor_count: int = 4) -> List[tuple[int, ...]]:
+        """
+        Flat adjacency table: entry i holds the in-bounds neighbour
+        indices of cell i, in NEIGHBOR_DIRECTIONS order.
+
+        Built once per board on first use and reused by every search.
+        """
+        table = self._adjacency_tables.get(neighbor_count)
+        if table is not None:
+            return table
+
+        if neighbor_count not in NEIGHBOR_DIRECTIONS:
+            raise ValueError("neighbor_count must be 4 or 8")
+
+        width, height = self.WIDTH, self.HEIGHT
+        directions = NEIGHBOR_DIRECTIONS[neighbor_count]
+        table = []
+        for y in range(height):
+            for x in range(width):
+                table.append(tuple(
+                    (y + dy) * width + (x + dx)
+                    for dx, dy in directions
+                    if 0 <= x + dx < width and 0 <= y + dy < height
+                ))
+
+        self._adjacency_tables[neighbor_count] = table
+        return table
+
+    def neighbor_indices(self, i: int, neighbor_count: int = 4) -> tuple[int, ...]:
+        return self.adjacency(neighbor_count)[i]
+
     def neighbors(self, x: int, y: int, neighbor_count: int = 4):
         """
-        Yield neighboring (nx, ny) coordinates.
+        Return neighboring (nx, ny) coordinates.
 
         neighbor_count:
           - 4 (default): orthogonal neighbors only
           - 8: orthogonal + diagonal neighbors
         """
-        if neighbor_count == 4:
-            directions = (
-                (1, 0), (-1, 0),
-                (0, 1), (0, -1),
-            )
-        elif neighbor_count == 8:
-            directions = (
-                (1, 0), (-1, 0),
-                (0, 1), (0, -1),
-                (1, 1), (1, -1),
-                (-1, 1), (-1, -1),
-            )
-        else:
-            raise ValueError("neighbor_count must be 4 or 8")
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if self.is_in_bounds(nx, ny):
-                yield nx, ny
+        width = self.WIDTH
+        return [
+            (j % width, j // width)
+            for j in self.adjacency(neighbor_count)[y * width + x]
+        ]
 
     # -------------------------------------------------
     # Shore derivation
     # -------------------------------------------------
 
     def _set_shore(self, cell: GameCell, value: bool) -> None:
-        t = list(cell.terrain)
-        t[TERRAIN_INDEX["shore"]] = value
-        cell.terrain = tuple(t)
+        cell._set_flag("shore", value)
 
     def _recompute_shores(self) -> None:
-        for y in range(self.HEIGHT):
-            for x in range(self.WIDTH):
-                cell = self.get_cell(x, y)
-                if cell.is_water():
-                    self._set_shore(cell, False)
-                else:
-                    touches_water = any(
-                        self.get_cell(nx, ny).is_water()
-                        for nx, ny in self.neighbors(x, y, neighbor_count=4)
-                    )
-                    self._set_shore(cell, touches_water)
+        """
+        Full recompute: a shore is any non-water cell orthogonally
+        adjacent to water, evaluated on shifted water bitboards.
+        """
+        water = self.mask("water")
+        shore = spread4(water, self.WIDTH, self.HEIGHT) & ~water
+
+        if self.layers is not None:
+            self.layers.set_mask("shore", shore)
+            return
+
+        flags = to_layer(shore, self.WIDTH * self.HEIGHT)
+        for cell, value in zip(self.iter_cells(), flags):
+            cell._set_flag("shore", value)
+
+    def _update_shores_around(self, x: int, y: int) -> None:
+        """
+        Incremental recompute after the water status of (x, y) changed:
+        only the cell and its 4-neighbourhood can change shore status.
+        """
+        for cx, cy in ((x, y), *self.neighbors(x, y)):
+            cell = self.get_cell(cx, cy)
+            if cell.is_water():
+                self._set_shore(cell, False)
+            else:
+                touches_water = any(
+                    self.get_cell(nx, ny).is_water()
+                    for nx, ny in self.neighbors(cx, cy)
+                )
+                self._set_shore(cell, touches_water)
 
     # -------------------------------------------------
-    # Drop logic (loop-based)
+    # Terrain editing
     # -------------------------------------------------
 
-    def drop_to_island(self, is_player: bool) -> tuple[int, int]:
-        while True:
-            x = random.randint(0, self.WIDTH - 1)
-            y = random.randint(0, self.HEIGHT - 1)
+    def set_terrain(self, x: int, y: int, **changes) -> None:
+        """
+        Change terrain layers of one cell, e.g. set_terrain(3, 4, sea=True).
 
-            cell = self.get_cell(x, y)
+        Accepts sea, swamp, plain, forest, road, railroad (bool) and
+        building (int). Shore is derived and updated for the affected
+        neighbourhood only.
+        """
+        if not self.is_in_bounds(x, y):
+            raise ValueError(f"Coordinates out of bounds: ({x}, {y})")
 
-            if cell.is_building():
-                continue
-            if is_player and cell.is_swamp():
+        for name in changes:
+            if name not in EDITABLE_LAYERS:
+                raise ValueError(f"Cannot edit terrain layer: {name!r}")
+
+        cell = self.get_cell(x, y)
+        was_water = cell.is_water()
+
+        for name, value in changes.items():
+            if name == "building":
+                cell._set_building(int(value))
+            else:
+                cell._set_flag(name, bool(value))
+
+        if cell.is_water() != was_water:
+            self._update_shores_around(x, y)
+        self._cell_changed(x, y)
+
+    # -------------------------------------------------
+    # Whole-board queries
+    # -------------------------------------------------
+
+    def _cells_mask(self, predicate) -> int:
+        return from_layer(bytearray(predicate(cell) for cell in self.iter_cells()))
+
+    def mask(self, name: str) -> int:
+        """
+        Bitboard (bit y * WIDTH + x) of the cells matching `name`.
+
+        name: a terrain layer ("sea", ..., "shore"), "building",
+        or one of the combined rules "water" / "buildable".
+        """
+        layers = self.layers
+        if name == "water":
+            return self.mask("sea") | self.mask("swamp")
+        if name == "buildable":
+            blocked = (
+                self.mask("building") | self.mask("water")
+                | self.mask("road") | self.mask("railroad")
+            )
+            return full_mask(self.WIDTH * self.HEIGHT) & ~blocked
+
+        if name == "building":
+            if layers is not None:
+                return layers.mask("building")
+            return self._cells_mask(GameCell.is_building)
+
+        if name not in LAYER_NAMES:
+            raise ValueError(f"Unknown mask: {name!r}")
+        if layers is not None:
+            return layers.mask(name)
+        return self._cells_mask(getattr(GameCell, f"is_{name}"))
+
+    def cells_in_mask(self, mask: int) -> List[tuple[int, int]]:
+        width = self.WIDTH
+        return [(i % width, i // width) for i in iter_indices(mask)]
+
+    def buildable_cells(self) -> List[tuple[int, int]]:
+        return self.cells_in_mask(self.mask("buildable"))
+
+    def shore_cells(self) -> List[tuple[int, int]]:
+        return self.cells_in_mask(self.mask("shore"))
+
+    # -------------------------------------------------
+    # Transport networks
+    # -------------------------------------------------
+
+    def network_mask(self, network: str) -> int:
+        """
+        Bitboard of the cells of a network (see NETWORK_RULES).
+        """
+        if network == "walkable":
+            full = full_mask(self.WIDTH * self.HEIGHT)
+            return full & (~self.mask("water") | self.mask("road"))
+        if network not in NETWORK_RULES:
+            raise ValueError(f"Unknown network: {network!r}")
+        return self.mask(network)
+
+    def component_labels(self, network: str) -> array:
+        """
+        Connected-component label per cell index (4-neighbourhood),
+        -1 for cells outside the network. Labelled on first use and
+        dropped by _cell_changed only when an edit changes membership.
+        """
+        labels = self._component_labels.get(network)
+        if labels is not None:
+            return labels
+
+        on_network = to_layer(self.network_mask(network), self.WIDTH * self.HEIGHT)
+        adjacency = self.adjacency()
+        labels = array("i", [-1]) * len(on_network)
+
+        label = 0
+        for start in range(len(on_network)):
+            if not on_network[start] or labels[start] != -1:
                 continue
+            labels[start] = label
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                for j in adjacency[i]:
+                    if on_network[j] and labels[j] == -1:
+                        labels[j] = label
+                        stack.append(j)
+            label += 1
+
+        self._component_labels[network] = labels
+        return labels
+
+    def component_id(self, network: str, x: int, y: int) -> int:
+        return self.component_labels(network)[y * self.WIDTH + x]
+
+    def same_component(self, network: str, a: tuple[int, int], b: tuple[int, int]) -> bool:
+        """
+        True when both cells lie on `network` and are connected through it.
+        """
+        labels = self.component_labels(network)
+        la = labels[a[1] * self.WIDTH + a[0]]
+        return la != -1 and la == labels[b[1] * self.WIDTH + b[0]]
+
+    def junction_graph(self, network: str) -> JunctionGraph:
+        """
+        `network` contracted to its junctions (see JunctionGraph); built
+        on first use and dropped by _cell_changed on membership changes.
+        """
+        graph = self._junction_graphs.get(network)
+        if graph is None:
+            graph = JunctionGraph(self, network)
+            self._junction_graphs[network] = graph
+        return graph
+
+    def los_index(self) -> LineOfSightIndex:
+        """
+        Building / forest prefix counts for O(1) line-of-sight checks;
+        built on first use, then updated in place by _cell_changed.
+        """
+        if self._los_index is None:
+            self._los_index = LineOfSightIndex(self)
+        return self._los_index
+
+    # -------------------------------------------------
+    # Entities on the board
+    # -------------------------------------------------
+
+    def spatial_index(self) -> SpatialIndex:
+        """
+        Positions of the tracked players and of the helicopter parts
+        placed on this board; kept current by HelicopterPart placement
+        and by tracked players' coordinate changes.
+        """
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.WIDTH, self.HEIGHT)
+        return self._spatial_index
+
+    def track_player(self, player) -> None:
+        index = self.spatial_index()
+        index.add(player, player.x, player.y)
+        player._spatial_index = index
+
+    def untrack_player(self, player) -> None:
+        self.spatial_index().remove(player)
+        player._spatial_index = None
+
+    def has_part_at(self, x: int, y: int) -> bool:
+        index = self._spatial_index
+        return index is not None and index.any_at(x, y, HelicopterPart)
+
+    def parts_on(self, x: int, y: int) -> List[HelicopterPart]:
+        return self.spatial_index().at(x, y, HelicopterPart)
+
+    def players_on(self, x: int, y: int) -> list:
+        return [e for e in self.spatial_index().at(x, y) if not isinstance(e, HelicopterPart)]
+
+    def players_within(self, x: int, y: int, radius: int) -> list:
+        return [
+            e for e in self.spatial_index().within(x, y, radius)
+            if not isinstance(e, HelicopterPart)
+        ]
+
+    def action_masks(self) -> List[int]:
+        """
+        Per-cell mask of the terrain-dependent actions (see
+        player_actions.cell_action_mask), indexed y * WIDTH + x. Built
+        on first use and updated around each edited cell by _cell_changed.
+        """
+        if self._action_masks is None:
+            self._action_masks = [
+                cell_action_mask(self, i % self.WIDTH, i // self.WIDTH)
+                for i in range(self.WIDTH * self.HEIGHT)
+            ]
+        return self._action_masks
+
+    # -------------------------------------------------
+    # Drop logic (pool-based)
+    # -------------------------------------------------
+
+    def _is_spawn_eligible(self, cell: GameCell, is_player: bool) -> bool:
+        if cell.is_building():
+            return False
+        if is_player and cell.is_swamp():
+            return False
+        return True
+
+    def spawn_pool(self, is_player: bool) -> SpawnPool:
+        """
+        Indices of the cells a player (no building, no swamp) or a part
+        (no building) may be dropped on. Built on first use, then kept
+        current by _cell_changed.
+        """
+        pool = self._spawn_pools.get(is_player)
+        if pool is None:
+            eligible = ~self.mask("building")
+            if is_player:
+                eligible &= ~self.mask("swamp")
+            eligible &= full_mask(self.WIDTH * self.HEIGHT)
+            pool = SpawnPool(iter_indices(eligible))
+            self._spawn_pools[is_player] = pool
+        return pool
+
+    def reset_spawn_pools(self) -> None:
+        """
+        Drop the spawn pools; the next drop rebuilds them in board
+        order, so seeded drops repeat after cells were edited back.
+        """
+        self._spawn_pools.clear()
+
+    def drop_to_island(self, is_player: bool, *, rng=None) -> tuple[int, int]:
+        pool = self.spawn_pool(is_player)
+        if not pool:
+            raise ValueError("No eligible cell to drop on")
+        return self.coords_of(pool.choice(rng))
+
+    def drop_many(
+        self, count: int, is_player: bool, *, unique: bool = False, rng=None
+    ) -> List[tuple[int, int]]:
+        """
+        Drop `count` entities at once; unique=True never reuses a cell.
+        rng: a random.Random to draw from (module random when None).
+        """
+        pool = self.spawn_pool(is_player)
+        if count > 0 and not pool:
+            raise ValueError("No eligible cell to drop on")
+        if unique and count > len(pool):
+            raise ValueError(f"Only {len(pool)} eligible cells for {count} unique drops")
+        indices = pool.sample(count, rng) if unique else pool.choices(count, rng)
+        return [self.coords_of(i) for i in indices]
+
+    # -------------------------------------------------
+    # Change tracking
+    # -------------------------------------------------
+
+    def _cell_changed(self, x: int, y: int) -> None:
+        """
+        Called after the terrain of (x, y) changed (GameCell.build(),
+        set_terrain); refreshes state derived from that cell.
+        """
+        self.generation += 1
+
+        i = y * self.WIDTH + x
+        cell = self.get_cell(x, y)
+        for is_player, pool in self._spawn_pools.items():
+            if self._is_spawn_eligible(cell, is_player):
+                pool.add(i)
+            else:
+                pool.discard(i)
+
+        for network, labels in list(self._component_labels.items()):
+            if (labels[i] != -1) != NETWORK_RULES[network](cell):
+                del self._component_labels[network]
+
+        for network, graph in list(self._junction_graphs.items()):
+            if graph.has_cell(i) != NETWORK_RULES[network](cell):
+                del self._junction_graphs[network]
+
+        if self._los_index is not None:
+            self._los_index.update(x, y, cell)
 
-            return x, y
+        # The cell's own mask and, through shores and adjacent land,
+        # its neighbours' masks may change
+        masks = self._action_masks
+        if masks is not None:
+            for cx, cy in ((x, y), *self.neighbors(x, y)):
+                masks[cy * self.WIDTH + cx] = cell_action_mask(self, cx, cy)
 
     # -------------------------------------------------
     # ASCII visualization
@@ -279,9 +1054,8 @@ class GameBoard:
         y2: Optional[int] = None,
     ) -> None:
         if x1 is None:
-            for row in self.grid:
-                for cell in row:
-                    print(cell)
+            for cell in self.iter_cells():
+                print(cell)
             return
 
         if not self.is_in_bounds(x1, y1):
@@ -303,7 +1077,7 @@ class GameBoard:
     # -------------------------------------------------
 
     def __str__(self) -> str:
-        return "\n".join(str(cell) for row in self.grid for cell in row)
+        return "\n".join(str(cell) for cell in self.iter_cells())
 
     def __repr__(self) -> str:
         return f"<GameBoard {self.WIDTH}x{self.HEIGHT}>"
@@ -1,15 +1,72 @@
 import json
+from functools import lru_cache
 from typing import Tuple
 
 from constants import TERRAIN_INDEX, BUILDING_TYPE
 
 
+# Terrain bits share the tuple layout of TERRAIN_INDEX (building excluded).
+_SEA = 1 << TERRAIN_INDEX["sea"]
+_SWAMP = 1 << TERRAIN_INDEX["swamp"]
+_PLAIN = 1 << TERRAIN_INDEX["plain"]
+_FOREST = 1 << TERRAIN_INDEX["forest"]
+_ROAD = 1 << TERRAIN_INDEX["road"]
+_RAILROAD = 1 << TERRAIN_INDEX["railroad"]
+_SHORE = 1 << TERRAIN_INDEX["shore"]
+
+_TERRAIN_BITS = (_SEA, _SWAMP, _PLAIN, _FOREST, _ROAD, _RAILROAD, _SHORE)
+_TERRAIN_MASK = _SEA | _SWAMP | _PLAIN | _FOREST | _ROAD | _RAILROAD | _SHORE
+
+# Derived predicate flags, kept above the terrain bits
+_WATER = 1 << 8
+_BUILDING = 1 << 9
+_BUILDABLE = 1 << 10
+_SHOT_PASSING = 1 << 11
+
+
+def terrain_bits(terrain) -> int:
+    """
+    Pack the first seven entries of a terrain tuple into a bitfield.
+    """
+    bits = 0
+    for bit, value in zip(_TERRAIN_BITS, terrain):
+        if value:
+            bits |= bit
+    return bits
+
+
+@lru_cache(maxsize=4096)
+def derive_flags(bits: int, building: int) -> int:
+    """
+    Return `bits` with the derived predicate flags recomputed.
+    """
+    bits &= _TERRAIN_MASK
+    if bits & (_SEA | _SWAMP):
+        bits |= _WATER
+    if building != BUILDING_TYPE["none"]:
+        bits |= _BUILDING
+    if not bits & (_BUILDING | _WATER | _ROAD | _RAILROAD):
+        bits |= _BUILDABLE
+    if not bits & (_BUILDING | _FOREST):
+        bits |= _SHOT_PASSING
+    return bits
+
+
 class GameCell:
     """
     terrain tuple layout:
     (sea, swamp, plain, forest, road, railroad, shore, building)
+
+    Internally the seven boolean layers live in one integer bitfield
+    (`_bits`, together with precomputed predicate flags) and the building
+    type in `_building`. `.terrain` rebuilds the tuple on access.
+
+    A board that owns the cell sets `_observer` to itself so it hears
+    about terrain changes made through build().
     """
 
+    __slots__ = ("x", "y", "_bits", "_building", "_observer")
+
     def __init__(
         self,
         x: int,
@@ -19,57 +76,86 @@ class GameCell:
         self.x = x
         self.y = y
         self.terrain = terrain
+        self._observer = None
+
+    @classmethod
+    def _from_bits(cls, x: int, y: int, bits: int, building: int, observer=None) -> "GameCell":
+        """
+        Build a cell from an already packed terrain bitfield.
+        """
+        cell = cls.__new__(cls)
+        cell.x = x
+        cell.y = y
+        cell._building = building
+        cell._bits = derive_flags(bits, building)
+        cell._observer = observer
+        return cell
+
+    # --- compatibility view ---
+
+    @property
+    def terrain(self) -> Tuple[bool, bool, bool, bool, bool, bool, bool, int]:
+        bits = self._bits
+        return tuple(bool(bits & bit) for bit in _TERRAIN_BITS) + (self._building,)
+
+    @terrain.setter
+    def terrain(self, terrain: Tuple[bool, bool, bool, bool, bool, bool, bool, int]) -> None:
+        building = terrain[TERRAIN_INDEX["building"]]
+        self._building = building
+        self._bits = derive_flags(terrain_bits(terrain), building)
 
     # --- terrain checks ---
 
     def is_sea(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["sea"]]
+        return self._bits & _SEA != 0
 
     def is_swamp(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["swamp"]]
+        return self._bits & _SWAMP != 0
 
     def is_plain(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["plain"]]
+        return self._bits & _PLAIN != 0
 
     def is_forest(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["forest"]]
+        return self._bits & _FOREST != 0
 
     def is_road(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["road"]]
+        return self._bits & _ROAD != 0
 
     def is_railroad(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["railroad"]]
+        return self._bits & _RAILROAD != 0
 
     def is_shore(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["shore"]]
+        return self._bits & _SHORE != 0
 
     # --- building checks ---
 
     def is_building(self) -> bool:
-        return self.terrain[TERRAIN_INDEX["building"]] != BUILDING_TYPE["none"]
+        return self._bits & _BUILDING != 0
 
     def get_building_type(self) -> int:
-        return self.terrain[TERRAIN_INDEX["building"]]
+        return self._building
 
     # --- combined rules ---
 
     def is_water(self) -> bool:
-        return self.is_sea() or self.is_swamp()
+        return self._bits & _WATER != 0
 
     def is_shot_passing(self) -> bool:
-        return not self.is_building() and not self.is_forest()
+        return self._bits & _SHOT_PASSING != 0
 
     def is_buildable(self) -> bool:
-        if self.is_building() or self.is_water():
-            return False
-        if self.is_road() or self.is_railroad():
-            return False
-        return True
+        return self._bits & _BUILDABLE != 0
 
     # --- internal helpers ---
 
     def _set_building(self, value: int) -> None:
-        self.terrain = self.terrain[:TERRAIN_INDEX["building"]] + (value,)
+        self._building = value
+        self._bits = derive_flags(self._bits, value)
+
+    def _set_flag(self, name: str, value: bool) -> None:
+        bit = 1 << TERRAIN_INDEX[name]
+        bits = self._bits | bit if value else self._bits & ~bit
+        self._bits = derive_flags(bits, self._building)
 
     # --- actions ---
 
@@ -77,6 +163,8 @@ class GameCell:
         if not self.is_buildable():
             return False
         self._set_building(BUILDING_TYPE["user_home"])
+        if self._observer is not None:
+            self._observer._cell_changed(self.x, self.y)
         return True
 
     # --- travel rules ---
@@ -133,13 +221,13 @@ class GameCell:
             "y": self.y,
 
             # terrain flags
-            "sea": self.terrain[TERRAIN_INDEX["sea"]],
-            "swamp": self.terrain[TERRAIN_INDEX["swamp"]],
-            "plain": self.terrain[TERRAIN_INDEX["plain"]],
-            "forest": self.terrain[TERRAIN_INDEX["forest"]],
-            "road": self.terrain[TERRAIN_INDEX["road"]],
-            "railroad": self.terrain[TERRAIN_INDEX["railroad"]],
-            "shore": self.terrain[TERRAIN_INDEX["shore"]],
+            "sea": self.is_sea(),
+            "swamp": self.is_swamp(),
+            "plain": self.is_plain(),
+            "forest": self.is_forest(),
+            "road": self.is_road(),
+            "railroad": self.is_railroad(),
+            "shore": self.is_shore(),
 
             # building
             "building_id": self.get_building_type(),
@@ -0,0 +1,417 @@
+import random
+import time
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from constants import BALANCE, GUN_KIT, HELICOPTER_COLORS, MAX_PARTS_OF_COLOR
+from game_board import GameBoard
+from helicopter_part import HelicopterPart
+from player import Player
+from player_actions import ACTION_NAMES, PlayerActionProvider
+from player_table import PlayerTable
+
+# possible_actions string -> ActionFlag
+ACTION_FLAGS = {name: flag for flag, name in ACTION_NAMES.items()}
+
+# Intents of a turn run phase by phase: spawns, then purchases and
+# transport changes, moves, actions on the reached cell, attacks
+PHASES = ("spawn", "prepare", "move", "interact", "attack")
+
+ACTION_PHASES = {
+    "spawn": "spawn",
+    "heal": "prepare",
+    "work": "prepare",
+    "rent car": "prepare",
+    "buy train ticket": "prepare",
+    "rent boat": "prepare",
+    "buy guns": "prepare",
+    "disembark": "prepare",
+    "exit car": "prepare",
+    "exit train": "prepare",
+    "walk": "move",
+    "swim": "move",
+    "drive": "move",
+    "ride train": "move",
+    "sail on boat": "move",
+    "jump into sea": "move",
+    "climb ashore": "move",
+    "pickup part": "interact",
+    "pickup helicopter part": "interact",
+    "build home": "interact",
+    "inventory": "interact",
+    "win game": "interact",
+    "print home inventory": "interact",
+    "print current inventory": "interact",
+    "print current cell": "interact",
+    "print part location": "interact",
+    "print other player locations": "interact",
+    "attack hand-to-hand": "attack",
+    "gun attack": "attack",
+    "rocket attack": "attack",
+}
+PHASE_ORDER = {name: i for i, name in enumerate(PHASES)}
+
+# Move action -> (Player check, BALANCE["move"] budget)
+MOVES = {
+    "walk": ("can_get_by_walk", "walk_ap"),
+    "swim": ("can_get_by_swim", "swim_ap"),
+    "drive": ("can_get_by_car", "car_ap"),
+    "ride train": ("can_get_by_train", "train_ap"),
+    "sail on boat": ("can_get_by_boat", "boat_ap"),
+    "jump into sea": ("can_get_by_changing_stance", "stance_ap"),
+    "climb ashore": ("can_get_by_changing_stance", "stance_ap"),
+}
+
+ATTACKS = {
+    "attack hand-to-hand": "can_attack_hand_to_hand",
+    "gun attack": "can_attack_with_gun",
+    "rocket attack": "can_attack_with_rocket",
+}
+
+# Phases a player may use only once per turn
+ONCE_PER_TURN = ("move", "attack")
+
+
+class Intent(NamedTuple):
+    """
+    One action a player wants to take this turn. `target` is the cell
+    of moves and attacks; `args` are the transfer_home_item keywords of
+    an "inventory" action.
+    """
+    player: int
+    action: str
+    target: Optional[Tuple[int, int]] = None
+    args: Optional[dict] = None
+
+
+class Outcome(NamedTuple):
+    intent: Intent
+    applied: bool
+    # Why the intent was rejected; "" when applied
+    reason: str = ""
+
+
+class TurnReport(NamedTuple):
+    turn: int
+    outcomes: List[Outcome]
+    eliminated: List[int]
+    winner: Optional[int]
+    seconds: float
+
+
+class GameEngine:
+    """
+    Headless game loop: owns a board, the players (rows of one
+    PlayerTable, ids are row numbers) and the helicopter part pool, and
+    applies batches of intents one turn at a time.
+
+    Turn order is deterministic: intents are applied by phase (see
+    PHASES), then by initiative, which rotates with the turn number,
+    then in submission order. Every intent is checked against the
+    player's possible actions and, for moves and attacks, against the
+    Player can_get_by_* / can_attack_* methods before it is applied.
+    Random drops come from the engine's own seeded generator.
+    """
+
+    def __init__(
+        self,
+        board: Optional[GameBoard] = None,
+        *,
+        seed: Optional[int] = None,
+        balance: Optional[dict] = None,
+        place_parts: bool = True,
+    ):
+        self.board = board if board is not None else GameBoard()
+        self.balance = balance if balance is not None else BALANCE
+        self.rng = random.Random(seed)
+        self.table = PlayerTable()
+        self.players: List[Player] = []
+        self.eliminated: List[bool] = []
+        self.parts: List[HelicopterPart] = [
+            HelicopterPart(color)
+            for color in sorted(HELICOPTER_COLORS)
+            for _ in range(MAX_PARTS_OF_COLOR)
+        ]
+        self.turn = 0
+        self.winner: Optional[int] = None
+
+        # Per-turn metrics
+        self.turn_seconds = array("d")
+        self.player_turns = 0
+
+        if place_parts:
+            self.place_parts()
+
+    # -------------------------------------------------
+    # Setup
+    # -------------------------------------------------
+
+    def add_player(self, **fields) -> int:
+        """
+        Add a player (Player keyword fields) and return its id. Players
+        start off the board until they spawn, unless x/y are given.
+        """
+        player = Player(table=self.table, **fields)
+        self.board.track_player(player)
+        self.players.append(player)
+        self.eliminated.append(False)
+        return player.row
+
+    def place_parts(self) -> None:
+        """
+        Drop every part not on the board or carried on distinct cells.
+        """
+        loose = [p for p in self.parts if not p.is_played()]
+        cells = self.board.drop_many(len(loose), False, unique=True, rng=self.rng)
+        for part, (x, y) in zip(loose, cells):
+            part.place_on_board(self.board, x, y)
+
+    def close(self) -> None:
+        """
+        Take the players and parts off the board's spatial index, so
+        the board can host another match.
+        """
+        for player in self.players:
+            self.board.untrack_player(player)
+        for part in self.parts:
+            part.remove_from_board()
+
+    # -------------------------------------------------
+    # State
+    # -------------------------------------------------
+
+    def alive(self) -> List[int]:
+        return [pid for pid, out in enumerate(self.eliminated) if not out]
+
+    def is_over(self) -> bool:
+        return self.winner is not None or (len(self.players) > 1 and len(self.alive()) <= 1)
+
+    def part_at(self, x: int, y: int) -> Optional[HelicopterPart]:
+        parts = self.board.parts_on(x, y)
+        return parts[0] if parts else None
+
+    def possible_actions(self, pid: int) -> List[str]:
+        player = self.players[pid]
+        part = self.part_at(player.x, player.y) if player.is_spawned(self.board) else None
+        return PlayerActionProvider.possible_actions(player, self.board, part)
+
+    # -------------------------------------------------
+    # Turns
+    # -------------------------------------------------
+
+    def _order(self, intents: List[Intent]) -> List[Intent]:
+        count = max(len(self.players), 1)
+        turn = self.turn
+
+        def key(item):
+            seq, intent = item
+            phase = PHASE_ORDER.get(ACTION_PHASES.get(intent.action), len(PHASES))
+            return phase, (intent.player - turn) % count, seq
+
+        return [intent for _, intent in sorted(enumerate(intents), key=key)]
+
+    def step(self, intents: Iterable[Intent]) -> TurnReport:
+        """
+        Apply one turn of intents and return what happened.
+        """
+        start = time.perf_counter()
+        outcomes = []
+        eliminated = []
+        used = set()
+
+        for intent in self._order(list(intents)):
+            reason = self._check(intent, used)
+            if not reason:
+                reason = self._apply(intent, eliminated)
+            if not reason:
+                phase = ACTION_PHASES[intent.action]
+                if phase in ONCE_PER_TURN:
+                    used.add((intent.player, phase))
+            outcomes.append(Outcome(intent, not reason, reason))
+
+        if self.winner is None and len(self.players) > 1:
+            alive = self.alive()
+            if len(alive) == 1:
+                self.winner = alive[0]
+
+        seconds = time.perf_counter() - start
+        self.turn_seconds.append(seconds)
+        self.player_turns += len({intent.player for intent, _, _ in outcomes})
+        report = TurnReport(self.turn, outcomes, eliminated, self.winner, seconds)
+        self.turn += 1
+        return report
+
+    def _check(self, intent: Intent, used: set) -> str:
+        """
+        Reason `intent` cannot be applied now, "" when it can.
+        """
+        if self.winner is not None:
+            return "game over"
+        if not 0 <= intent.player < len(self.players):
+            return "unknown player"
+        if self.eliminated[intent.player]:
+            return "eliminated"
+        flag = ACTION_FLAGS.get(intent.action)
+        if flag is None:
+            return "unknown action"
+        if (intent.player, ACTION_PHASES[intent.action]) in used:
+            return "already used this turn"
+
+        player = self.players[intent.player]
+        part = self.part_at(player.x, player.y) if player.is_spawned(self.board) else None
+        if not PlayerActionProvider.action_flags(player, self.board, part) & flag:
+            return "not possible here"
+
+        if intent.action in MOVES or intent.action in ATTACKS:
+            if intent.target is None:
+                return "missing target"
+            tx, ty = intent.target
+            if intent.action in MOVES:
+                check, budget = MOVES[intent.action]
+                if not getattr(player, check)(self.board, tx, ty, self.balance["move"][budget]):
+                    return "unreachable"
+            elif not getattr(player, ATTACKS[intent.action])(self.board, tx, ty):
+                return "out of reach"
+        return ""
+
+    # -------------------------------------------------
+    # Effects
+    # -------------------------------------------------
+
+    def _apply(self, intent: Intent, eliminated: List[int]) -> str:
+        """
+        Apply a checked intent; returns a rejection reason for the
+        effects that can still fail (money, free cells), else "".
+        """
+        player = self.players[intent.player]
+        board = self.board
+        action = intent.action
+        economy = self.balance["economy"]
+
+        if action == "spawn":
+            x, y = board.drop_to_island(True, rng=self.rng)
+            sea = board.get_cell(x, y).is_sea()
+            player.on_land, player.on_water = not sea, sea
+            player.x, player.y = x, y
+
+        elif action in MOVES:
+            player.x, player.y = intent.target
+            if action == "jump into sea":
+                player.on_land, player.on_water = False, True
+            elif action == "climb ashore":
+                player.on_land, player.on_water = True, False
+
+        elif action in ATTACKS:
+            victims = [
+                p for p in board.players_on(*intent.target)
+                if p is not player and not self.eliminated[p.row]
+            ]
+            if not victims:
+                return "no target"
+            for victim in victims:
+                if self._hit(victim):
+                    eliminated.append(victim.row)
+
+        elif action == "heal":
+            if player.change_money(-economy["heal_price"]) < 0:
+                return "not enough money"
+            player.apply_damage(0)
+        elif action == "work":
+            player.change_money(economy["work_income"])
+        elif action == "buy guns":
+            if player.change_money(-economy["guns_price"]) < 0:
+                return "not enough money"
+            player.weapons.extend(GUN_KIT)
+        elif action == "rent car":
+            if player.change_money(-economy["car_price"]) < 0:
+                return "not enough money"
+            player.activate_transport("car")
+        elif action == "buy train ticket":
+            if player.change_money(-economy["train_ticket_price"]) < 0:
+                return "not enough money"
+            player.activate_transport("train")
+        elif action == "rent boat":
+            return self._rent_boat(player, economy["boat_price"])
+        elif action in ("exit car", "exit train"):
+            player.activate_transport("none")
+        elif action == "disembark":
+            # Leaves the boat in the water; "climb ashore" follows
+            player.activate_transport("none")
+
+        elif action in ("pickup part", "pickup helicopter part"):
+            part = self.part_at(player.x, player.y)
+            if part is None or not player.pickup_helicopter_part(part):
+                return "no part here"
+        elif action == "build home":
+            if not player.build_home(board):
+                return "cannot build here"
+        elif action == "inventory":
+            if not intent.args or not player.transfer_home_item(**intent.args):
+                return "transfer failed"
+        elif action == "win game":
+            self.winner = intent.player
+        # print * actions report state only; nothing to apply headless
+        return ""
+
+    def _rent_boat(self, player: Player, price: int) -> str:
+        board = self.board
+        water = [(nx, ny) for nx, ny in board.neighbors(player.x, player.y)
+                 if board.get_cell(nx, ny).is_water()]
+        if not water:
+            return "no water nearby"
+        if player.change_money(-price) < 0:
+            return "not enough money"
+        player.activate_transport("boat")
+        player.on_land, player.on_water = False, True
+        player.x, player.y = water[0]
+        return ""
+
+    def _hit(self, victim: Player) -> bool:
+        """
+        Wound `victim`; a hit on a wounded player eliminates them.
+        Returns True on elimination.
+        """
+        if victim.wound == 0:
+            victim.apply_damage(1)
+            return False
+
+        self.eliminated[victim.row] = True
+        self.board.untrack_player(victim)
+        # Carried parts fall on the victim's cell
+        for color in list(victim.parts):
+            part = next(
+                (p for p in self.parts
+                 if p.color == color and p.is_played() and p.x == -2),
+                None,
+            )
+            if part is not None:
+                part.place_on_board(self.board, victim.x, victim.y)
+        victim.parts.clear()
+        return True
+
+    # -------------------------------------------------
+    # Metrics
+    # -------------------------------------------------
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Turn latency (ms) percentiles and player-turn throughput.
+        """
+        times = sorted(self.turn_seconds)
+        total = sum(times)
+        if not times:
+            return {"turns": 0, "player_turns": 0, "mean_ms": None, "p50_ms": None,
+                    "p95_ms": None, "max_ms": None, "player_turns_per_second": None}
+
+        def pct(q: float) -> float:
+            return times[min(len(times) - 1, int(q * len(times)))] * 1000
+
+        return {
+            "turns": len(times),
+            "player_turns": self.player_turns,
+            "mean_ms": total / len(times) * 1000,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "max_ms": times[-1] * 1000,
+            "player_turns_per_second": self.player_turns / total if total else None,
+        }
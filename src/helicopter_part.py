@@ -11,6 +11,8 @@ class HelicopterPart:
         self.x: int = -2
         self.y: int = -2
         self.played: bool = False
+        # Board whose spatial index holds this part, if any
+        self._board = None
 
     # -------------------------------------------------
     # State checks
@@ -40,15 +42,26 @@ class HelicopterPart:
         if not board.is_in_bounds(x, y):
             raise ValueError(f"Coordinates out of bounds: ({x}, {y})")
 
+        if self._board is not None and self._board is not board:
+            self._board.spatial_index().remove(self)
+
         self.x = x
         self.y = y
         self.played = True
 
+        if hasattr(board, "spatial_index"):
+            board.spatial_index().move(self, x, y)
+            self._board = board
+
     def remove_from_board(self) -> str:
         """
         Remove the part from the board and return its color.
         Note: does NOT modify the 'played' flag.
         """
+        if self._board is not None:
+            self._board.spatial_index().remove(self)
+            self._board = None
+
         self.x = -2
         self.y = -2
         return self.color
@@ -0,0 +1,130 @@
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Union
+
+
+class Inventory:
+    """
+    Ordered multiset of item names with list-like behaviour.
+
+    Items keep their insertion order (iteration, pop(), comparisons to
+    lists) while membership, add, remove(item) and pop() are O(1):
+    every entry gets a sequence number, and each item name keeps its
+    own sequence numbers: a plain int while it is held once (the usual
+    case), a queue once it is held more. remove() drops the first
+    occurrence and pop() the last, as list.remove / list.pop do.
+
+    on_change(inventory) is called after every mutation.
+    """
+
+    __slots__ = ("_entries", "_seqs", "_next", "on_change")
+
+    def __init__(self, items: Iterable[str] = (), on_change: Optional[Callable] = None):
+        self._entries: Dict[int, str] = {}
+        self._seqs: Dict[str, Union[int, Deque[int]]] = {}
+        self._next = 0
+        self.on_change = None
+        self.extend(items)
+        self.on_change = on_change
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change(self)
+
+    # -------------------------------------------------
+    # Mutation
+    # -------------------------------------------------
+
+    def append(self, item: str) -> None:
+        seq = self._next
+        self._next += 1
+        self._entries[seq] = item
+        seqs = self._seqs.get(item)
+        if seqs is None:
+            self._seqs[item] = seq
+        elif type(seqs) is int:
+            self._seqs[item] = deque((seqs, seq))
+        else:
+            seqs.append(seq)
+        self._changed()
+
+    def extend(self, items: Iterable[str]) -> None:
+        on_change, self.on_change = self.on_change, None
+        try:
+            for item in items:
+                self.append(item)
+        finally:
+            self.on_change = on_change
+        self._changed()
+
+    def remove(self, item: str) -> None:
+        seqs = self._seqs.get(item)
+        if seqs is None:
+            raise ValueError(f"{item!r} not in inventory")
+        if type(seqs) is int:
+            del self._entries[seqs]
+            del self._seqs[item]
+        else:
+            del self._entries[seqs.popleft()]
+            self._single(item, seqs)
+        self._changed()
+
+    def pop(self) -> str:
+        if not self._entries:
+            raise IndexError("pop from empty inventory")
+        _, item = self._entries.popitem()
+        seqs = self._seqs[item]
+        if type(seqs) is int:
+            del self._seqs[item]
+        else:
+            seqs.pop()
+            self._single(item, seqs)
+        self._changed()
+        return item
+
+    def _single(self, item: str, seqs: Deque[int]) -> None:
+        # Back to a plain int once only one copy is left
+        if len(seqs) == 1:
+            self._seqs[item] = seqs[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._seqs.clear()
+        self._changed()
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+
+    def __contains__(self, item) -> bool:
+        return item in self._seqs
+
+    def count(self, item: str) -> int:
+        seqs = self._seqs.get(item)
+        if seqs is None:
+            return 0
+        return 1 if type(seqs) is int else len(seqs)
+
+    def distinct(self) -> int:
+        """
+        Number of different item names.
+        """
+        return len(self._seqs)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries.values())
+
+    def __getitem__(self, index):
+        return list(self._entries.values())[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Inventory, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
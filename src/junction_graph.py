@@ -0,0 +1,171 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from bitboard import iter_indices, to_layer
+
+
+class JunctionGraph:
+    """
+    A road or railroad network contracted to its junctions.
+
+    Junctions are network cells with a network degree other than 2
+    (crossings, branches, dead ends); one cell per pure loop is
+    promoted as well. Every other network cell lies inside a corridor
+    between two junctions and is addressed by its offset from the
+    corridor's first end. Shortest distances between all junctions are
+    precomputed, so a cell-to-cell distance is a handful of lookups.
+    """
+
+    def __init__(self, board, network: str):
+        self.network = network
+        self.width = board.WIDTH
+        self._on = to_layer(board.network_mask(network), board.WIDTH * board.HEIGHT)
+        # corridor id -> (first end, last end, interior cells in order)
+        self.corridors: List[Tuple[int, int, List[int]]] = []
+        # interior cell -> (corridor id, offset from the first end)
+        self._where: Dict[int, Tuple[int, int]] = {}
+
+        adjacency = board.adjacency()
+        on = self._on
+        cells = list(iter_indices(board.network_mask(network)))
+        self.junctions = [
+            i for i in cells
+            if sum(on[j] for j in adjacency[i]) != 2
+        ]
+        self._junction_set = set(self.junctions)
+        for junction in list(self.junctions):
+            self._trace_from(junction, adjacency)
+
+        for i in cells:
+            if i not in self._where and i not in self._junction_set:
+                self.junctions.append(i)
+                self._junction_set.add(i)
+                self._trace_from(i, adjacency)
+
+        edges: Dict[int, Dict[int, int]] = {j: {} for j in self.junctions}
+        for a, b, interior in self.corridors:
+            if a == b:
+                continue
+            length = len(interior) + 1
+            if length < edges[a].get(b, length + 1):
+                edges[a][b] = edges[b][a] = length
+
+        self.distances: Dict[int, Dict[int, int]] = {
+            j: self._dijkstra(j, edges) for j in self.junctions
+        }
+
+    def _trace_from(self, junction: int, adjacency) -> None:
+        on = self._on
+        for first in adjacency[junction]:
+            if not on[first] or first in self._where:
+                continue
+            if first in self._junction_set:
+                if junction < first:
+                    self.corridors.append((junction, first, []))
+                continue
+
+            interior = []
+            prev, cur = junction, first
+            while cur not in self._junction_set:
+                interior.append(cur)
+                prev, cur = cur, next(n for n in adjacency[cur] if on[n] and n != prev)
+
+            corridor = len(self.corridors)
+            self.corridors.append((junction, cur, interior))
+            for offset, i in enumerate(interior, 1):
+                self._where[i] = (corridor, offset)
+
+    @staticmethod
+    def _dijkstra(source: int, edges: Dict[int, Dict[int, int]]) -> Dict[int, int]:
+        dist = {source: 0}
+        heap = [(0, source)]
+        while heap:
+            d, j = heapq.heappop(heap)
+            if d > dist[j]:
+                continue
+            for k, w in edges[j].items():
+                nd = d + w
+                if nd < dist.get(k, nd + 1):
+                    dist[k] = nd
+                    heapq.heappush(heap, (nd, k))
+        return dist
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+
+    def has_cell(self, i: int) -> bool:
+        return bool(self._on[i])
+
+    def _anchors(self, i: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        (junction, distance) pairs a path from cell i must leave through.
+        """
+        if i in self._junction_set:
+            return ((i, 0),)
+        corridor, offset = self._where[i]
+        a, b, interior = self.corridors[corridor]
+        return ((a, offset), (b, len(interior) + 1 - offset))
+
+    def distance(self, a: Tuple[int, int], b: Tuple[int, int]) -> Optional[int]:
+        """
+        Network distance between two cells, None when either is off the
+        network or they are not connected.
+        """
+        ia = a[1] * self.width + a[0]
+        ib = b[1] * self.width + b[0]
+        if not (self._on[ia] and self._on[ib]):
+            return None
+        if ia == ib:
+            return 0
+
+        best = None
+        wa, wb = self._where.get(ia), self._where.get(ib)
+        if wa is not None and wb is not None and wa[0] == wb[0]:
+            best = abs(wa[1] - wb[1])
+
+        for ja, da in self._anchors(ia):
+            row = self.distances[ja]
+            for jb, db in self._anchors(ib):
+                d = row.get(jb)
+                if d is not None and (best is None or da + d + db < best):
+                    best = da + d + db
+        return best
+
+    def distances_from(self, start: Tuple[int, int], limit: Optional[int] = None) -> Dict[Tuple[int, int], int]:
+        """
+        Network distance from start to every cell within `limit` steps
+        (the whole component when limit is None); {} off the network.
+        Corridor cells are interpolated from their two ends.
+        """
+        width = self.width
+        source = start[1] * width + start[0]
+        if not self._on[source]:
+            return {}
+        if limit is None:
+            limit = len(self._on)
+
+        to_junction: Dict[int, int] = {}
+        for ja, da in self._anchors(source):
+            for j, d in self.distances[ja].items():
+                if da + d < to_junction.get(j, da + d + 1):
+                    to_junction[j] = da + d
+
+        result = {
+            (j % width, j // width): d
+            for j, d in to_junction.items() if d <= limit
+        }
+        home = self._where.get(source)
+        for corridor, (a, b, interior) in enumerate(self.corridors):
+            if a not in to_junction:
+                continue
+            da, db = to_junction[a], to_junction[b]
+            length = len(interior) + 1
+            direct = home[1] if home is not None and home[0] == corridor else None
+            for offset, i in enumerate(interior, 1):
+                d = min(da + offset, db + length - offset)
+                if direct is not None:
+                    d = min(d, abs(direct - offset))
+                if d <= limit:
+                    result[(i % width, i // width)] = d
+        return result
@@ -0,0 +1,100 @@
+from array import array
+from itertools import accumulate
+from typing import Dict, List
+
+from bitboard import to_layer
+
+
+# Terrain that blocks a shot, by GameCell predicate suffix
+BLOCKERS = ("building", "forest")
+
+
+class LineOfSightIndex:
+    """
+    Per-row and per-column prefix counts of LOS blockers.
+
+    rows[kind][y][x] is the number of `kind` cells in row y left of x
+    (columns likewise, top to bottom), so the blockers on any straight
+    run of cells are two lookups. update() keeps the counts current
+    after a single-cell edit in O(WIDTH + HEIGHT).
+    """
+
+    def __init__(self, board):
+        self.width = width = board.WIDTH
+        self.height = height = board.HEIGHT
+        self._flags: Dict[str, bytearray] = {}
+        self.rows: Dict[str, List[array]] = {}
+        self.cols: Dict[str, List[array]] = {}
+
+        for kind in BLOCKERS:
+            flags = bytearray(to_layer(board.mask(kind), width * height))
+            self._flags[kind] = flags
+            self.rows[kind] = [
+                array("i", accumulate(flags[y * width:(y + 1) * width], initial=0))
+                for y in range(height)
+            ]
+            self.cols[kind] = [
+                array("i", accumulate(flags[x::width], initial=0))
+                for x in range(width)
+            ]
+
+    def update(self, x: int, y: int, cell) -> None:
+        i = y * self.width + x
+        for kind in BLOCKERS:
+            value = getattr(cell, f"is_{kind}")()
+            flags = self._flags[kind]
+            delta = value - flags[i]
+            if not delta:
+                continue
+            flags[i] = value
+
+            row = self.rows[kind][y]
+            for k in range(x + 1, self.width + 1):
+                row[k] += delta
+            col = self.cols[kind][x]
+            for k in range(y + 1, self.height + 1):
+                col[k] += delta
+
+    def count(self, kind: str, x0: int, y0: int, x1: int, y1: int) -> int:
+        """
+        `kind` cells on the straight run (x0, y0)..(x1, y1), both ends
+        included; the run must lie on one row or one column.
+        """
+        if y0 == y1:
+            lo, hi = (x0, x1) if x0 <= x1 else (x1, x0)
+            row = self.rows[kind][y0]
+            return row[hi + 1] - row[lo]
+        if x0 == x1:
+            lo, hi = (y0, y1) if y0 <= y1 else (y1, y0)
+            col = self.cols[kind][x0]
+            return col[hi + 1] - col[lo]
+        raise ValueError("LOS runs must be axis-aligned")
+
+    def blocked(
+        self,
+        first: tuple,
+        last: tuple,
+        *,
+        block_buildings: bool = True,
+        block_forests: bool = True,
+        allow_forest_on_last_scanned_cell: bool = False,
+    ) -> bool:
+        """
+        Same rules as Player._los_blocked for the scanned cells
+        first..last (in scan order, both included).
+        """
+        (x0, y0), (x1, y1) = first, last
+        if block_buildings and self.count("building", x0, y0, x1, y1):
+            return True
+        if not block_forests:
+            return False
+
+        if allow_forest_on_last_scanned_cell:
+            if (x0, y0) == (x1, y1):
+                return False
+            # Step the last cell back one towards the first
+            if y0 == y1:
+                x1 += 1 if x0 > x1 else -1
+            else:
+                y1 += 1 if y0 > y1 else -1
+        return self.count("forest", x0, y0, x1, y1) > 0
@@ -1,11 +1,126 @@
 import json
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Mapping, Optional, Set, Tuple
 from collections import deque
+from functools import partial
+from types import MappingProxyType
 
-from constants import BALANCE
+from constants import BALANCE, GUN_KIT, MOVEMENT_NETWORKS, ROCKET_KIT
+from inventory import Inventory
+from player_table import SECTION_FIELDS, SNAPSHOT_FIELDS, PlayerTable
+from search import SEARCH_STRATEGIES, manhattan
+
+
+def _walkable(c) -> bool:
+    return (not c.is_water()) or (c.is_water() and c.is_road())
+
+
+# mode -> (required transport flag, passability rule)
+MOVEMENT_MODES = {
+    "car": ("on_car", lambda c: c.is_road()),
+    "train": ("on_train", lambda c: c.is_railroad()),
+    "boat": ("on_boat", lambda c: c.is_water()),
+    "walk": (None, _walkable),
+    "swim": (None, lambda c: c.is_sea()),
+}
+
+# Modes answered from the board's junction graph (thin corridor networks)
+JUNCTION_MODES = ("car", "train")
+
+# reachable_cells result when nothing is reachable
+_NO_CELLS = MappingProxyType({})
+
+
+def _column(name: str) -> property:
+    """
+    Numeric field stored in the player's PlayerTable row.
+    """
+
+    def get(self) -> int:
+        return getattr(self._table, name)[self._row]
+
+    def set(self, value: int) -> None:
+        self._table.store(name, self._row, value)
+        self._table.touch(self._row, name)
+
+    return property(get, set)
+
+
+def _flag_column(name: str, *, writable: bool = True) -> property:
+    """
+    Boolean field stored as a 0/1 byte in the player's table row.
+    """
+
+    def get(self) -> bool:
+        return getattr(self._table, name)[self._row] != 0
+
+    def set(self, value: bool) -> None:
+        getattr(self._table, name)[self._row] = 1 if value else 0
+        self._table.touch(self._row, name)
+
+    return property(get, set if writable else None)
+
+
+def _inventory_changed(table, row: int, name: str, derived, inventory: Inventory) -> None:
+    # on_change of an inventory column entry, see _inventory_column
+    column = getattr(table, name)
+    current = column[row]
+    if current is None or current is inventory:
+        column[row] = inventory if len(inventory) else None
+    table.touch(row, name)
+    if derived is not None:
+        derived(table, row, inventory)
+
+
+def _inventory_column(name: str, refresh: Optional[str] = None) -> property:
+    """
+    Inventory stored in the player's table row; assigning any iterable
+    (e.g. a list) replaces the contents. Every change is recorded in
+    the table, then the `refresh` hook runs with (table, row, inventory).
+
+    Empty inventories are not stored: the row holds None, reading it
+    hands out a fresh Inventory that attaches itself to the row on its
+    first change, and an inventory that becomes empty is detached again.
+    """
+
+    def watcher(self):
+        derived = getattr(type(self), refresh) if refresh is not None else None
+        return partial(_inventory_changed, self._table, self._row, name, derived)
+
+    def get(self) -> Inventory:
+        inventory = getattr(self._table, name)[self._row]
+        if inventory is None:
+            inventory = Inventory((), watcher(self))
+        return inventory
+
+    def set(self, items) -> None:
+        getattr(self._table, name)[self._row] = None
+        on_change = watcher(self)
+        on_change(Inventory(items, on_change))
+
+    return property(get, set)
+
+
+def _items(inventory: Optional[Inventory]) -> List[str]:
+    # Contents of an inventory column entry (None when empty)
+    return [] if inventory is None else list(inventory)
+
+
+# Table shared by every Player created without one
+_DEFAULT_TABLE = PlayerTable()
 
 
 class Player:
+    """
+    Row proxy over a PlayerTable: every field lives in the table's
+    columns. Players created without a table share a module-wide one;
+    a player's row is released when the player is garbage collected.
+    """
+
+    __slots__ = ("_table", "_row", "__weakref__")
+
+    # Default for the can_get_by_* `strategy` argument, see _search
+    search_strategy = "reach"
+
     # =================================================
     # Initialization
     # =================================================
@@ -30,27 +145,153 @@ class Player:
         home_parts: Optional[List[str]] = None,
         home_inventory: Optional[List[str]] = None,
         home_money: int = 0,
+        table: Optional[PlayerTable] = None,
     ):
-        self.x = x
-        self.y = y
-        self.wound = wound
-        self.money = money
-
-        self.on_land = on_land
-        self.on_water = on_water
-        self.on_car = on_car
-        self.on_boat = on_boat
-        self.on_train = on_train
-
-        self.weapons = weapons if weapons is not None else []
-        self.parts = parts if parts is not None else []
-        self.inventory = inventory if inventory is not None else []
-
-        self.home = home
-        self.home_weapons = home_weapons if home_weapons is not None else []
-        self.home_parts = home_parts if home_parts is not None else []
-        self.home_inventory = home_inventory if home_inventory is not None else []
-        self.home_money = home_money
+        table = self._table = table if table is not None else _DEFAULT_TABLE
+        row = self._row = table.append_row(self)
+
+        # append_row already stamped every field of the new row as
+        # changed, so plain fields go straight into the columns
+        table.store("x", row, x)
+        table.store("y", row, y)
+        table.store("wound", row, wound)
+        table.store("money", row, money)
+        table.store("home_x", row, home[0])
+        table.store("home_y", row, home[1])
+        table.store("home_money", row, home_money)
+
+        table.on_land[row] = 1 if on_land else 0
+        table.on_water[row] = 1 if on_water else 0
+        table.on_car[row] = 1 if on_car else 0
+        table.on_boat[row] = 1 if on_boat else 0
+        table.on_train[row] = 1 if on_train else 0
+
+        # Empty inventories are created on first access
+        if weapons:
+            self.weapons = weapons
+        if parts:
+            self.parts = parts
+        if inventory:
+            self.inventory = inventory
+
+        if home_weapons:
+            self.home_weapons = home_weapons
+        if home_parts:
+            self.home_parts = home_parts
+        if home_inventory:
+            self.home_inventory = home_inventory
+
+    def __del__(self):
+        try:
+            table, row = self._table, self._row
+        except AttributeError:
+            # __init__ failed before the row was taken
+            return
+        table.release_row(row, self)
+
+    # =================================================
+    # Table-backed fields
+    # =================================================
+
+    wound = _column("wound")
+    money = _column("money")
+    home_money = _column("home_money")
+
+    on_land = _flag_column("on_land")
+    on_water = _flag_column("on_water")
+    on_car = _flag_column("on_car")
+    on_boat = _flag_column("on_boat")
+    on_train = _flag_column("on_train")
+
+    @property
+    def table(self) -> PlayerTable:
+        return self._table
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def home(self) -> Tuple[int, int]:
+        return self._table.home_x[self._row], self._table.home_y[self._row]
+
+    @home.setter
+    def home(self, value: Tuple[int, int]) -> None:
+        table, row = self._table, self._row
+        home_x, home_y = value
+        table.store("home_x", row, home_x)
+        table.store("home_y", row, home_y)
+        table.touch(row, "home")
+
+    # =================================================
+    # Inventories
+    # =================================================
+
+    weapons = _inventory_column("weapons", "_weapons_changed")
+    parts = _inventory_column("parts", "_parts_changed")
+    inventory = _inventory_column("inventory")
+    home_weapons = _inventory_column("home_weapons")
+    home_parts = _inventory_column("home_parts")
+    home_inventory = _inventory_column("home_inventory")
+
+    # Derived from weapons / parts, refreshed on every change
+    has_gun_and_bullets = _flag_column("has_gun_and_bullets", writable=False)
+    has_rpg_and_rocket = _flag_column("has_rpg_and_rocket", writable=False)
+
+    @property
+    def distinct_part_colours(self) -> int:
+        return self._table.distinct_part_colours[self._row]
+
+    # Refresh hooks take the row, not the player, so inventories stored
+    # in the table never reference their Player
+
+    @staticmethod
+    def _weapons_changed(table: PlayerTable, row: int, weapons: Inventory) -> None:
+        table.has_gun_and_bullets[row] = all(item in weapons for item in GUN_KIT)
+        table.has_rpg_and_rocket[row] = all(item in weapons for item in ROCKET_KIT)
+
+    @staticmethod
+    def _parts_changed(table: PlayerTable, row: int, parts: Inventory) -> None:
+        table.distinct_part_colours[row] = parts.distinct()
+
+    # =================================================
+    # Position
+    # =================================================
+
+    @property
+    def _spatial_index(self):
+        # Set by GameBoard.track_player; notified on every move
+        return self._table.spatial_index[self._row]
+
+    @_spatial_index.setter
+    def _spatial_index(self, index) -> None:
+        self._table.spatial_index[self._row] = index
+
+    @property
+    def x(self) -> int:
+        return self._table.x[self._row]
+
+    @x.setter
+    def x(self, value: int) -> None:
+        table, row = self._table, self._row
+        table.store("x", row, value)
+        table.touch(row, "x")
+        index = table.spatial_index[row]
+        if index is not None:
+            index.move(self, value, table.y[row])
+
+    @property
+    def y(self) -> int:
+        return self._table.y[self._row]
+
+    @y.setter
+    def y(self, value: int) -> None:
+        table, row = self._table, self._row
+        table.store("y", row, value)
+        table.touch(row, "y")
+        index = table.spatial_index[row]
+        if index is not None:
+            index.move(self, table.x[row], value)
 
     # =================================================
     # Basic state helpers
@@ -219,46 +460,128 @@ class Player:
     # Snapshot / debug
     # =================================================
 
-    def snapshot(self, sections: Optional[Set[str]] = None) -> Dict:
-        if sections is None:
-            sections = {"state", "status", "carried_inventory", "home_inventory"}
+    def _build_section(self, section: str) -> Dict:
+        # Straight from the columns: empty inventories are None there
+        table, row = self._table, self._row
+        home = (table.home_x[row], table.home_y[row])
+        has_home = home != (-1, -1)
+
+        if section == "state":
+            return {
+                "x": table.x[row],
+                "y": table.y[row],
+                "wound": table.wound[row],
+                "has_home": has_home,
+                **({"home": home} if has_home else {}),
+            }
 
-        data: Dict[str, Dict] = {}
+        if section == "status":
+            return self.movement_state()
 
-        if "state" in sections:
-            data["state"] = {
-                "x": self.x,
-                "y": self.y,
-                "wound": self.wound,
-                "has_home": self.has_home(),
-                **({"home": self.home} if self.has_home() else {}),
+        if section == "carried_inventory":
+            return {
+                "money": table.money[row],
+                "weapons": _items(table.weapons[row]),
+                "parts": _items(table.parts[row]),
+                "inventory": _items(table.inventory[row]),
             }
 
-        if "status" in sections:
-            data["status"] = self.movement_state()
-
-        if "carried_inventory" in sections:
-            data["carried_inventory"] = {
-                "money": self.money,
-                "weapons": list(self.weapons),
-                "parts": list(self.parts),
-                "inventory": list(self.inventory),
+        if has_home:
+            return {
+                "is_at_home": (table.x[row], table.y[row]) == home,
+                "home_money": table.home_money[row],
+                "weapons": _items(table.home_weapons[row]),
+                "parts": _items(table.home_parts[row]),
+                "inventory": _items(table.home_inventory[row]),
             }
+        return {}
 
-        if "home_inventory" in sections:
-            if self.has_home():
-                data["home_inventory"] = {
-                    "is_at_home": self.at_home(),
-                    "home_money": self.home_money,
-                    "weapons": list(self.home_weapons),
-                    "parts": list(self.home_parts),
-                    "inventory": list(self.home_inventory),
-                }
-            else:
-                data["home_inventory"] = {}
+    def _section_json(self, section: str) -> str:
+        """
+        Compact JSON of a section from the table's snapshot cache;
+        PlayerTable.touch drops the sections a change affects. Only the
+        JSON is kept: section dicts are cheap to rebuild, and callers
+        get fresh ones to mutate.
+        """
+        table, row = self._table, self._row
+        cache = table.snapshots[row]
+        if cache is None:
+            cache = table.snapshots[row] = {}
+
+        fragment = cache.get(section)
+        if fragment is None:
+            data = self._build_section(section)
+            fragment = cache[section] = json.dumps(data, separators=(",", ":"), sort_keys=True)
+        return fragment
+
+    @property
+    def version(self) -> int:
+        """
+        Table clock value of this player's latest change.
+        """
+        return self._table.row_version[self._row]
+
+    def snapshot(self, sections: Optional[Set[str]] = None) -> Dict:
+        if sections is None:
+            sections = SNAPSHOT_FIELDS.keys()
 
+        data: Dict[str, Dict] = {}
+        for section in SNAPSHOT_FIELDS:
+            if section in sections:
+                data[section] = self._build_section(section)
         return data
 
+    def snapshot_json(self, sections: Optional[Set[str]] = None) -> str:
+        """
+        snapshot() as compact JSON with sorted keys, assembled from
+        cached per-section fragments.
+        """
+        names = sorted(SNAPSHOT_FIELDS if sections is None else set(sections) & SNAPSHOT_FIELDS.keys())
+        return "{" + ",".join(f'"{name}":{self._section_json(name)}' for name in names) + "}"
+
+    def snapshot_delta(self, since_version: int, sections: Optional[Set[str]] = None) -> Dict:
+        """
+        The snapshot keys whose fields changed after `since_version`
+        (a previous `version`), by section; unchanged sections are left
+        out. A section whose key set may have changed (the home was set
+        or cleared) is sent whole, and the keys it no longer shows are
+        listed under "removed": {section: [keys]}. Applying a delta is
+        dropping the removed keys, then updating each section.
+        """
+        table, row = self._table, self._row
+        if table.row_version[row] <= since_version:
+            return {}
+        if sections is None:
+            sections = SNAPSHOT_FIELDS.keys()
+        dirty = {
+            field for field, versions in table.versions.items()
+            if versions[row] > since_version
+        }
+
+        delta: Dict[str, Dict] = {}
+        removed: Dict[str, List[str]] = {}
+        for section, keys in SNAPSHOT_FIELDS.items():
+            if section not in sections or dirty.isdisjoint(SECTION_FIELDS[section]):
+                continue
+            current = self._build_section(section)
+            # has_home decides which keys state and home_inventory show
+            reshaped = "home" in dirty and "home" in SECTION_FIELDS[section]
+            changed = {
+                key: current[key]
+                for key, fields in keys.items()
+                if key in current and (reshaped or not dirty.isdisjoint(fields))
+            }
+            if reshaped:
+                delta[section] = changed
+                gone = [key for key in keys if key not in current]
+                if gone:
+                    removed[section] = gone
+            elif changed:
+                delta[section] = changed
+        if removed:
+            delta["removed"] = removed
+        return delta
+
     def __str__(self) -> str:
         return json.dumps(self.snapshot(), indent=2, sort_keys=True)
 
@@ -288,44 +611,156 @@ class Player:
             return (self.x, self.y) == (target_x, target_y)
 
         # Manhattan fast-fail: can't possibly reach within AP
-        manhattan = abs(self.x - target_x) + abs(self.y - target_y)
-        if manhattan > action_points:
+        if manhattan((self.x, self.y), (target_x, target_y)) > action_points:
             return False
 
         # Continue with specific-mode validation / BFS
         return None
 
 
-    def _bfs_path(
+    def reachable_cells(
+        self,
+        board,
+        mode: str,
+        action_points: int,
+    ) -> Mapping[Tuple[int, int], int]:
+        """
+        Every cell reachable with `mode` within `action_points`, mapped
+        to its AP distance. Modes: "car", "train", "boat", "walk", "swim".
+
+        Empty when the player is off board, lacks the transport flag the
+        mode needs, or stands on a cell the mode cannot use.
+
+        Results are shared through the board's `reach_cache` when it has
+        one, so the returned mapping is always read-only.
+        """
+        if mode not in MOVEMENT_MODES:
+            raise ValueError(f"Unknown movement mode: {mode!r}")
+        if not isinstance(action_points, int) or action_points < 0:
+            return _NO_CELLS
+        if not board.is_in_bounds(self.x, self.y):
+            return _NO_CELLS
+
+        flag, passable = MOVEMENT_MODES[mode]
+        if flag is not None and not getattr(self, flag):
+            return _NO_CELLS
+        if not passable(board.get_cell(self.x, self.y)):
+            return _NO_CELLS
+
+        cache = getattr(board, "reach_cache", None)
+        if cache is None:
+            return MappingProxyType(self._bfs_distances(board, action_points, passable))
+
+        key = (board.generation, mode, (self.x, self.y), action_points)
+        reach = cache.get(key)
+        if reach is None:
+            reach = MappingProxyType(self._bfs_distances(board, action_points, passable))
+            cache.put(key, reach)
+        return reach
+
+    def _search(
         self,
         board,
+        mode: str,
         target_x: int,
         target_y: int,
         action_points: int,
-        passable,
+        strategy: Optional[str],
     ) -> bool:
-        visited = {(self.x, self.y)}
-        q = deque([(self.x, self.y, 0)])
+        """
+        Final path check of the can_get_by_* methods.
+
+        strategy (per call, else Player.search_strategy):
+          - "reach" (default): membership in the cached reachable_cells set,
+            or a junction-graph distance lookup for car / train
+          - "bfs", "astar", "bidirectional": point-to-point searches
+            from search.SEARCH_STRATEGIES
+        """
+        strategy = strategy or self.search_strategy
+        if strategy == "reach":
+            if mode in JUNCTION_MODES and hasattr(board, "junction_graph"):
+                graph = board.junction_graph(MOVEMENT_NETWORKS[mode])
+                distance = graph.distance((self.x, self.y), (target_x, target_y))
+                return distance is not None and distance <= action_points
+            return (target_x, target_y) in self.reachable_cells(board, mode, action_points)
+
+        search = SEARCH_STRATEGIES.get(strategy)
+        if search is None:
+            raise ValueError(f"Unknown search strategy: {strategy!r}")
+        passable = MOVEMENT_MODES[mode][1]
+        return search(board, (self.x, self.y), (target_x, target_y), action_points, passable).found
+
+    def _same_network(self, board, mode: str, target_x: int, target_y: int) -> bool:
+        """
+        O(1) rejection of targets on a different connected component,
+        for boards that label their networks; True when unknown.
+        """
+        same_component = getattr(board, "same_component", None)
+        if same_component is None:
+            return True
+        return same_component(MOVEMENT_NETWORKS[mode], (self.x, self.y), (target_x, target_y))
+
+    def _bfs_distances(self, board, action_points: int, passable) -> Dict[Tuple[int, int], int]:
+        """
+        Bounded BFS from the player's cell through `passable` cells.
+        """
+        if hasattr(board, "adjacency"):
+            return self._bfs_distances_indexed(board, action_points, passable)
+
+        dist = {(self.x, self.y): 0}
+        q = deque([(self.x, self.y)])
 
         while q:
-            x, y, dist = q.popleft()
-            if dist > action_points:
+            x, y = q.popleft()
+            d = dist[(x, y)]
+            if d == action_points:
                 continue
-            if (x, y) == (target_x, target_y):
-                return True
 
             for nx, ny in board.neighbors(x, y):
-                if (nx, ny) in visited:
+                if (nx, ny) in dist:
                     continue
-                cell = board.get_cell(nx, ny)
-                if not passable(cell):
+                if not passable(board.get_cell(nx, ny)):
                     continue
-                visited.add((nx, ny))
-                q.append((nx, ny, dist + 1))
+                dist[(nx, ny)] = d + 1
+                q.append((nx, ny))
 
-        return False
+        return dist
 
-    def can_get_by_car(self, board, target_x: int, target_y: int, action_points: int) -> bool:
+    def _bfs_distances_indexed(self, board, action_points: int, passable) -> Dict[Tuple[int, int], int]:
+        """
+        Same search over the board's flat adjacency table, one AP ring
+        at a time.
+        """
+        adjacency = board.adjacency()
+        cell_at = board.cell_at
+        start = board.index_of(self.x, self.y)
+
+        dist = {start: 0}
+        frontier = [start]
+        for d in range(1, action_points + 1):
+            next_frontier = []
+            for i in frontier:
+                for j in adjacency[i]:
+                    if j in dist or not passable(cell_at(j)):
+                        continue
+                    dist[j] = d
+                    next_frontier.append(j)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        width = board.WIDTH
+        return {(i % width, i // width): d for i, d in dist.items()}
+
+    def can_get_by_car(
+        self,
+        board,
+        target_x: int,
+        target_y: int,
+        action_points: int,
+        *,
+        strategy: Optional[str] = None,
+    ) -> bool:
         early = self._early_same_cell_check(board, target_x, target_y, action_points)
         if early is not None:
             return early
@@ -336,13 +771,20 @@ class Player:
         dest = board.get_cell(target_x, target_y)
         if not start.is_road() or not dest.is_road():
             return False
+        if not self._same_network(board, "car", target_x, target_y):
+            return False
 
-        return self._bfs_path(
-            board, target_x, target_y, action_points,
-            lambda c: c.is_road()
-        )
+        return self._search(board, "car", target_x, target_y, action_points, strategy)
 
-    def can_get_by_train(self, board, target_x: int, target_y: int, action_points: int) -> bool:
+    def can_get_by_train(
+        self,
+        board,
+        target_x: int,
+        target_y: int,
+        action_points: int,
+        *,
+        strategy: Optional[str] = None,
+    ) -> bool:
         early = self._early_same_cell_check(board, target_x, target_y, action_points)
         if early is not None:
             return early
@@ -353,13 +795,20 @@ class Player:
         dest = board.get_cell(target_x, target_y)
         if not start.is_railroad() or not dest.is_railroad():
             return False
+        if not self._same_network(board, "train", target_x, target_y):
+            return False
 
-        return self._bfs_path(
-            board, target_x, target_y, action_points,
-            lambda c: c.is_railroad()
-        )
+        return self._search(board, "train", target_x, target_y, action_points, strategy)
 
-    def can_get_by_boat(self, board, target_x: int, target_y: int, action_points: int) -> bool:
+    def can_get_by_boat(
+        self,
+        board,
+        target_x: int,
+        target_y: int,
+        action_points: int,
+        *,
+        strategy: Optional[str] = None,
+    ) -> bool:
         early = self._early_same_cell_check(board, target_x, target_y, action_points)
         if early is not None:
             return early
@@ -370,13 +819,20 @@ class Player:
         dest = board.get_cell(target_x, target_y)
         if not start.is_water() or not dest.is_water():
             return False
+        if not self._same_network(board, "boat", target_x, target_y):
+            return False
 
-        return self._bfs_path(
-            board, target_x, target_y, action_points,
-            lambda c: c.is_water()
-        )
+        return self._search(board, "boat", target_x, target_y, action_points, strategy)
 
-    def can_get_by_walk(self, board, target_x: int, target_y: int, action_points: int) -> bool:
+    def can_get_by_walk(
+        self,
+        board,
+        target_x: int,
+        target_y: int,
+        action_points: int,
+        *,
+        strategy: Optional[str] = None,
+    ) -> bool:
         early = self._early_same_cell_check(board, target_x, target_y, action_points)
         if early is not None:
             return early
@@ -384,17 +840,24 @@ class Player:
         start = board.get_cell(self.x, self.y)
         dest = board.get_cell(target_x, target_y)
 
-        def walkable(c) -> bool:
-            return (not c.is_water()) or (c.is_water() and c.is_road())
-
         # must be walkable at both ends
-        if not walkable(start) or not walkable(dest):
+        if not _walkable(start) or not _walkable(dest):
+            return False
+        if not self._same_network(board, "walk", target_x, target_y):
             return False
 
-        return self._bfs_path(board, target_x, target_y, action_points, walkable)
+        return self._search(board, "walk", target_x, target_y, action_points, strategy)
 
 
-    def can_get_by_swim(self, board, target_x: int, target_y: int, action_points: int) -> bool:
+    def can_get_by_swim(
+        self,
+        board,
+        target_x: int,
+        target_y: int,
+        action_points: int,
+        *,
+        strategy: Optional[str] = None,
+    ) -> bool:
         early = self._early_same_cell_check(board, target_x, target_y, action_points)
         if early is not None:
             return early
@@ -403,11 +866,10 @@ class Player:
         dest = board.get_cell(target_x, target_y)
         if not start.is_sea() or not dest.is_sea():
             return False
+        if not self._same_network(board, "swim", target_x, target_y):
+            return False
 
-        return self._bfs_path(
-            board, target_x, target_y, action_points,
-            lambda c: c.is_sea()
-        )
+        return self._search(board, "swim", target_x, target_y, action_points, strategy)
 
     def can_get_by_changing_stance(self, board, target_x: int, target_y: int, action_points: int) -> bool:
         early = self._early_same_cell_check(board, target_x, target_y, action_points)
@@ -490,17 +952,147 @@ class Player:
         if self._attack_cells_or_none(board, target_x, target_y) is None:
             return False
 
+        cache = getattr(board, "reach_cache", None)
+        if cache is not None and cache.maxsize:
+            return self._h2h_cached(board, target_x, target_y)
+        return self._h2h_search(board, target_x, target_y)
+
+    def can_attack_hand_to_hand_batch(self, board, targets) -> List[bool]:
+        """
+        can_attack_hand_to_hand for many (x, y) targets from one walk
+        and one swim frontier.
+        """
+        targets = list(targets)
+        if not board.is_in_bounds(self.x, self.y) or board.get_cell(self.x, self.y).is_building():
+            return [False] * len(targets)
+
+        cells = self._h2h_cells(board)
+        return [
+            (tx, ty) in cells and not board.get_cell(tx, ty).is_building()
+            for tx, ty in targets
+        ]
+
+    def _h2h_trivial(self, board, target_x: int, target_y: int) -> bool:
+        """
+        The h2h cases that need no search: a zero budget on the own
+        cell, or a stance change between adjacent shore and sea.
+        """
+        h2h = BALANCE["h2h"]
+        distance = abs(target_x - self.x) + abs(target_y - self.y)
+        if distance == 0 and 0 in (h2h["walk_ap"], h2h["swim_ap"], h2h["stance_ap"]):
+            return True
+        if h2h["stance_ap"] <= 0 or distance != 1:
+            return False
+        start_cell = board.get_cell(self.x, self.y)
+        target_cell = board.get_cell(target_x, target_y)
         return (
-            self.can_get_by_walk(board, target_x, target_y, BALANCE["h2h"]["walk_ap"])
-            or self.can_get_by_swim(board, target_x, target_y, BALANCE["h2h"]["swim_ap"])
-            or self.can_get_by_changing_stance(board, target_x, target_y, BALANCE["h2h"]["stance_ap"])
+            (start_cell.is_shore() and target_cell.is_sea())
+            or (start_cell.is_sea() and target_cell.is_shore())
         )
 
+    def _h2h_cached(self, board, target_x: int, target_y: int) -> bool:
+        """
+        Hand-to-hand check through the board's reach cache: cached walk /
+        swim reach answers directly. On a miss the lockstep _h2h_search
+        answers, and only a second miss from the same cell computes the
+        full reach and stores it for later checks. Both cells must be on
+        board.
+        """
+        if self._h2h_trivial(board, target_x, target_y):
+            return True
+        h2h = BALANCE["h2h"]
+        cache = board.reach_cache
+        start = (self.x, self.y)
+        target = (target_x, target_y)
+        distance = manhattan(start, target)
+        start_cell = board.get_cell(*start)
+
+        # (key, action points, passable) of the modes not in the cache
+        missing = []
+        for mode in ("walk", "swim"):
+            action_points = h2h[f"{mode}_ap"]
+            passable = MOVEMENT_MODES[mode][1]
+            if action_points <= 0 or distance > action_points or not passable(start_cell):
+                continue
+            key = (board.generation, mode, start, action_points)
+            reach = cache.get(key)
+            if reach is None:
+                missing.append((key, action_points, passable))
+            elif target in reach:
+                return True
+        if not missing:
+            return False
+
+        if not any([cache.probe(key) for key, _, _ in missing]):
+            return self._h2h_search(board, target_x, target_y)
+        for key, action_points, passable in missing:
+            reach = MappingProxyType(self._bfs_distances(board, action_points, passable))
+            cache.put(key, reach)
+            if target in reach:
+                return True
+        return False
+
+    def _h2h_search(self, board, target_x: int, target_y: int) -> bool:
+        """
+        Uncached hand-to-hand check: can_get_by_walk(walk_ap) or
+        can_get_by_swim(swim_ap) or can_get_by_changing_stance(stance_ap)
+        in one pass. The trivial cases are checked first, then the walk
+        and swim frontiers grow in lockstep until one touches the
+        target. Nodes too far from the target for the remaining AP are
+        not expanded. Both cells must be on board.
+        """
+        if self._h2h_trivial(board, target_x, target_y):
+            return True
+
+        h2h = BALANCE["h2h"]
+        start = (self.x, self.y)
+        target = (target_x, target_y)
+        distance = manhattan(start, target)
+        start_cell = board.get_cell(*start)
+        target_cell = board.get_cell(*target)
+
+        # mode -> [frontier, seen, action points, passable]
+        searches = {}
+        for mode in ("walk", "swim"):
+            action_points = h2h[f"{mode}_ap"]
+            passable = MOVEMENT_MODES[mode][1]
+            if action_points <= 0 or distance > action_points:
+                continue
+            if not (passable(start_cell) and passable(target_cell)):
+                continue
+            if distance == 0:
+                return True
+            if not self._same_network(board, mode, target_x, target_y):
+                continue
+            searches[mode] = [[start], {start}, action_points, passable]
+
+        step = 0
+        while searches:
+            step += 1
+            for mode, search in list(searches.items()):
+                frontier, seen, action_points, passable = search
+                remaining = action_points - step
+                next_frontier = []
+                for x, y in frontier:
+                    for n in board.neighbors(x, y):
+                        if n in seen or not passable(board.get_cell(*n)):
+                            continue
+                        if n == target:
+                            return True
+                        seen.add(n)
+                        if abs(n[0] - target_x) + abs(n[1] - target_y) <= remaining:
+                            next_frontier.append(n)
+                if not next_frontier or remaining == 0:
+                    del searches[mode]
+                else:
+                    search[0] = next_frontier
+        return False
+
     def can_attack_with_gun(self, board, target_x: int, target_y: int) -> bool:
         if self._attack_cells_or_none(board, target_x, target_y) is None:
             return False
 
-        if "gun" not in self.weapons or "bullet" not in self.weapons:
+        if not self.has_gun_and_bullets:
             return False
 
         same_col = (self.x == target_x)
@@ -512,6 +1104,21 @@ class Player:
         if distance > BALANCE["gun"]["range"]:
             return False
 
+        if distance < 2:
+            return True
+
+        los_index = getattr(board, "los_index", None)
+        if los_index is not None:
+            step_x = (target_x > self.x) - (target_x < self.x)
+            step_y = (target_y > self.y) - (target_y < self.y)
+            return not los_index().blocked(
+                (self.x + step_x, self.y + step_y),
+                (target_x - step_x, target_y - step_y),
+                block_buildings=True,
+                block_forests=True,
+                allow_forest_on_last_scanned_cell=False,
+            )
+
         coords = self._axis_coords_exclusive(target_x, target_y)
         if self._los_blocked(
             board,
@@ -528,7 +1135,7 @@ class Player:
         if self._attack_cells_or_none(board, target_x, target_y) is None:
             return False
 
-        if "rpg" not in self.weapons or "rocket" not in self.weapons:
+        if not self.has_rpg_and_rocket:
             return False
 
         if self.x - 1 <= target_x <= self.x + 1:
@@ -554,6 +1161,23 @@ class Player:
             return False
 
         steps_to_check = distance - 1
+
+        los_index = getattr(board, "los_index", None)
+        if los_index is not None:
+            if y_axis_shot:
+                first = (lane_x, self.y + step_y)
+                last = (lane_x, self.y + step_y * steps_to_check)
+            else:
+                first = (self.x + step_x, lane_y)
+                last = (self.x + step_x * steps_to_check, lane_y)
+            return not los_index().blocked(
+                first,
+                last,
+                block_buildings=True,
+                block_forests=True,
+                allow_forest_on_last_scanned_cell=True,
+            )
+
         coords: List[Tuple[int, int]] = []
         for i in range(1, steps_to_check + 1):
             if y_axis_shot:
@@ -572,6 +1196,119 @@ class Player:
 
         return True
 
+    # =================================================
+    # Batch attack queries
+    # =================================================
+
+    def attack_reach(self, board) -> Dict[str, Set[Tuple[int, int]]]:
+        """
+        Every cell this player can attack, per weapon ("h2h", "gun",
+        "rocket"); cell (x, y) is in result[w] exactly when the matching
+        can_attack_* check for (x, y) is True.
+
+        h2h comes from one walk and one swim frontier, gun and rocket
+        from one sweep per lane instead of a check per target.
+        """
+        reach: Dict[str, Set[Tuple[int, int]]] = {"h2h": set(), "gun": set(), "rocket": set()}
+        if not board.is_in_bounds(self.x, self.y):
+            return reach
+        if board.get_cell(self.x, self.y).is_building():
+            return reach
+
+        reach["h2h"] = self._h2h_cells(board)
+        if self.has_gun_and_bullets:
+            reach["gun"] = self._gun_cells(board)
+        if self.has_rpg_and_rocket:
+            reach["rocket"] = self._rocket_cells(board)
+
+        for weapon, cells in reach.items():
+            reach[weapon] = {c for c in cells if not board.get_cell(*c).is_building()}
+        return reach
+
+    def attackable_targets(self, board, players) -> Dict[str, List["Player"]]:
+        """
+        Opponents (everyone in `players` but self) each weapon can hit,
+        in `players` order.
+        """
+        reach = self.attack_reach(board)
+        targets: Dict[str, List[Player]] = {weapon: [] for weapon in reach}
+        for other in players:
+            if other is self:
+                continue
+            position = (other.x, other.y)
+            for weapon, cells in reach.items():
+                if position in cells:
+                    targets[weapon].append(other)
+        return targets
+
+    def _h2h_cells(self, board) -> Set[Tuple[int, int]]:
+        h2h = BALANCE["h2h"]
+        cells: Set[Tuple[int, int]] = set()
+        for mode in ("walk", "swim"):
+            action_points = h2h[f"{mode}_ap"]
+            if action_points == 0:
+                cells.add((self.x, self.y))
+            else:
+                cells.update(self.reachable_cells(board, mode, action_points))
+
+        if h2h["stance_ap"] == 0:
+            cells.add((self.x, self.y))
+        elif h2h["stance_ap"] > 0:
+            start = board.get_cell(self.x, self.y)
+            for nx, ny in board.neighbors(self.x, self.y):
+                dest = board.get_cell(nx, ny)
+                if (start.is_shore() and dest.is_sea()) or (start.is_sea() and dest.is_shore()):
+                    cells.add((nx, ny))
+        return cells
+
+    def _gun_cells(self, board) -> Set[Tuple[int, int]]:
+        cells = {(self.x, self.y)}
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            for d in range(1, BALANCE["gun"]["range"] + 1):
+                x, y = self.x + dx * d, self.y + dy * d
+                if not board.is_in_bounds(x, y):
+                    break
+                cells.add((x, y))
+                cell = board.get_cell(x, y)
+                if cell.is_building() or cell.is_forest():
+                    break
+        return cells
+
+    def _rocket_cells(self, board) -> Set[Tuple[int, int]]:
+        """
+        Sweep the three lanes each way along both axes. A target at
+        distance d is blocked by a building on scanned cells 1..d-1 or a
+        forest on 1..d-2 (forest is allowed on the last scanned cell).
+        """
+        min_range = BALANCE["rocket"]["min_range"]
+        max_range = BALANCE["rocket"]["max_range"]
+        cells: Set[Tuple[int, int]] = set()
+
+        for (ax, ay), (px, py), first in (
+            ((0, 1), (1, 0), min_range),
+            ((0, -1), (1, 0), min_range),
+            # |dx| <= 1 always counts as a y-axis shot
+            ((1, 0), (0, 1), max(min_range, 2)),
+            ((-1, 0), (0, 1), max(min_range, 2)),
+        ):
+            for lane in (-1, 0, 1):
+                ox, oy = self.x + px * lane, self.y + py * lane
+                building_before = forest_before = last_forest = False
+                for d in range(1, max_range + 1):
+                    x, y = ox + ax * d, oy + ay * d
+                    if not board.is_in_bounds(x, y):
+                        break
+                    if d >= first:
+                        cells.add((x, y))
+
+                    cell = board.get_cell(x, y)
+                    forest_before = forest_before or last_forest
+                    last_forest = cell.is_forest()
+                    building_before = building_before or cell.is_building()
+                    if building_before or forest_before:
+                        break
+        return cells
+
     # =================================================
     # Transport
     # =================================================
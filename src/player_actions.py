@@ -1,144 +1,231 @@
-from constants import BUILDING_TYPE
+from enum import IntFlag
+from functools import lru_cache
+
+from constants import BUILDING_TYPE, GUN_KIT, ROCKET_KIT
+
+
+class ActionFlag(IntFlag):
+    """
+    One bit per action, in the order possible_actions lists them.
+    """
+    SPAWN = 1 << 0
+    ATTACK_HAND_TO_HAND = 1 << 1
+    PRINT_HOME_INVENTORY = 1 << 2
+    PRINT_CURRENT_INVENTORY = 1 << 3
+    PRINT_CURRENT_CELL = 1 << 4
+    PRINT_PART_LOCATION = 1 << 5
+    PRINT_OTHER_PLAYER_LOCATIONS = 1 << 6
+    PICKUP_PART = 1 << 7
+    PICKUP_HELICOPTER_PART = 1 << 8
+    HEAL = 1 << 9
+    WORK = 1 << 10
+    RENT_CAR = 1 << 11
+    BUY_TRAIN_TICKET = 1 << 12
+    RENT_BOAT = 1 << 13
+    BUY_GUNS = 1 << 14
+    WIN_GAME = 1 << 15
+    SAIL_ON_BOAT = 1 << 16
+    DISEMBARK = 1 << 17
+    SWIM = 1 << 18
+    CLIMB_ASHORE = 1 << 19
+    JUMP_INTO_SEA = 1 << 20
+    DRIVE = 1 << 21
+    EXIT_CAR = 1 << 22
+    EXIT_TRAIN = 1 << 23
+    RIDE_TRAIN = 1 << 24
+    WALK = 1 << 25
+    GUN_ATTACK = 1 << 26
+    ROCKET_ATTACK = 1 << 27
+    BUILD_HOME = 1 << 28
+    INVENTORY = 1 << 29
+
+
+def _action_name(flag: ActionFlag) -> str:
+    return flag.name.lower().replace("_", " ").replace("hand to hand", "hand-to-hand")
+
+
+ACTION_NAMES = {flag: _action_name(flag) for flag in ActionFlag}
+
+ALWAYS = int(
+    ActionFlag.ATTACK_HAND_TO_HAND
+    | ActionFlag.PRINT_HOME_INVENTORY
+    | ActionFlag.PRINT_CURRENT_INVENTORY
+    | ActionFlag.PRINT_CURRENT_CELL
+    | ActionFlag.PRINT_PART_LOCATION
+    | ActionFlag.PRINT_OTHER_PLAYER_LOCATIONS
+)
+
+# Actions that need something of the cell (see cell_action_mask) ...
+CELL_GATED = int(
+    ActionFlag.HEAL | ActionFlag.WORK | ActionFlag.RENT_CAR
+    | ActionFlag.BUY_TRAIN_TICKET | ActionFlag.RENT_BOAT | ActionFlag.BUY_GUNS
+    | ActionFlag.WIN_GAME | ActionFlag.DISEMBARK | ActionFlag.CLIMB_ASHORE
+    | ActionFlag.JUMP_INTO_SEA | ActionFlag.DRIVE | ActionFlag.EXIT_CAR
+    | ActionFlag.RIDE_TRAIN | ActionFlag.BUILD_HOME
+)
+
+# ... and of the player (see player_state_mask); an action is possible
+# when both its cell and its player conditions hold.
+PLAYER_GATED = int(
+    ActionFlag.HEAL | ActionFlag.WIN_GAME
+    | ActionFlag.SAIL_ON_BOAT | ActionFlag.DISEMBARK
+    | ActionFlag.SWIM | ActionFlag.CLIMB_ASHORE
+    | ActionFlag.DRIVE | ActionFlag.EXIT_CAR
+    | ActionFlag.EXIT_TRAIN | ActionFlag.RIDE_TRAIN | ActionFlag.WALK
+    | ActionFlag.GUN_ATTACK | ActionFlag.ROCKET_ATTACK | ActionFlag.BUILD_HOME
+)
+
+# Plain-int bits for the per-call paths (IntFlag arithmetic is slow)
+_HEAL = int(ActionFlag.HEAL)
+_WIN_GAME = int(ActionFlag.WIN_GAME)
+_ON_BOAT = int(ActionFlag.SAIL_ON_BOAT | ActionFlag.DISEMBARK)
+_ON_WATER = int(ActionFlag.SWIM | ActionFlag.CLIMB_ASHORE)
+_ON_CAR = int(ActionFlag.DRIVE | ActionFlag.EXIT_CAR)
+_RIDE_TRAIN = int(ActionFlag.RIDE_TRAIN)
+_EXIT_TRAIN = int(ActionFlag.EXIT_TRAIN)
+_WALK = int(ActionFlag.WALK)
+_GUN_ATTACK = int(ActionFlag.GUN_ATTACK)
+_ROCKET_ATTACK = int(ActionFlag.ROCKET_ATTACK)
+_BUILD_HOME = int(ActionFlag.BUILD_HOME)
+_PICKUP_PART = int(ActionFlag.PICKUP_PART)
+_PICKUP_HELICOPTER_PART = int(ActionFlag.PICKUP_HELICOPTER_PART)
+_INVENTORY = int(ActionFlag.INVENTORY)
+_CELL_FREE = ~CELL_GATED
+_PLAYER_FREE = ~PLAYER_GATED
+_GATED = CELL_GATED | PLAYER_GATED
+
+BUILDING_ACTIONS = {
+    BUILDING_TYPE["hospital"]: ActionFlag.HEAL,
+    BUILDING_TYPE["bank"]: ActionFlag.WORK,
+    BUILDING_TYPE["car_rental"]: ActionFlag.RENT_CAR,
+    BUILDING_TYPE["train_station"]: ActionFlag.BUY_TRAIN_TICKET,
+    BUILDING_TYPE["boat_rental"]: ActionFlag.RENT_BOAT,
+    BUILDING_TYPE["shop"]: ActionFlag.BUY_GUNS,
+    BUILDING_TYPE["airport"]: ActionFlag.WIN_GAME,
+}
+
+
+def cell_action_mask(board, x: int, y: int) -> int:
+    """
+    CELL_GATED actions the cell at (x, y) allows. Depends on terrain
+    only, so boards cache it per cell (GameBoard.action_masks).
+    """
+    cell = board.get_cell(x, y)
+    mask = BUILDING_ACTIONS.get(cell.get_building_type(), 0)
+
+    if any(not board.get_cell(nx, ny).is_water() for nx, ny in board.neighbors(x, y)):
+        mask |= ActionFlag.DISEMBARK | ActionFlag.CLIMB_ASHORE
+    if cell.is_shore():
+        mask |= ActionFlag.JUMP_INTO_SEA
+    if cell.is_road():
+        mask |= ActionFlag.DRIVE | ActionFlag.EXIT_CAR
+    if cell.is_railroad():
+        mask |= ActionFlag.RIDE_TRAIN
+    if cell.is_buildable():
+        mask |= ActionFlag.BUILD_HOME
+    return int(mask)
+
+
+def player_state_mask(player, cell_mask: int = CELL_GATED) -> int:
+    """
+    PLAYER_GATED actions the player's state allows. Conditions whose
+    cell bit is missing from `cell_mask` are skipped.
+    """
+    mask = 0
+    if cell_mask & _HEAL and player.wound > 0:
+        mask |= _HEAL
+    if cell_mask & _WIN_GAME:
+        colours = getattr(player, "distinct_part_colours", None)
+        if colours is None:
+            colours = len(set(player.parts))
+        if colours >= 3:
+            mask |= _WIN_GAME
+
+    if player.on_boat:
+        mask |= _ON_BOAT
+    elif player.on_water:
+        mask |= _ON_WATER
+    if player.on_car:
+        mask |= _ON_CAR
+    if player.on_train:
+        mask |= _RIDE_TRAIN
+        if player.on_land:
+            mask |= _EXIT_TRAIN
+    if player.on_land:
+        mask |= _WALK
+
+    gun = getattr(player, "has_gun_and_bullets", None)
+    if gun is None:
+        gun = all(item in player.weapons for item in GUN_KIT)
+    rocket = getattr(player, "has_rpg_and_rocket", None)
+    if rocket is None:
+        rocket = all(item in player.weapons for item in ROCKET_KIT)
+    if gun:
+        mask |= _GUN_ATTACK
+    if rocket:
+        mask |= _ROCKET_ATTACK
+    if player.home == (-1, -1):
+        mask |= _BUILD_HOME
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def action_names(flags: int) -> tuple[str, ...]:
+    """
+    Action strings of `flags`, in possible_actions order.
+    """
+    return tuple(name for flag, name in ACTION_NAMES.items() if flags & flag)
+
+
+@lru_cache(maxsize=1024)
+def _as_flag(flags: int) -> ActionFlag:
+    return ActionFlag(flags)
 
 
 class PlayerActionProvider:
     @staticmethod
-    def possible_actions(player, board, helicopter_part=None) -> list[str]:
-        actions: list[str] = []
-
+    def action_flags(player, board, helicopter_part=None) -> ActionFlag:
+        """
+        possible_actions as an ActionFlag set: the cached cell mask of
+        the player's cell combined with the player's state mask.
+        """
         if not player.is_spawned(board):
-            actions.append("spawn")
-            return actions
-
-        cell = board.get_cell(player.x, player.y)
-        btype = cell.get_building_type()
-
-        # ----------------------------------------
-        # Helpers
-        # ----------------------------------------
-
-        def has_adjacent_land() -> bool:
-            for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-                nx, ny = player.x + dx, player.y + dy
-                if 0 <= nx < board.WIDTH and 0 <= ny < board.HEIGHT:
-                    if not board.get_cell(nx, ny).is_water():
-                        return True
-            return False
-
-        def part_on_current_cell() -> bool:
-            if hasattr(board, "has_part_at") and callable(board.has_part_at):
-                return bool(board.has_part_at(player.x, player.y))
-
-            if hasattr(board, "parts_at"):
-                try:
-                    return bool(board.parts_at.get((player.x, player.y)))
-                except Exception:
-                    return False
-
-            return False
-
-        # ----------------------------------------
-        # Always available
-        # ----------------------------------------
-
-        actions.append("attack hand-to-hand")
-        actions.append("print home inventory")
-        actions.append("print current inventory")
-        actions.append("print current cell")
-        actions.append("print part location")
-        actions.append("print other player locations")
-
-        # ----------------------------------------
-        # Pickup
-        # ----------------------------------------
-
-        if part_on_current_cell():
-            actions.append("pickup part")
-
-        if helicopter_part is not None:
-            actions.append("pickup helicopter part")
-
-        # ----------------------------------------
-        # Building-based actions (SWAPPED)
-        # ----------------------------------------
-
-        if btype == BUILDING_TYPE["hospital"] and player.wound > 0:
-            actions.append("heal")
-
-        if btype == BUILDING_TYPE["bank"]:
-            actions.append("work")
-
-        if btype == BUILDING_TYPE["car_rental"]:
-            actions.append("rent car")
-
-        if btype == BUILDING_TYPE["train_station"]:
-            actions.append("buy train ticket")
-
-        if btype == BUILDING_TYPE["boat_rental"]:
-            actions.append("rent boat")
-
-        if btype == BUILDING_TYPE["shop"]:
-            actions.append("buy guns")
-
-        if btype == BUILDING_TYPE["airport"] and len(set(player.parts)) >= 3:
-            actions.append("win game")
-
-        # ----------------------------------------
-        # Boat / water / shore
-        # ----------------------------------------
+            return ActionFlag.SPAWN
 
-        if player.on_boat:
-            actions.append("sail on boat")
-            if has_adjacent_land():
-                actions.append("disembark")
+        x, y = player.x, player.y
+        if hasattr(board, "action_masks"):
+            cell_mask = board.action_masks()[y * board.WIDTH + x]
+        else:
+            cell_mask = cell_action_mask(board, x, y)
 
-        if player.on_water and not player.on_boat:
-            actions.append("swim")
-            if has_adjacent_land():
-                actions.append("climb ashore")
+        flags = ALWAYS | (
+            (cell_mask | _CELL_FREE) & (player_state_mask(player, cell_mask) | _PLAYER_FREE) & _GATED
+        )
 
-        if cell.is_shore():
-            actions.append("jump into sea")
-
-        # ----------------------------------------
-        # Vehicles
-        # ----------------------------------------
-
-        if player.on_car and cell.is_road():
-            actions.append("drive")
-            actions.append("exit car")
-
-        if player.on_train and player.on_land:
-            actions.append("exit train")
-
-        if player.on_train and cell.is_railroad():
-            actions.append("ride train")
-
-        # ----------------------------------------
-        # Movement
-        # ----------------------------------------
-
-        if player.on_land:
-            actions.append("walk")
-
-        # ----------------------------------------
-        # Combat
-        # ----------------------------------------
-
-        if ("gun" in player.weapons) and ("bullets" in player.weapons):
-            actions.append("gun attack")
-
-        if ("RPG" in player.weapons) and ("rocket" in player.weapons):
-            actions.append("rocket attack")
+        if PlayerActionProvider._part_on_cell(board, x, y):
+            flags |= _PICKUP_PART
+        if helicopter_part is not None:
+            flags |= _PICKUP_HELICOPTER_PART
+        if player.home == (x, y):
+            flags |= _INVENTORY
+        return _as_flag(flags)
 
-        # ----------------------------------------
-        # Home
-        # ----------------------------------------
+    @staticmethod
+    def _part_on_cell(board, x: int, y: int) -> bool:
+        if hasattr(board, "has_part_at") and callable(board.has_part_at):
+            return bool(board.has_part_at(x, y))
 
-        if player.home == (-1, -1) and cell.is_buildable():
-            actions.append("build home")
+        if hasattr(board, "parts_at"):
+            try:
+                return bool(board.parts_at.get((x, y)))
+            except Exception:
+                return False
 
-        if player.home == (player.x, player.y):
-            actions.append("inventory")
+        return False
 
-        return actions
+    @staticmethod
+    def possible_actions(player, board, helicopter_part=None) -> list[str]:
+        """
+        String form of action_flags, kept for existing callers.
+        """
+        return list(action_names(PlayerActionProvider.action_flags(player, board, helicopter_part)))
@@ -0,0 +1,248 @@
+from array import array
+from itertools import compress
+from typing import Iterable, List, Optional
+from weakref import ref
+
+# Typed columns: name -> array typecode. A value the typecode can't hold
+# (e.g. x=1.5) turns the column into a plain list, see PlayerTable.store
+INT_COLUMNS = {
+    "x": "i",
+    "y": "i",
+    "wound": "i",
+    "money": "q",
+    "home_x": "i",
+    "home_y": "i",
+    "home_money": "q",
+}
+
+# One 0/1 byte per row
+FLAG_COLUMNS = (
+    "on_land", "on_water", "on_car", "on_boat", "on_train",
+    # Derived from weapons, see Player._weapons_changed
+    "has_gun_and_bullets", "has_rpg_and_rocket",
+)
+
+# Python objects per row; inventories and snapshot caches are created
+# on first use. `player` holds a weak reference to the row's Player, so
+# a table never keeps its players alive.
+OBJECT_COLUMNS = (
+    "weapons", "parts", "inventory",
+    "home_weapons", "home_parts", "home_inventory",
+    "spatial_index", "player", "snapshots",
+)
+
+# Columns whose empty value is 0
+_ZERO_COLUMNS = (*INT_COLUMNS, *FLAG_COLUMNS)
+
+# Player.snapshot section -> key -> fields the key's value depends on
+SNAPSHOT_FIELDS = {
+    "state": {
+        "x": ("x",),
+        "y": ("y",),
+        "wound": ("wound",),
+        "has_home": ("home",),
+        "home": ("home",),
+    },
+    "status": {
+        flag: (flag,)
+        for flag in ("on_land", "on_water", "on_car", "on_boat", "on_train")
+    },
+    "carried_inventory": {
+        "money": ("money",),
+        "weapons": ("weapons",),
+        "parts": ("parts",),
+        "inventory": ("inventory",),
+    },
+    "home_inventory": {
+        "is_at_home": ("x", "y", "home"),
+        "home_money": ("home_money",),
+        "weapons": ("home_weapons",),
+        "parts": ("home_parts",),
+        "inventory": ("home_inventory",),
+    },
+}
+
+# Snapshot section -> every field it shows, and the reverse
+SECTION_FIELDS = {
+    section: frozenset(field for fields in keys.values() for field in fields)
+    for section, keys in SNAPSHOT_FIELDS.items()
+}
+FIELD_SECTIONS = {
+    field: frozenset(s for s, fields in SECTION_FIELDS.items() if field in fields)
+    for field in frozenset().union(*SECTION_FIELDS.values())
+}
+
+
+def _rebuilt(column, values: list):
+    # Same column kind as `column` unless the typecode can't hold values
+    if isinstance(column, array):
+        try:
+            return array(column.typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return values
+
+
+class PlayerTable:
+    """
+    Structure-of-arrays player store: one typed array per numeric field
+    and one bytearray per flag, so whole-lobby scans and batch updates
+    touch contiguous memory. Player objects are row proxies over a
+    table (see Player.__init__ `table`); a row is released for reuse
+    when its Player is garbage collected, or by release_row.
+    """
+
+    def __init__(self):
+        for name, typecode in INT_COLUMNS.items():
+            setattr(self, name, array(typecode))
+        for name in FLAG_COLUMNS:
+            setattr(self, name, bytearray())
+        for name in OBJECT_COLUMNS:
+            setattr(self, name, [])
+        self.distinct_part_colours = array("H")
+
+        # Change tracking: every write to a field stamps the row's
+        # versions[field] (and row_version) with the next clock value
+        self.clock = 0
+        self.versions = {field: array("Q") for field in FIELD_SECTIONS}
+        self.row_version = array("Q")
+
+        # Released rows, reused by append_row
+        self.free_rows: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.player)
+
+    def append_row(self, player) -> int:
+        # A new row counts as a change to every field
+        self.clock += 1
+        if self.free_rows:
+            row = self.free_rows.pop()
+            for versions in self.versions.values():
+                versions[row] = self.clock
+            self.row_version[row] = self.clock
+        else:
+            columns = self.__dict__
+            for name in _ZERO_COLUMNS:
+                columns[name].append(0)
+            for name in OBJECT_COLUMNS:
+                columns[name].append(None)
+            self.distinct_part_colours.append(0)
+            for versions in self.versions.values():
+                versions.append(self.clock)
+            self.row_version.append(self.clock)
+            row = len(self.player) - 1
+
+        self.player[row] = ref(player)
+        return row
+
+    def release_row(self, row: int, owner=None) -> None:
+        """
+        Clear `row` and hand it to the next append_row. The Player on it
+        must not be used afterwards. With `owner`, the row is only
+        released while that player still holds it (Player.__del__).
+        """
+        link = self.player[row]
+        if link is None or (owner is not None and link() is not owner):
+            return
+        columns = self.__dict__
+        for name in _ZERO_COLUMNS:
+            columns[name][row] = 0
+        for name in OBJECT_COLUMNS:
+            columns[name][row] = None
+        self.distinct_part_colours[row] = 0
+        self.free_rows.append(row)
+
+    def store(self, name: str, row: int, value) -> None:
+        """
+        Write `value` to typed column `name`; values the typecode can't
+        hold (floats, huge ints) turn the column into a plain list.
+        """
+        column = getattr(self, name)
+        try:
+            column[row] = value
+        except (TypeError, OverflowError):
+            column = list(column)
+            column[row] = value
+            setattr(self, name, column)
+
+    def touch(self, row: int, field: str) -> None:
+        """
+        Record a change to `field` of `row` and drop the cached
+        snapshot sections that show it.
+        """
+        self.clock += 1
+        self.versions[field][row] = self.clock
+        self.row_version[row] = self.clock
+        cache = self.snapshots[row]
+        if cache:
+            for section in FIELD_SECTIONS[field]:
+                cache.pop(section, None)
+
+    # -------------------------------------------------
+    # Batch queries
+    # -------------------------------------------------
+
+    def rows_where(self, flag: str) -> List[int]:
+        """
+        Rows whose `flag` column is set, e.g. rows_where("on_water").
+        """
+        if flag not in FLAG_COLUMNS:
+            raise ValueError(f"Unknown flag column: {flag!r}")
+        return list(compress(range(len(self)), getattr(self, flag)))
+
+    def players_where(self, flag: str) -> list:
+        return [self.player[row]() for row in self.rows_where(flag)]
+
+    # -------------------------------------------------
+    # Batch updates
+    # -------------------------------------------------
+
+    def translate(self, dx: int, dy: int, rows: Optional[Iterable[int]] = None) -> None:
+        """
+        Move the given rows (all when None) by (dx, dy); tracked players'
+        spatial indexes are updated.
+        """
+        xs, ys = self.x, self.y
+        if rows is None:
+            rows = range(len(self))
+            if dx:
+                self.x = _rebuilt(xs, [v + dx for v in xs])
+            if dy:
+                self.y = _rebuilt(ys, [v + dy for v in ys])
+        else:
+            rows = list(rows)
+            for row in rows:
+                self.store("x", row, self.x[row] + dx)
+                self.store("y", row, self.y[row] + dy)
+        self._moved(rows, ("x",) * bool(dx) + ("y",) * bool(dy))
+
+    def set_positions(self, rows: Iterable[int], positions: Iterable[tuple]) -> None:
+        rows = list(rows)
+        for row, (x, y) in zip(rows, positions):
+            self.store("x", row, x)
+            self.store("y", row, y)
+        self._moved(rows, ("x", "y"))
+
+    def _moved(self, rows: Iterable[int], fields) -> None:
+        indexes = self.spatial_index
+        for row in rows:
+            for field in fields:
+                self.touch(row, field)
+            index = indexes[row]
+            if index is not None:
+                index.move(self.player[row](), self.x[row], self.y[row])
+
+    def apply_damage(self, rows: Iterable[int], damage: int = 1) -> None:
+        """
+        Player.apply_damage(damage) for every row.
+        """
+        wounds = self.wound
+        for row in rows:
+            if damage > 0 and wounds[row] == 0:
+                wounds[row] += damage
+            elif damage <= 0 and wounds[row] > 0:
+                wounds[row] -= 1
+            else:
+                continue
+            self.touch(row, "wound")
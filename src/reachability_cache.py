@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class ReachabilityCache:
+    """
+    LRU cache of BFS results.
+
+    Keys are (board generation, mode, start, action points); because the
+    generation changes whenever terrain changes, stale entries are never
+    returned and simply age out. maxsize=0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        # Keys looked up once and answered without caching, see probe
+        self._probed: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, value) -> None:
+        if self.maxsize == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def probe(self, key: Hashable) -> bool:
+        """
+        Record a miss on `key` that the caller answered without storing
+        a result. True when the key was already probed, i.e. it is being
+        asked for again and is worth computing in full and storing.
+        """
+        if key in self._probed:
+            del self._probed[key]
+            return True
+        if self.maxsize:
+            self._probed[key] = None
+            while len(self._probed) > self.maxsize:
+                self._probed.popitem(last=False)
+        return False
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+        while len(self._probed) > maxsize:
+            self._probed.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._probed.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,168 @@
+from fractions import Fraction
+from math import lcm
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from bitboard import to_layer
+from constants import BALANCE
+
+
+Coord = Tuple[int, int]
+
+# Movement states of the layered graph
+WALK, SWIM = 0, 1
+
+# Move kind -> BALANCE["h2h"] key with the number of such moves per action
+MOVE_BUDGETS = {
+    "walk": "walk_ap",
+    "swim": "swim_ap",
+    "stance": "stance_ap",
+}
+
+
+class Route(NamedTuple):
+    path: List[Coord]
+    moves: List[str]
+    cost: Fraction
+    breakdown: Dict[str, int]
+
+
+class RoutePlanner:
+    """
+    Cheapest hand-to-hand route between two cells, mixing walking,
+    swimming and stance changes (shore <-> sea).
+
+    The search runs on a (cell x {walk, swim}) graph. An h2h action
+    buys walk_ap walk steps, swim_ap swim steps or stance_ap stance
+    changes, so each move costs 1 / <budget> of an action; costs are
+    scaled to integers and the graph is searched with A* (Manhattan
+    heuristic) over a bucket queue. Route.cost is in h2h actions.
+
+    Terrain tables are taken from the board's bitboards and rebuilt
+    only when board.generation changes.
+    """
+
+    def __init__(self, board, balance: Optional[Mapping[str, int]] = None):
+        balance = BALANCE["h2h"] if balance is None else balance
+        budgets = {move: balance[key] for move, key in MOVE_BUDGETS.items()}
+        if any(not isinstance(b, int) or b <= 0 for b in budgets.values()):
+            raise ValueError(f"Move budgets must be positive integers: {budgets}")
+
+        self.board = board
+        self.unit = lcm(*budgets.values())
+        self.step_costs = {move: self.unit // b for move, b in budgets.items()}
+        self._tables = None
+
+    def _terrain(self):
+        generation = self.board.generation
+        if self._tables is not None and self._tables[0] == generation:
+            return self._tables[1:]
+
+        board = self.board
+        size = board.WIDTH * board.HEIGHT
+        tables = (
+            generation,
+            to_layer(board.network_mask("walkable"), size),
+            to_layer(board.network_mask("sea"), size),
+            to_layer(board.mask("shore"), size),
+            board.adjacency(),
+        )
+        self._tables = tables
+        return tables[1:]
+
+    def plan(self, start: Coord, target: Coord, *, max_cost=None) -> Optional[Route]:
+        """
+        Cheapest route from start to target, or None when there is none
+        (or when it would cost more than max_cost h2h actions).
+        """
+        board = self.board
+        if not (board.is_in_bounds(*start) and board.is_in_bounds(*target)):
+            return None
+
+        walk, sea, shore, adjacency = self._terrain()
+        width = board.WIDTH
+        source = start[1] * width + start[0]
+        goal = target[1] * width + target[0]
+        tx, ty = target
+
+        states = [2 * source + s for s, ok in ((WALK, walk[source]), (SWIM, sea[source])) if ok]
+        if not states:
+            return None
+        if source == goal:
+            return Route([start], [], Fraction(0), {move: 0 for move in MOVE_BUDGETS})
+
+        limit = None if max_cost is None else int(max_cost * self.unit)
+        walk_cost = self.step_costs["walk"]
+        swim_cost = self.step_costs["swim"]
+        stance_cost = self.step_costs["stance"]
+        min_step = min(self.step_costs.values())
+
+        # f = g + h grows by at most (step + min_step) per edge
+        span = 2 * max(self.step_costs.values()) + 1
+        buckets: List[List[int]] = [[] for _ in range(span)]
+        best: Dict[int, int] = {}
+        parent: Dict[int, int] = {}
+
+        h0 = (abs(start[0] - tx) + abs(start[1] - ty)) * min_step
+        for state in states:
+            best[state] = 0
+            parent[state] = -1
+            buckets[h0 % span].append(state)
+        pending = len(states)
+
+        f = h0
+        while pending:
+            bucket = buckets[f % span]
+            while bucket:
+                state = bucket.pop()
+                pending -= 1
+                i = state >> 1
+                g = best[state]
+                if g + (abs(i % width - tx) + abs(i // width - ty)) * min_step != f:
+                    continue  # superseded by a cheaper entry
+                if i == goal:
+                    return self._route(parent, state)
+
+                if state & 1:
+                    moves = ((swim_cost, sea, SWIM), (stance_cost, shore, WALK))
+                elif shore[i]:
+                    moves = ((walk_cost, walk, WALK), (stance_cost, sea, SWIM))
+                else:
+                    moves = ((walk_cost, walk, WALK),)
+
+                for cost, allowed, layer in moves:
+                    ng = g + cost
+                    if limit is not None and ng > limit:
+                        continue
+                    for j in adjacency[i]:
+                        if not allowed[j]:
+                            continue
+                        nxt = 2 * j + layer
+                        if ng >= best.get(nxt, ng + 1):
+                            continue
+                        best[nxt] = ng
+                        parent[nxt] = state
+                        nf = ng + (abs(j % width - tx) + abs(j // width - ty)) * min_step
+                        buckets[nf % span].append(nxt)
+                        pending += 1
+            f += 1
+        return None
+
+    def _route(self, parent: Dict[int, int], state: int) -> Route:
+        width = self.board.WIDTH
+        chain = []
+        while state != -1:
+            chain.append(state)
+            state = parent[state]
+        chain.reverse()
+
+        path = [((s >> 1) % width, (s >> 1) // width) for s in chain]
+        moves = []
+        for prev, cur in zip(chain, chain[1:]):
+            if (prev ^ cur) & 1:
+                moves.append("stance")
+            else:
+                moves.append("swim" if cur & 1 else "walk")
+
+        breakdown = {move: moves.count(move) for move in MOVE_BUDGETS}
+        units = sum(self.step_costs[move] * n for move, n in breakdown.items())
+        return Route(path, moves, Fraction(units, self.unit), breakdown)
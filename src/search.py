@@ -0,0 +1,133 @@
+"""
+Point-to-point search strategies for movement checks.
+
+Every strategy answers "is `target` reachable from `start` through
+`passable` cells within `max_cost` unit steps?" and reports how many
+nodes it expanded, so strategies can be compared on the same query.
+Both endpoints are assumed to be passable (the callers check that).
+"""
+
+import heapq
+from collections import deque
+from typing import Callable, Dict, NamedTuple, Tuple
+
+
+Coord = Tuple[int, int]
+
+
+class SearchResult(NamedTuple):
+    found: bool
+    expanded: int
+
+
+def manhattan(a: Coord, b: Coord) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def bfs_search(board, start: Coord, target: Coord, max_cost: int, passable) -> SearchResult:
+    """
+    Plain breadth-first search, the reference strategy.
+    """
+    if start == target:
+        return SearchResult(True, 0)
+
+    dist = {start: 0}
+    q = deque([start])
+    expanded = 0
+    while q:
+        node = q.popleft()
+        d = dist[node]
+        if d == max_cost:
+            continue
+        expanded += 1
+        for n in board.neighbors(*node):
+            if n in dist or not passable(board.get_cell(*n)):
+                continue
+            if n == target:
+                return SearchResult(True, expanded)
+            dist[n] = d + 1
+            q.append(n)
+    return SearchResult(False, expanded)
+
+
+def astar_search(board, start: Coord, target: Coord, max_cost: int, passable) -> SearchResult:
+    """
+    A* with the Manhattan heuristic (admissible on the 4-neighbour grid);
+    nodes whose lower bound exceeds max_cost are never expanded.
+    """
+    if start == target:
+        return SearchResult(True, 0)
+    if manhattan(start, target) > max_cost:
+        return SearchResult(False, 0)
+
+    best = {start: 0}
+    heap = [(manhattan(start, target), 0, start)]
+    expanded = 0
+    while heap:
+        f, g, node = heapq.heappop(heap)
+        if g > best.get(node, g):
+            continue
+        if node == target:
+            return SearchResult(True, expanded)
+        expanded += 1
+        for n in board.neighbors(*node):
+            ng = g + 1
+            if ng >= best.get(n, ng + 1):
+                continue
+            nf = ng + manhattan(n, target)
+            if nf > max_cost or not passable(board.get_cell(*n)):
+                continue
+            best[n] = ng
+            heapq.heappush(heap, (nf, ng, n))
+    return SearchResult(False, expanded)
+
+
+def bidirectional_search(board, start: Coord, target: Coord, max_cost: int, passable) -> SearchResult:
+    """
+    BFS from both ends, always growing the smaller frontier by one full
+    layer; stops once the two depths together exceed max_cost.
+    """
+    if start == target:
+        return SearchResult(True, 0)
+
+    dist: Tuple[Dict[Coord, int], Dict[Coord, int]] = ({start: 0}, {target: 0})
+    frontiers = [[start], [target]]
+    depths = [0, 0]
+    expanded = 0
+
+    while frontiers[0] and frontiers[1] and depths[0] + depths[1] < max_cost:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = dist[side], dist[1 - side]
+        depth = depths[side] + 1
+
+        best = None
+        next_frontier = []
+        for node in frontiers[side]:
+            expanded += 1
+            for n in board.neighbors(*node):
+                if n in mine:
+                    continue
+                if n in other:
+                    total = depth + other[n]
+                    if best is None or total < best:
+                        best = total
+                    continue
+                if not passable(board.get_cell(*n)):
+                    continue
+                mine[n] = depth
+                next_frontier.append(n)
+
+        if best is not None:
+            return SearchResult(best <= max_cost, expanded)
+
+        frontiers[side] = next_frontier
+        depths[side] = depth
+
+    return SearchResult(False, expanded)
+
+
+SEARCH_STRATEGIES: Dict[str, Callable[..., SearchResult]] = {
+    "bfs": bfs_search,
+    "astar": astar_search,
+    "bidirectional": bidirectional_search,
+}
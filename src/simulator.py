@@ -0,0 +1,447 @@
+"""
+Monte Carlo match simulator.
+
+    python simulator.py [--matches N] [--players P] [--workers W]
+                        [--chunk C] [--max-turns T] [--gun-range R ...]
+
+The board is parsed once and its layers are copied into a shared memory
+block; every worker process attaches to it, takes a private copy of the
+few kilobytes of terrain and keeps one warm GameBoard (and its caches)
+for all the matches it plays. Work goes out in chunks of seeds and
+results stream back chunk by chunk into MatchStats.
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from board_binary import BINARY_LAYERS
+from board_layers import BoardLayers
+from constants import BALANCE
+from game_board import EDITABLE_LAYERS, GameBoard
+from game_engine import ATTACKS, MOVES, GameEngine, Intent
+
+
+class WorkUnit(NamedTuple):
+    """
+    A chunk of matches played with the same settings, one per seed.
+    `overrides` is merged into BALANCE section by section, e.g.
+    {"gun": {"range": 8}}; `label` groups the results in MatchStats.
+    """
+    seeds: range
+    players: int = 2
+    max_turns: int = 200
+    overrides: Optional[dict] = None
+    label: str = ""
+
+
+class MatchResult(NamedTuple):
+    seed: int
+    label: str
+    # Player id of the winner, None for a draw at max_turns
+    winner: Optional[int]
+    turns: int
+    eliminated: int
+    seconds: float
+
+
+# =================================================
+# Shared board
+# =================================================
+
+class SharedBoard:
+    """
+    Board layers in one shared memory block, in the binary board file
+    layer order (board_binary.BINARY_LAYERS).
+    """
+
+    def __init__(self, layers: BoardLayers):
+        size = layers.size
+        self.width = layers.width
+        self.height = layers.height
+        self.shm = shared_memory.SharedMemory(create=True, size=size * len(BINARY_LAYERS))
+        for k, name in enumerate(BINARY_LAYERS):
+            self.shm.buf[k * size:(k + 1) * size] = bytes(layers.layer(name))
+
+    @property
+    def spec(self) -> Tuple[str, int, int]:
+        """
+        What a worker needs to attach (see attach_layers).
+        """
+        return self.shm.name, self.width, self.height
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> "SharedBoard":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_layers(spec: Tuple[str, int, int]) -> Tuple[shared_memory.SharedMemory, BoardLayers]:
+    """
+    Attach to a SharedBoard; the layers view the shared block, so keep
+    the returned SharedMemory alive while they are in use.
+    """
+    name, width, height = spec
+    shm = shared_memory.SharedMemory(name=name)
+    size = width * height
+    buffers = {
+        layer: shm.buf[k * size:(k + 1) * size]
+        for k, layer in enumerate(BINARY_LAYERS)
+    }
+    return shm, BoardLayers(width, height, buffers)
+
+
+class _Worker:
+    """
+    Per-process state: the shared layers (read only) and one board over
+    a private copy of them, reset to the shared terrain between matches.
+    """
+
+    def __init__(self, spec: Tuple[str, int, int]):
+        self.shm, self.shared = attach_layers(spec)
+        private = {name: bytearray(self.shared.layer(name)) for name in BINARY_LAYERS}
+        self.board = GameBoard(None, layers=BoardLayers(self.shared.width, self.shared.height, private))
+
+    def reset_board(self) -> None:
+        """
+        Undo terrain edits of the last match (e.g. built homes) through
+        set_terrain, so the board's caches follow.
+        """
+        board, shared, width = self.board, self.shared, self.shared.width
+        restored = False
+        for name in EDITABLE_LAYERS:
+            mine, base = board.layers.layer(name), shared.layer(name)
+            if mine == base:
+                continue
+            for i in [i for i in range(shared.size) if mine[i] != base[i]]:
+                value = base[i] if name == "building" else bool(base[i])
+                board.set_terrain(i % width, i // width, **{name: value})
+            restored = True
+        if restored:
+            # Restored cells re-enter the spawn pools in a new order;
+            # rebuild them so a seed draws the same cells as on a fresh board
+            board.reset_spawn_pools()
+
+    def close(self) -> None:
+        for name in BINARY_LAYERS:
+            self.shared.layer(name).release()
+        self.shm.close()
+
+
+_worker: Optional[_Worker] = None
+
+
+def _init_worker(spec: Tuple[str, int, int]) -> None:
+    global _worker
+    _worker = _Worker(spec)
+
+
+def _run_unit(unit: WorkUnit) -> List[MatchResult]:
+    results = []
+    with balance_overrides(unit.overrides):
+        for seed in unit.seeds:
+            results.append(play_match(_worker.board, seed, unit.players, unit.max_turns, unit.label))
+            _worker.reset_board()
+    return results
+
+
+# =================================================
+# Matches
+# =================================================
+
+@contextmanager
+def balance_overrides(overrides: Optional[dict]):
+    """
+    Temporarily merge `overrides` into BALANCE in place (Player reads
+    BALANCE on every check).
+    """
+    saved = {section: dict(values) for section, values in BALANCE.items()}
+    try:
+        for section, values in (overrides or {}).items():
+            if section not in BALANCE:
+                raise ValueError(f"Unknown BALANCE section: {section!r}")
+            BALANCE[section].update(values)
+        yield BALANCE
+    finally:
+        for section, values in saved.items():
+            BALANCE[section].clear()
+            BALANCE[section].update(values)
+
+
+def greedy_intents(engine: GameEngine, rng: random.Random, wander: float = 0.25) -> List[Intent]:
+    """
+    One intent per alive player: spawn, attack an opponent in reach,
+    buy guns when possible, otherwise move towards the nearest
+    opponent (or, with probability `wander`, anywhere in range).
+    """
+    board = engine.board
+    spawned = [
+        pid for pid in engine.alive()
+        if engine.players[pid].is_spawned(board)
+    ]
+    intents = []
+    for pid in engine.alive():
+        player = engine.players[pid]
+        if pid not in spawned:
+            intents.append(Intent(pid, "spawn"))
+            continue
+
+        x, y = player.x, player.y
+        opponents = [engine.players[o] for o in spawned if o != pid]
+        attack = next(
+            (
+                Intent(pid, action, (o.x, o.y))
+                for action, check in ATTACKS.items()
+                for o in opponents
+                if getattr(player, check)(board, o.x, o.y)
+            ),
+            None,
+        )
+        if attack is not None:
+            intents.append(attack)
+            continue
+
+        actions = engine.possible_actions(pid)
+        if "buy guns" in actions and "gun" not in player.weapons:
+            intents.append(Intent(pid, "buy guns"))
+            continue
+
+        moves = [a for a in actions if a in MOVES]
+        if not moves:
+            continue
+        action = rng.choice(moves)
+        ap = engine.balance["move"][MOVES[action][1]]
+        if opponents and rng.random() >= wander:
+            target = min(opponents, key=lambda o: abs(o.x - x) + abs(o.y - y))
+            dx, dy = target.x - x, target.y - y
+            step_x = max(-ap, min(ap, dx))
+            step_y = max(-(ap - abs(step_x)), min(ap - abs(step_x), dy))
+        else:
+            step_x = rng.randint(-ap, ap)
+            step_y = rng.randint(-(ap - abs(step_x)), ap - abs(step_x))
+        tx = min(max(x + step_x, 0), board.WIDTH - 1)
+        ty = min(max(y + step_y, 0), board.HEIGHT - 1)
+        if (tx, ty) != (x, y):
+            intents.append(Intent(pid, action, (tx, ty)))
+    return intents
+
+
+def play_match(board: GameBoard, seed: int, players: int = 2, max_turns: int = 200, label: str = "") -> MatchResult:
+    """
+    Play one greedy match on `board`; the same seed replays the same
+    match. The board's terrain is left as the match changed it.
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    engine = GameEngine(board, seed=seed)
+    for _ in range(players):
+        engine.add_player()
+    try:
+        while engine.turn < max_turns and not engine.is_over():
+            engine.step(greedy_intents(engine, rng))
+    finally:
+        engine.close()
+    return MatchResult(
+        seed,
+        label,
+        engine.winner,
+        engine.turn,
+        sum(engine.eliminated),
+        time.perf_counter() - start,
+    )
+
+
+# =================================================
+# Aggregation
+# =================================================
+
+class MatchStats:
+    """
+    Running win-rate and duration statistics, grouped by unit label.
+    """
+
+    def __init__(self):
+        self._results: Dict[str, List[MatchResult]] = {}
+
+    def add(self, result: MatchResult) -> None:
+        self._results.setdefault(result.label, []).append(result)
+
+    def extend(self, results: Iterable[MatchResult]) -> None:
+        for result in results:
+            self.add(result)
+
+    def __len__(self) -> int:
+        return sum(len(results) for results in self._results.values())
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Per label: matches, draws, win rate per player id, and match
+        length in turns (mean, p50, p95, max).
+        """
+        summary = {}
+        for label, results in self._results.items():
+            count = len(results)
+            wins: Dict[int, int] = {}
+            for result in results:
+                if result.winner is not None:
+                    wins[result.winner] = wins.get(result.winner, 0) + 1
+            turns = sorted(result.turns for result in results)
+
+            def pct(q: float) -> int:
+                return turns[min(count - 1, int(q * count))]
+
+            summary[label] = {
+                "matches": count,
+                "draws": count - sum(wins.values()),
+                "win_rate": {pid: wins[pid] / count for pid in sorted(wins)},
+                "turns_mean": sum(turns) / count,
+                "turns_p50": pct(0.50),
+                "turns_p95": pct(0.95),
+                "turns_max": turns[-1],
+                "seconds_mean": sum(r.seconds for r in results) / count,
+            }
+        return summary
+
+
+# =================================================
+# Simulator
+# =================================================
+
+class Simulator:
+    """
+    Runs WorkUnits over a process pool sharing one board.
+
+    with Simulator(GameBoard(), workers=8) as sim:
+        for result in sim.run(plan_units(100_000)):
+            stats.add(result)
+
+    workers=0 plays in the calling process (same shared memory path,
+    no pool). Results arrive in completion order, not seed order.
+    """
+
+    def __init__(self, board: GameBoard, *, workers: Optional[int] = None, mp_context=None):
+        self.shared = SharedBoard(board.to_layers())
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self._pool = None
+        if workers != 0:
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=mp_context,
+                    initializer=_init_worker,
+                    initargs=(self.shared.spec,),
+                )
+            except BaseException:
+                # Nobody else will unlink the block
+                self.shared.close()
+                raise
+
+    def run(self, units: Iterable[WorkUnit], *, max_pending: Optional[int] = None) -> Iterator[MatchResult]:
+        """
+        Stream the results of `units`. At most `max_pending` units
+        (default: twice the worker count) are queued at a time, so long
+        unit generators are consumed lazily.
+        """
+        if self._pool is None:
+            if _worker is None or _worker.shm.name != self.shared.shm.name:
+                _init_worker(self.shared.spec)
+            for unit in units:
+                yield from _run_unit(unit)
+            return
+
+        limit = max_pending or 2 * self.workers
+        units = iter(units)
+        pending = set()
+        while True:
+            for unit in units:
+                pending.add(self._pool.submit(_run_unit, unit))
+                if len(pending) >= limit:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+    def close(self) -> None:
+        global _worker
+        if self._pool is not None:
+            self._pool.shutdown()
+        if _worker is not None and _worker.shm.name == self.shared.shm.name:
+            _worker.close()
+            _worker = None
+        self.shared.close()
+
+    def __enter__(self) -> "Simulator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def plan_units(
+    matches: int,
+    *,
+    chunk: int = 50,
+    base_seed: int = 0,
+    players: int = 2,
+    max_turns: int = 200,
+    overrides: Optional[dict] = None,
+    label: str = "",
+) -> Iterator[WorkUnit]:
+    """
+    Split `matches` consecutive seeds into WorkUnits of `chunk` matches.
+    """
+    if chunk <= 0:
+        raise ValueError("chunk must be > 0")
+    for first in range(base_seed, base_seed + matches, chunk):
+        seeds = range(first, min(first + chunk, base_seed + matches))
+        yield WorkUnit(seeds, players, max_turns, overrides, label)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=50)
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--gun-range", type=int, nargs="*", default=[],
+                        help="also simulate these BALANCE gun ranges")
+    args = parser.parse_args()
+
+    def units():
+        variants = [("default", None)] + [
+            (f"gun range {r}", {"gun": {"range": r}}) for r in args.gun_range
+        ]
+        for label, overrides in variants:
+            yield from plan_units(
+                args.matches, chunk=args.chunk, players=args.players,
+                max_turns=args.max_turns, overrides=overrides, label=label,
+            )
+
+    stats = MatchStats()
+    start = time.perf_counter()
+    with Simulator(GameBoard("board.csv"), workers=args.workers) as sim:
+        stats.extend(sim.run(units()))
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(stats)} matches in {elapsed:.1f} s ({len(stats) / elapsed:.0f} matches/s)")
+    for label, summary in stats.summary().items():
+        print(f"  {label}:")
+        for key, value in summary.items():
+            print(f"    {key:<14} {value}")
+
+
+if __name__ == "__main__":
+    main()
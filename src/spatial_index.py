@@ -0,0 +1,112 @@
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class SpatialIndex:
+    """
+    Positions of entities (players, helicopter parts) on a board.
+
+    A cell hash answers "what is on (x, y)" in O(1); square buckets of
+    `bucket_size` cells narrow "what is within r cells" down to the
+    buckets the query overlaps. Entities moved off the board stay
+    tracked but are not indexed until they come back.
+    """
+
+    def __init__(self, width: int, height: int, bucket_size: int = 8):
+        if bucket_size <= 0:
+            raise ValueError("bucket_size must be > 0")
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self._positions: Dict[Hashable, Tuple[int, int]] = {}
+        self._cells: Dict[Tuple[int, int], List] = {}
+        # bucket -> entities, kept as an insertion-ordered dict
+        self._buckets: Dict[Tuple[int, int], Dict[Hashable, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entity) -> bool:
+        return entity in self._positions
+
+    def _in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def _bucket(self, x: int, y: int) -> Tuple[int, int]:
+        return x // self.bucket_size, y // self.bucket_size
+
+    # -------------------------------------------------
+    # Updates
+    # -------------------------------------------------
+
+    def add(self, entity, x: int, y: int) -> None:
+        """
+        Track `entity` at (x, y); same as move() for tracked entities.
+        """
+        self.move(entity, x, y)
+
+    def move(self, entity, x: int, y: int) -> None:
+        old = self._positions.get(entity)
+        if old == (x, y):
+            return
+        if old is not None:
+            self._unindex(entity, old)
+        self._positions[entity] = (x, y)
+        if self._in_bounds(x, y):
+            self._cells.setdefault((x, y), []).append(entity)
+            self._buckets.setdefault(self._bucket(x, y), {})[entity] = None
+
+    def remove(self, entity) -> None:
+        position = self._positions.pop(entity, None)
+        if position is not None:
+            self._unindex(entity, position)
+
+    def _unindex(self, entity, position: Tuple[int, int]) -> None:
+        if not self._in_bounds(*position):
+            return
+        on_cell = self._cells[position]
+        on_cell.remove(entity)
+        if not on_cell:
+            del self._cells[position]
+        bucket = self._bucket(*position)
+        del self._buckets[bucket][entity]
+        if not self._buckets[bucket]:
+            del self._buckets[bucket]
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+
+    def position(self, entity) -> Optional[Tuple[int, int]]:
+        return self._positions.get(entity)
+
+    def at(self, x: int, y: int, kind: Optional[type] = None) -> List:
+        """
+        Entities on (x, y) in arrival order, optionally only `kind`.
+        """
+        entities = self._cells.get((x, y), ())
+        if kind is None:
+            return list(entities)
+        return [e for e in entities if isinstance(e, kind)]
+
+    def any_at(self, x: int, y: int, kind: Optional[type] = None) -> bool:
+        entities = self._cells.get((x, y), ())
+        if kind is None:
+            return bool(entities)
+        return any(isinstance(e, kind) for e in entities)
+
+    def within(self, x: int, y: int, radius: int, kind: Optional[type] = None) -> List:
+        """
+        Entities at Manhattan distance <= radius from (x, y).
+        """
+        size = self.bucket_size
+        positions = self._positions
+        found = []
+        for by in range((y - radius) // size, (y + radius) // size + 1):
+            for bx in range((x - radius) // size, (x + radius) // size + 1):
+                for entity in self._buckets.get((bx, by), ()):
+                    ex, ey = positions[entity]
+                    if abs(ex - x) + abs(ey - y) > radius:
+                        continue
+                    if kind is None or isinstance(entity, kind):
+                        found.append(entity)
+        return found
@@ -0,0 +1,53 @@
+import random
+from typing import Iterable, List, Optional
+
+
+class SpawnPool:
+    """
+    Set of cell indices with O(1) add, discard and uniform random choice.
+
+    Items live in a list; `_pos` maps each item to its list slot so a
+    discard can swap the last item into the hole.
+    """
+
+    def __init__(self, items: Iterable[int] = ()):
+        self._items: List[int] = []
+        self._pos: dict[int, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: int) -> None:
+        if item in self._pos:
+            return
+        self._pos[item] = len(self._items)
+        self._items.append(item)
+
+    def discard(self, item: int) -> None:
+        pos = self._pos.pop(item, None)
+        if pos is None:
+            return
+        last = self._items.pop()
+        if last != item:
+            self._items[pos] = last
+            self._pos[last] = pos
+
+    # rng: a random.Random for reproducible draws; the module-level
+    # generator when None
+
+    def choice(self, rng: Optional[random.Random] = None) -> int:
+        return self._items[(rng or random).randrange(len(self._items))]
+
+    def choices(self, count: int, rng: Optional[random.Random] = None) -> List[int]:
+        return (rng or random).choices(self._items, k=count)
+
+    def sample(self, count: int, rng: Optional[random.Random] = None) -> List[int]:
+        return (rng or random).sample(self._items, count)
+
+    def __contains__(self, item: int) -> bool:
+        return item in self._pos
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
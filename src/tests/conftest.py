@@ -1,5 +1,12 @@
+from pathlib import Path
+
 import pytest
 
+from game_board import GameBoard
+
+
+SHIPPED_BOARD_CSV = Path(__file__).resolve().parent.parent / "board.csv"
+
 
 class FakeCell:
     def __init__(self, buildable: bool = True):
@@ -39,3 +46,20 @@ def buildable_board(buildable_cell):
 @pytest.fixture
 def non_buildable_board(non_buildable_cell):
     return FakeBoard(non_buildable_cell)
+
+
+@pytest.fixture(scope="session")
+def board_csv() -> str:
+    """
+    Path of the shipped board.csv, for tests that load or edit their
+    own copy.
+    """
+    return str(SHIPPED_BOARD_CSV)
+
+
+@pytest.fixture(scope="module")
+def board(board_csv):
+    """
+    The shipped board, shared by a module's tests: don't edit it.
+    """
+    return GameBoard(board_csv)
@@ -0,0 +1,121 @@
+import random
+
+from constants import BUILDING_TYPE
+from game_board import GameBoard
+from helicopter_part import HelicopterPart
+from player import Player
+from player_actions import ActionFlag, PlayerActionProvider, action_names, cell_action_mask
+
+
+def reference_actions(player, board, helicopter_part=None):
+    """
+    The branch-by-branch rules possible_actions used to evaluate.
+    """
+    if not player.is_spawned(board):
+        return ["spawn"]
+
+    cell = board.get_cell(player.x, player.y)
+    btype = cell.get_building_type()
+    adjacent_land = any(not board.get_cell(nx, ny).is_water() for nx, ny in board.neighbors(player.x, player.y))
+
+    actions = [
+        "attack hand-to-hand", "print home inventory", "print current inventory",
+        "print current cell", "print part location", "print other player locations",
+    ]
+    rules = [
+        ("pickup part", board.has_part_at(player.x, player.y)),
+        ("pickup helicopter part", helicopter_part is not None),
+        ("heal", btype == BUILDING_TYPE["hospital"] and player.wound > 0),
+        ("work", btype == BUILDING_TYPE["bank"]),
+        ("rent car", btype == BUILDING_TYPE["car_rental"]),
+        ("buy train ticket", btype == BUILDING_TYPE["train_station"]),
+        ("rent boat", btype == BUILDING_TYPE["boat_rental"]),
+        ("buy guns", btype == BUILDING_TYPE["shop"]),
+        ("win game", btype == BUILDING_TYPE["airport"] and len(set(player.parts)) >= 3),
+        ("sail on boat", player.on_boat),
+        ("disembark", player.on_boat and adjacent_land),
+        ("swim", player.on_water and not player.on_boat),
+        ("climb ashore", player.on_water and not player.on_boat and adjacent_land),
+        ("jump into sea", cell.is_shore()),
+        ("drive", player.on_car and cell.is_road()),
+        ("exit car", player.on_car and cell.is_road()),
+        ("exit train", player.on_train and player.on_land),
+        ("ride train", player.on_train and cell.is_railroad()),
+        ("walk", player.on_land),
+        ("gun attack", "gun" in player.weapons and "bullet" in player.weapons),
+        ("rocket attack", "rpg" in player.weapons and "rocket" in player.weapons),
+        ("build home", player.home == (-1, -1) and cell.is_buildable()),
+        ("inventory", player.home == (player.x, player.y)),
+    ]
+    return actions + [name for name, ok in rules if ok]
+
+
+def random_player(board, rng):
+    x, y = rng.randrange(-1, board.WIDTH), rng.randrange(board.HEIGHT)
+    p = Player(
+        x=x, y=y,
+        wound=rng.randint(0, 1),
+        on_land=rng.random() < 0.5, on_water=rng.random() < 0.5,
+        on_car=rng.random() < 0.3, on_boat=rng.random() < 0.3, on_train=rng.random() < 0.3,
+        weapons=rng.sample(["gun", "bullet", "rpg", "rocket"], rng.randint(0, 4)),
+        parts=rng.sample(["RED", "GREEN", "BLUE"], rng.randint(0, 3)),
+        home=rng.choice([(-1, -1), (x, y), (0, 0)]),
+    )
+    return p
+
+
+def test_flags_match_reference_rules(board_csv):
+    board = GameBoard(board_csv)
+    HelicopterPart("red").place_on_board(board, 5, 5)
+    rng = random.Random(20)
+
+    buildings = [(c.x, c.y) for c in board.iter_cells() if c.is_building()]
+    for i in range(3000):
+        p = random_player(board, rng)
+        if i % 3 == 0:
+            p.x, p.y = rng.choice(buildings)
+        part = HelicopterPart("blue") if rng.random() < 0.2 else None
+
+        assert PlayerActionProvider.possible_actions(p, board, part) == reference_actions(p, board, part)
+
+
+def test_flag_values_and_names():
+    p = Player(x=1, y=1, on_land=True)
+    b = GameBoard(width=3, height=3)
+    flags = PlayerActionProvider.action_flags(p, b)
+
+    assert isinstance(flags, ActionFlag)
+    assert ActionFlag.WALK in flags and ActionFlag.BUILD_HOME in flags
+    assert ActionFlag.SWIM not in flags
+    assert action_names(ActionFlag.SPAWN) == ("spawn",)
+    assert PlayerActionProvider.action_flags(Player(), b) == ActionFlag.SPAWN
+
+
+def test_cell_masks_follow_builds():
+    b = GameBoard(width=3, height=3)
+    p = Player(x=1, y=1)
+    assert "build home" in PlayerActionProvider.possible_actions(p, b)
+
+    b.get_cell(1, 1).build()
+    assert "build home" not in PlayerActionProvider.possible_actions(p, b)
+
+
+def test_cell_masks_are_patched_in_place(board_csv):
+    b = GameBoard(board_csv)
+    masks = b.action_masks()
+    rng = random.Random(20)
+    for _ in range(60):
+        x, y = rng.randrange(b.WIDTH), rng.randrange(b.HEIGHT)
+        edit = rng.choice([
+            {"sea": True, "plain": False},
+            {"sea": False, "plain": True},
+            {"road": rng.random() < 0.5},
+            {"building": rng.choice(list(BUILDING_TYPE.values()))},
+        ])
+        b.set_terrain(x, y, **edit)
+
+    assert b.action_masks() is masks
+    assert masks == [
+        cell_action_mask(b, i % b.WIDTH, i // b.WIDTH)
+        for i in range(b.WIDTH * b.HEIGHT)
+    ]
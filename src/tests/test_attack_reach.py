@@ -0,0 +1,57 @@
+import random
+
+from game_board import GameBoard
+from player import Player
+
+
+CHECKS = {
+    "h2h": Player.can_attack_hand_to_hand,
+    "gun": Player.can_attack_with_gun,
+    "rocket": Player.can_attack_with_rocket,
+}
+
+
+def test_reach_matches_per_cell_checks(board):
+    rng = random.Random(16)
+    loadouts = [[], ["gun", "bullet"], ["rpg", "rocket"], ["gun", "bullet", "rpg", "rocket"]]
+    for _ in range(12):
+        p = Player(x=rng.randrange(board.WIDTH), y=rng.randrange(board.HEIGHT))
+        p.weapons = rng.choice(loadouts)
+
+        reach = p.attack_reach(board)
+        for weapon, check in CHECKS.items():
+            expected = {
+                (x, y)
+                for y in range(board.HEIGHT)
+                for x in range(board.WIDTH)
+                if check(p, board, x, y)
+            }
+            assert reach[weapon] == expected, (weapon, p.x, p.y, p.weapons)
+
+
+def test_nothing_from_a_building_or_off_board(board):
+    bx, by = next((c.x, c.y) for c in board.iter_cells() if c.is_building())
+    p = Player(x=bx, y=by)
+    p.weapons = ["gun", "bullet", "rpg", "rocket"]
+    assert p.attack_reach(board) == {"h2h": set(), "gun": set(), "rocket": set()}
+    assert Player().attack_reach(board) == {"h2h": set(), "gun": set(), "rocket": set()}
+
+
+def test_attackable_targets_classifies_opponents():
+    b = GameBoard(width=12, height=5)
+    b.set_terrain(8, 2, forest=True)
+    shooter = Player(x=0, y=2)
+    shooter.weapons = ["gun", "bullet", "rpg", "rocket"]
+
+    near = Player(x=2, y=2)      # h2h, gun and rocket
+    mid = Player(x=6, y=2)       # six walk steps, gun range 6, rocket
+    behind = Player(x=9, y=2)    # rocket only: forest on the last scanned cell
+    far = Player(x=11, y=2)      # blocked by the forest
+    off_lane = Player(x=5, y=4)  # nothing
+    players = [shooter, near, mid, behind, far, off_lane]
+
+    targets = shooter.attackable_targets(b, players)
+
+    assert targets["h2h"] == [near, mid]
+    assert targets["gun"] == [near, mid]
+    assert targets["rocket"] == [near, mid, behind]
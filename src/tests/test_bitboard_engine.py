@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from bitboard import flood_rings
+from bitboard_engine import BitboardEngine
+from game_board import GameBoard
+from player import Player
+
+
+MODES = ["car", "train", "boat", "walk", "swim"]
+
+
+def test_flood_rings_on_open_board():
+    # 5x5 all passable, start in the centre
+    rings = flood_rings(1 << 12, (1 << 25) - 1, 5, 5, 10)
+    assert [bin(r).count("1") for r in rings] == [1, 4, 8, 8, 4]
+
+
+def test_flood_rings_respects_walls_and_row_edges():
+    # 3x2 board, only the top row passable: no wrap into the second row
+    rings = flood_rings(1 << 2, 0b000111, 3, 2, 5)
+    assert rings == [0b100, 0b010, 0b001]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_engine_agrees_with_player_checks(board, mode):
+    engine = BitboardEngine(board)
+    rng = random.Random(mode)
+
+    for _ in range(200):
+        sx, sy = rng.randrange(36), rng.randrange(36)
+        tx, ty = sx + rng.randint(-8, 8), sy + rng.randint(-8, 8)
+        ap = rng.randint(0, 10)
+        p = Player(x=sx, y=sy, on_car=True, on_train=True, on_boat=True)
+
+        expected = getattr(p, f"can_get_by_{mode}")(board, tx, ty, ap)
+        assert engine.can_get_by(p, mode, tx, ty, ap) == expected
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_engine_reachable_cells_match_bfs(board, mode):
+    engine = BitboardEngine(board)
+    rng = random.Random(len(mode))
+
+    for _ in range(40):
+        p = Player(x=rng.randrange(36), y=rng.randrange(36), on_car=True, on_train=True, on_boat=True)
+        ap = rng.randint(0, 8)
+        assert engine.reachable_cells(p, mode, ap) == dict(p.reachable_cells(board, mode, ap))
+
+
+def test_engine_honours_transport_flags(board):
+    engine = BitboardEngine(board)
+    road = next(c for c in board.iter_cells() if c.is_road())
+    p = Player(x=road.x, y=road.y)
+
+    assert engine.reachable_mask(p, "car", 5) == 0
+    p.on_car = True
+    assert engine.reachable_mask(p, "car", 5) & (1 << board.index_of(road.x, road.y))
+
+
+def test_engine_sees_terrain_edits():
+    b = GameBoard(width=4, height=1)
+    engine = BitboardEngine(b)
+    p = Player(x=0, y=0)
+
+    assert engine.can_get_by(p, "walk", 3, 0, 3) is True
+    b.set_terrain(2, 0, sea=True, plain=False)
+    assert engine.can_get_by(p, "walk", 3, 0, 3) is False
+
+
+def test_engine_rejects_unknown_mode(board):
+    with pytest.raises(ValueError):
+        BitboardEngine(board).passable_mask("fly")
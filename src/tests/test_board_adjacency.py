@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from game_board import GameBoard, NEIGHBOR_DIRECTIONS
+from player import Player
+
+
+class CoordsOnlyBoard:
+    """
+    Wraps a GameBoard but hides the index API, forcing the legacy BFS.
+    """
+    def __init__(self, board):
+        self._board = board
+        self.WIDTH = board.WIDTH
+        self.HEIGHT = board.HEIGHT
+
+    def is_in_bounds(self, x, y):
+        return self._board.is_in_bounds(x, y)
+
+    def get_cell(self, x, y):
+        return self._board.get_cell(x, y)
+
+    def neighbors(self, x, y):
+        return self._board.neighbors(x, y)
+
+
+@pytest.mark.parametrize("count", [4, 8])
+def test_adjacency_matches_direction_offsets(count):
+    b = GameBoard(width=5, height=4)
+    table = b.adjacency(count)
+
+    assert len(table) == 20
+    for y in range(4):
+        for x in range(5):
+            expected = [
+                b.index_of(x + dx, y + dy)
+                for dx, dy in NEIGHBOR_DIRECTIONS[count]
+                if b.is_in_bounds(x + dx, y + dy)
+            ]
+            assert list(b.neighbor_indices(b.index_of(x, y), count)) == expected
+
+
+def test_adjacency_is_built_once():
+    b = GameBoard(width=3, height=3)
+    assert b.adjacency(4) is b.adjacency(4)
+
+
+def test_index_helpers_round_trip(board):
+    for x, y in [(0, 0), (35, 0), (0, 35), (12, 7)]:
+        i = board.index_of(x, y)
+        assert board.coords_of(i) == (x, y)
+        assert board.cell_at(i) is board.get_cell(x, y)
+
+
+def test_cell_at_on_array_backend(board_csv):
+    b = GameBoard(board_csv, backend="array")
+    cell = b.cell_at(b.index_of(4, 9))
+    assert (cell.x, cell.y) == (4, 9)
+
+
+def test_neighbors_invalid_count_raises_without_iteration():
+    b = GameBoard(width=3, height=3)
+    with pytest.raises(ValueError):
+        b.neighbors(1, 1, neighbor_count=6)
+
+
+@pytest.mark.parametrize("mode", ["walk", "swim", "car", "train", "boat"])
+def test_indexed_bfs_matches_legacy_bfs(board, mode):
+    legacy = CoordsOnlyBoard(board)
+    rng = random.Random(mode)
+
+    for _ in range(150):
+        sx, sy = rng.randrange(36), rng.randrange(36)
+        tx, ty = sx + rng.randint(-6, 6), sy + rng.randint(-6, 6)
+        ap = rng.randint(0, 8)
+        p = Player(x=sx, y=sy, on_car=True, on_train=True, on_boat=True)
+
+        check = getattr(Player, f"can_get_by_{mode}")
+        assert check(p, board, tx, ty, ap) == check(p, legacy, tx, ty, ap)
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from board_binary import BoardFormatError, HEADER, csv_to_binary
+from game_board import GameBoard
+
+
+@pytest.fixture
+def binary_path(tmp_path, board_csv):
+    path = tmp_path / "board.bin"
+    csv_to_binary(board_csv, str(path))
+    return str(path)
+
+
+def test_binary_round_trip_matches_csv(binary_path, board_csv):
+    from_csv = GameBoard(board_csv)
+    from_bin = GameBoard.from_binary(binary_path, verify=True)
+
+    assert (from_bin.WIDTH, from_bin.HEIGHT) == (from_csv.WIDTH, from_csv.HEIGHT)
+    assert from_bin.backend == "array"
+    for a, b in zip(from_csv.iter_cells(), from_bin.iter_cells()):
+        assert a.terrain == b.terrain
+
+
+def test_file_size_is_header_plus_packed_layers(binary_path):
+    assert Path(binary_path).stat().st_size == HEADER.size + 36 * 36 * 8
+
+
+def test_cells_backend_board_can_be_saved(tmp_path):
+    path = tmp_path / "geom.bin"
+    b = GameBoard(width=5, height=3)
+    b.set_terrain(0, 0, sea=True, plain=False)
+    b.save_binary(str(path))
+
+    loaded = GameBoard.from_binary(str(path))
+    assert (loaded.WIDTH, loaded.HEIGHT) == (5, 3)
+    assert loaded.get_cell(0, 0).is_sea()
+    assert loaded.shore_cells() == b.shore_cells()
+
+
+def test_edits_on_mapped_board_do_not_touch_file(binary_path):
+    before = Path(binary_path).read_bytes()
+
+    b = GameBoard.from_binary(binary_path)
+    x, y = b.buildable_cells()[0]
+    assert b.get_cell(x, y).build() is True
+    assert b.get_cell(x, y).is_building()
+
+    assert Path(binary_path).read_bytes() == before
+
+
+def test_checksum_mismatch_detected_when_verifying(binary_path):
+    data = bytearray(Path(binary_path).read_bytes())
+    data[HEADER.size + 10] ^= 1
+    Path(binary_path).write_bytes(bytes(data))
+
+    GameBoard.from_binary(binary_path)  # unverified load still works
+    with pytest.raises(BoardFormatError):
+        GameBoard.from_binary(binary_path, verify=True)
+
+
+def test_bad_magic_rejected(binary_path):
+    data = bytearray(Path(binary_path).read_bytes())
+    data[:4] = b"XXXX"
+    Path(binary_path).write_bytes(bytes(data))
+
+    with pytest.raises(BoardFormatError):
+        GameBoard.from_binary(binary_path)
+
+
+def test_truncated_file_rejected(binary_path):
+    data = Path(binary_path).read_bytes()
+    Path(binary_path).write_bytes(data[:-1])
+
+    with pytest.raises(BoardFormatError):
+        GameBoard.from_binary(binary_path)
+
+
+def test_empty_file_rejected(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    with pytest.raises(BoardFormatError):
+        GameBoard.from_binary(str(path))
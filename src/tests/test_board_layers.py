@@ -0,0 +1,83 @@
+import pytest
+
+from bitboard import from_layer, iter_indices, to_layer
+from board_layers import BoardLayers, CellView
+from constants import BUILDING_TYPE
+from game_board import GameBoard
+
+
+@pytest.fixture
+def array_board(board_csv):
+    return GameBoard(board_csv, backend="array")
+
+
+def test_bitboard_layer_round_trip():
+    layer = bytearray([0, 1, 1, 0, 0, 0, 0, 1, 1])
+    mask = from_layer(layer)
+
+    assert list(iter_indices(mask)) == [1, 2, 7, 8]
+    assert to_layer(mask, len(layer)) == bytes(layer)
+
+
+def test_to_layer_rejects_mask_wider_than_layer():
+    with pytest.raises(ValueError):
+        to_layer(1 << 4, 4)
+
+
+def test_layers_reject_buffer_of_wrong_size():
+    with pytest.raises(ValueError):
+        BoardLayers(2, 2, {"sea": bytearray(3)})
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        GameBoard(width=2, height=2, backend="sparse")
+
+
+def test_array_backend_has_no_grid_and_returns_views(array_board):
+    assert array_board.grid is None
+    cell = array_board.get_cell(3, 4)
+    assert isinstance(cell, CellView)
+    assert (cell.x, cell.y) == (3, 4)
+
+
+def test_array_backend_matches_cell_backend(board, array_board):
+    for y in range(board.HEIGHT):
+        for x in range(board.WIDTH):
+            a = board.get_cell(x, y)
+            b = array_board.get_cell(x, y)
+            assert a.terrain == b.terrain
+            assert a._status_dict() == b._status_dict()
+
+
+@pytest.mark.parametrize("name", ["sea", "forest", "road", "shore", "building", "water", "buildable"])
+def test_masks_agree_between_backends(board, array_board, name):
+    assert board.mask(name) == array_board.mask(name)
+
+
+def test_buildable_and_shore_cells_match_per_cell_predicates(array_board):
+    cells = list(array_board.iter_cells())
+
+    assert array_board.buildable_cells() == [(c.x, c.y) for c in cells if c.is_buildable()]
+    assert array_board.shore_cells() == [(c.x, c.y) for c in cells if c.is_shore()]
+
+
+def test_view_build_writes_through_to_layers(array_board):
+    x, y = array_board.buildable_cells()[0]
+    assert array_board.get_cell(x, y).build() is True
+
+    assert array_board.layers.building[y * array_board.WIDTH + x] == BUILDING_TYPE["user_home"]
+    assert array_board.get_cell(x, y).is_building()
+    assert (x, y) not in array_board.buildable_cells()
+
+
+def test_geometry_mode_array_backend_is_plain():
+    b = GameBoard(width=4, height=3, backend="array")
+    assert b.mask("plain") == (1 << 12) - 1
+    assert b.mask("shore") == 0
+    assert len(b.buildable_cells()) == 12
+
+
+def test_unknown_mask_name_rejected(array_board):
+    with pytest.raises(ValueError):
+        array_board.mask("lava")
@@ -0,0 +1,169 @@
+import csv
+import random
+
+import pytest
+
+from constants import BUILDING_TYPE
+from game_board import BoardValidationError, GameBoard
+
+
+HEADER = ["x", "y", "sea", "swamp", "plain", "forest", "road", "railroad", "building"]
+
+
+@pytest.fixture
+def shipped_rows(board_csv):
+    with open(board_csv, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    return rows[0], rows[1:]
+
+
+def write_rows(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+    return str(path)
+
+
+def assert_same_board(a, b):
+    assert (a.WIDTH, a.HEIGHT) == (b.WIDTH, b.HEIGHT)
+    for ca, cb in zip(a.iter_cells(), b.iter_cells()):
+        assert ca.terrain == cb.terrain
+
+
+@pytest.mark.parametrize("backend", ["cells", "array"])
+def test_fast_loader_matches_legacy_on_shipped_board(backend, board, board_csv):
+    fast = GameBoard.from_csv(board_csv, backend=backend, fast=True)
+    assert_same_board(board, fast)
+
+
+def test_fast_loader_handles_shuffled_rows_and_reordered_columns(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    random.Random(7).shuffle(rows)
+
+    order = list(reversed(range(len(header))))
+    path = write_rows(
+        tmp_path / "shuffled.csv",
+        [header[j] for j in order],
+        [[row[j] for j in order] for row in rows],
+    )
+
+    assert_same_board(GameBoard(path), GameBoard(path, fast_csv=True))
+
+
+def test_fast_loader_accepts_verbose_tokens_quotes_and_blank_lines(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    for row in rows[:50]:
+        row[2] = " TRUE" if row[2] == "1" else "no"
+        row[0] = f" {row[0]}"
+    path = tmp_path / "verbose.csv"
+    write_rows(path, header, rows)
+    text = path.read_text(encoding="utf-8").replace("\r\n", "\n")
+    lines = text.splitlines()
+    lines.insert(5, "")
+    lines[10] = ",".join(f'"{v}"' for v in lines[10].split(","))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert_same_board(GameBoard(str(path)), GameBoard(str(path), fast_csv=True))
+
+
+def test_fast_loader_reports_all_errors_at_once(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    rows[0][2] = "maybe"        # line 2: bad bool
+    rows[1][0] = "abc"          # line 3: bad int
+    rows[2][3] = "nope"         # line 4: bad bool
+    path = write_rows(tmp_path / "bad.csv", header, rows)
+
+    with pytest.raises(BoardValidationError) as exc:
+        GameBoard(path, fast_csv=True)
+
+    errors = exc.value.errors
+    assert len(errors) == 3
+    assert any("line 2" in e and "'sea'" in e for e in errors)
+    assert any("line 3" in e and "'x'" in e for e in errors)
+    assert any("line 4" in e and "'swamp'" in e for e in errors)
+
+
+def test_fast_loader_checks_field_count_per_row(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    rows[3] = rows[3][:-1]          # line 5: one field short
+    rows[4] = rows[4] + ["0"]       # line 6: one field extra, total unchanged
+    path = write_rows(tmp_path / "ragged.csv", header, rows)
+
+    with pytest.raises(BoardValidationError) as exc:
+        GameBoard(path, fast_csv=True)
+
+    # Only the short row is blamed; nothing after it is shifted
+    errors = [e for e in exc.value.errors if e.startswith("line ")]
+    assert errors == ["line 5: missing fields"]
+
+
+def test_fast_loader_reports_bounds_duplicates_and_missing_together(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    rows[0][0] = "99"               # out of bounds, (0,0) now missing
+    rows[2] = list(rows[1])         # duplicate of (1,0), (2,0) now missing
+    path = write_rows(tmp_path / "geom.csv", header, rows)
+
+    with pytest.raises(BoardValidationError) as exc:
+        GameBoard(path, fast_csv=True)
+
+    errors = exc.value.errors
+    assert any("out of bounds" in e for e in errors)
+    assert any("duplicate cell at (1, 0)" in e for e in errors)
+    assert any("2 cells missing" in e for e in errors)
+
+
+def test_fast_loader_reports_value_and_geometry_errors_together(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    rows[0][2] = "maybe"            # line 2: bad bool
+    rows[1][0] = "abc"              # line 3: bad int, cell skipped
+    rows[3][0] = "99"               # line 5: out of bounds
+    rows[5] = list(rows[4])         # line 7: duplicate of (4,0)
+    path = write_rows(tmp_path / "mixed.csv", header, rows)
+
+    with pytest.raises(BoardValidationError) as exc:
+        GameBoard(path, fast_csv=True)
+
+    errors = exc.value.errors
+    assert any("line 2" in e and "'sea'" in e for e in errors)
+    assert any("line 3" in e and "'x'" in e for e in errors)
+    assert any("line 5: out of bounds" in e for e in errors)
+    assert any("line 7: duplicate cell at (4, 0)" in e for e in errors)
+    # Line 3's cell is unknown, so no missing-cell guess is made
+    assert len(errors) == 4
+
+
+def test_fast_loader_errors_are_value_errors(tmp_path):
+    path = write_rows(tmp_path / "header_only.csv", HEADER, [])
+    with pytest.raises(ValueError):
+        GameBoard(path, fast_csv=True)
+
+
+def test_fast_loader_missing_columns(tmp_path):
+    path = write_rows(tmp_path / "cols.csv", HEADER[:-1], [])
+    with pytest.raises(BoardValidationError) as exc:
+        GameBoard(path, fast_csv=True)
+    assert "building" in str(exc.value)
+
+
+def test_fast_loader_rejects_building_id_out_of_range(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    rows[5][8] = "300"
+    path = write_rows(tmp_path / "building.csv", header, rows)
+
+    with pytest.raises(BoardValidationError) as exc:
+        GameBoard(path, fast_csv=True)
+    assert "out of range" in exc.value.errors[0]
+
+
+def test_fast_loader_applies_boat_rental_rule(tmp_path, shipped_rows):
+    header, rows = shipped_rows
+    row = next(r for r in rows if r[3] == "1")  # a swamp cell
+    row[8] = str(BUILDING_TYPE["boat_rental"])
+    path = write_rows(tmp_path / "boat.csv", header, rows)
+
+    b = GameBoard(path, fast_csv=True)
+    c = b.get_cell(int(row[0]), int(row[1]))
+    assert c.is_sea() and c.is_plain()
+    assert not c.is_swamp() and not c.is_forest()
+    assert_same_board(GameBoard(path), b)
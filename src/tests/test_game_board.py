@@ -1,4 +1,6 @@
 import csv
+import random
+
 import pytest
 
 from game_board import GameBoard
@@ -150,12 +152,11 @@ def test_boat_rental_rule_enforced_on_load(tmp_path):
     assert not c.is_forest()
 
 
-def test_drop_to_island_loop_retries_building_and_swamp_for_player(tmp_path, monkeypatch):
+def test_drop_to_island_never_picks_building_or_swamp_for_player(tmp_path):
     csv_path = tmp_path / "board.csv"
 
     building_xy = (5, 5)
     swamp_xy = (6, 6)
-    valid_xy = (7, 7)
 
     write_board_csv(
         csv_path,
@@ -166,11 +167,15 @@ def test_drop_to_island_loop_retries_building_and_swamp_for_player(tmp_path, mon
 
     b = GameBoard(str(csv_path))
 
-    seq = iter([5, 5, 6, 6, 7, 7])
-    monkeypatch.setattr("random.randint", lambda a, z: next(seq))
+    pool = b.spawn_pool(is_player=True)
+    assert len(pool) == 36 * 36 - 2
+    assert b.index_of(*building_xy) not in pool
+    assert b.index_of(*swamp_xy) not in pool
 
-    x, y = b.drop_to_island(is_player=True)
-    assert (x, y) == valid_xy
+    random.seed(0)
+    drops = {b.drop_to_island(is_player=True) for _ in range(2000)}
+    assert building_xy not in drops
+    assert swamp_xy not in drops
 
 
 def test_drop_to_island_allows_swamp_for_non_player(tmp_path, monkeypatch):
@@ -180,8 +185,9 @@ def test_drop_to_island_allows_swamp_for_non_player(tmp_path, monkeypatch):
 
     b = GameBoard(str(csv_path))
 
-    seq = iter([6, 6])
-    monkeypatch.setattr("random.randint", lambda a, z: next(seq))
+    pool = list(b.spawn_pool(is_player=False))
+    slot = pool.index(b.index_of(*swamp_xy))
+    monkeypatch.setattr("random.randrange", lambda n: slot)
 
     x, y = b.drop_to_island(is_player=False)
     assert (x, y) == swamp_xy
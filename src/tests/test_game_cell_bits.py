@@ -0,0 +1,74 @@
+import pytest
+
+from game_cell import GameCell
+from constants import BUILDING_TYPE
+
+
+def make_cell(*, sea=False, swamp=False, plain=False, forest=False, road=False, railroad=False, shore=False, building=0):
+    return GameCell(
+        1,
+        2,
+        (sea, swamp, plain, forest, road, railroad, shore, building),
+    )
+
+
+def test_cell_uses_slots():
+    cell = make_cell(plain=True)
+    assert not hasattr(cell, "__dict__")
+    with pytest.raises(AttributeError):
+        cell.extra = 1  # type: ignore[attr-defined]
+
+
+def test_terrain_view_round_trips_tuple():
+    terrain = (False, True, False, True, True, False, True, BUILDING_TYPE["bank"])
+    cell = GameCell(0, 0, terrain)
+    assert cell.terrain == terrain
+
+
+def test_terrain_view_normalizes_truthy_values_to_bool():
+    cell = GameCell(0, 0, (1, 0, 0, 0, 0, 0, 0, 0))
+    assert cell.terrain == (True, False, False, False, False, False, False, 0)
+    assert cell.is_sea() is True
+
+
+def test_predicates_return_bool():
+    cell = make_cell(forest=True, road=True)
+    assert cell.is_forest() is True
+    assert cell.is_road() is True
+    assert cell.is_sea() is False
+    assert cell.is_shot_passing() is False
+
+
+def test_assigning_terrain_recomputes_derived_flags():
+    cell = make_cell(plain=True)
+    assert cell.is_buildable() is True
+
+    cell.terrain = (True, False, False, False, False, False, False, 0)
+    assert cell.is_water() is True
+    assert cell.is_buildable() is False
+
+
+def test_build_updates_derived_flags():
+    cell = make_cell(plain=True)
+    assert cell.build() is True
+
+    assert cell.is_building() is True
+    assert cell.is_buildable() is False
+    assert cell.is_shot_passing() is False
+    assert cell.terrain[-1] == BUILDING_TYPE["user_home"]
+
+
+def test_set_flag_toggles_single_layer():
+    cell = make_cell(plain=True)
+
+    cell._set_flag("shore", True)
+    assert cell.is_shore() is True
+    assert cell.terrain == (False, False, True, False, False, False, True, 0)
+
+    cell._set_flag("road", True)
+    assert cell.is_buildable() is False
+
+    cell._set_flag("road", False)
+    cell._set_flag("shore", False)
+    assert cell.is_buildable() is True
+    assert cell.terrain == (False, False, True, False, False, False, False, 0)
@@ -0,0 +1,180 @@
+import random
+
+from constants import BALANCE, BUILDING_TYPE, MAX_PARTS
+from game_board import GameBoard
+from game_engine import ATTACKS, MOVES, GameEngine, Intent
+from helicopter_part import HelicopterPart
+
+
+def plain_engine(size: int = 10) -> GameEngine:
+    return GameEngine(GameBoard(width=size, height=size), seed=0, place_parts=False)
+
+
+def test_seed_makes_spawns_and_parts_reproducible(board_csv):
+    def run(seed):
+        engine = GameEngine(GameBoard(board_csv), seed=seed)
+        for _ in range(4):
+            engine.add_player()
+        engine.step([Intent(pid, "spawn") for pid in range(4)])
+        return (
+            [(p.x, p.y) for p in engine.players],
+            [(part.x, part.y) for part in engine.parts],
+        )
+
+    assert run(7) == run(7)
+    players, parts = run(7)
+    assert len(parts) == MAX_PARTS
+    assert len(set(parts)) == MAX_PARTS
+
+
+def test_walk_is_validated_against_move_budget():
+    engine = plain_engine()
+    pid = engine.add_player(x=0, y=0, on_land=True)
+    ap = BALANCE["move"]["walk_ap"]
+
+    report = engine.step([Intent(pid, "walk", (ap + 1, 0))])
+    assert report.outcomes[0].reason == "unreachable"
+
+    report = engine.step([Intent(pid, "walk", (ap, 0))])
+    assert report.outcomes[0].applied
+    assert (engine.players[pid].x, engine.players[pid].y) == (ap, 0)
+
+
+def test_one_move_per_turn():
+    engine = plain_engine()
+    pid = engine.add_player(x=0, y=0, on_land=True)
+
+    report = engine.step([Intent(pid, "walk", (1, 0)), Intent(pid, "walk", (2, 0))])
+    assert [o.reason for o in report.outcomes] == ["", "already used this turn"]
+
+
+def test_phases_order_moves_before_attacks():
+    engine = plain_engine()
+    a = engine.add_player(x=0, y=0, on_land=True)
+    b = engine.add_player(x=3, y=0, on_land=True)
+
+    # Submitted attack first; the move still resolves before it
+    report = engine.step([Intent(a, "attack hand-to-hand", (3, 0)), Intent(b, "walk", (3, 6))])
+    assert [o.intent.action for o in report.outcomes] == ["walk", "attack hand-to-hand"]
+    assert [o.reason for o in report.outcomes] == ["", "no target"]
+
+
+def test_initiative_rotates_with_the_turn():
+    for turn, first in ((0, 0), (1, 1)):
+        engine = plain_engine()
+        ids = [engine.add_player(x=2, y=2, on_land=True) for _ in range(2)]
+        engine.turn = turn
+        part = HelicopterPart("RED")
+        engine.parts = [part]
+        part.place_on_board(engine.board, 2, 2)
+
+        report = engine.step([Intent(pid, "pickup part") for pid in reversed(ids)])
+        winners = [o.intent.player for o in report.outcomes if o.applied]
+        assert winners == [first]
+
+
+def test_second_hit_eliminates_and_last_player_wins():
+    engine = plain_engine()
+    a = engine.add_player(x=0, y=0, on_land=True)
+    b = engine.add_player(x=1, y=0, on_land=True, parts=["BLUE"])
+    part = HelicopterPart("BLUE")
+    part.played = True
+    engine.parts = [part]
+
+    first = engine.step([Intent(a, "attack hand-to-hand", (1, 0))])
+    assert first.outcomes[0].applied and first.eliminated == []
+    assert engine.players[b].wound == 1
+
+    second = engine.step([Intent(a, "attack hand-to-hand", (1, 0))])
+    assert second.eliminated == [b]
+    assert second.winner == a and engine.is_over()
+    # The victim's part is dropped where they fell
+    assert engine.board.parts_on(1, 0) == [part]
+
+    late = engine.step([Intent(b, "walk", (2, 0))])
+    assert late.outcomes[0].reason == "game over"
+
+
+def test_buildings_charge_money():
+    engine = plain_engine()
+    engine.board.set_terrain(4, 4, building=BUILDING_TYPE["shop"])
+    rich = engine.add_player(x=4, y=4, on_land=True)
+    poor = engine.add_player(x=4, y=4, on_land=True, money=0)
+
+    report = engine.step([Intent(rich, "buy guns"), Intent(poor, "buy guns")])
+    assert [o.reason for o in report.outcomes] == ["", "not enough money"]
+    assert list(engine.players[rich].weapons) == ["gun", "bullet"]
+    assert engine.players[rich].money == 1500 - BALANCE["economy"]["guns_price"]
+
+
+def test_bought_guns_can_fire():
+    engine = plain_engine()
+    engine.board.set_terrain(4, 4, building=BUILDING_TYPE["shop"])
+    shooter = engine.add_player(x=4, y=4, on_land=True)
+    target = engine.add_player(x=4, y=7, on_land=True)
+
+    # Without the gun kit the possible-actions gate refuses the shot
+    report = engine.step([Intent(shooter, "gun attack", (4, 7))])
+    assert report.outcomes[0].reason == "not possible here"
+
+    report = engine.step([Intent(shooter, "buy guns")])
+    assert report.outcomes[0].applied
+    assert "gun attack" in engine.possible_actions(shooter)
+
+    # Nobody shoots from inside a building: step out, then fire
+    report = engine.step([Intent(shooter, "gun attack", (4, 7)), Intent(shooter, "walk", (4, 5))])
+    assert [o.reason for o in report.outcomes] == ["", ""]
+    assert engine.players[target].wound == 1
+
+
+def test_rejects_unknown_and_impossible_actions():
+    engine = plain_engine()
+    pid = engine.add_player(x=0, y=0, on_land=True)
+
+    report = engine.step([
+        Intent(pid, "fly"),
+        Intent(pid, "heal"),
+        Intent(5, "walk", (1, 0)),
+        Intent(pid, "drive", (1, 0)),
+    ])
+    reasons = {o.intent.action: o.reason for o in report.outcomes}
+    assert reasons == {
+        "fly": "unknown action",
+        "heal": "not possible here",
+        "walk": "unknown player",
+        "drive": "not possible here",
+    }
+
+
+def test_random_matches_on_shipped_board_and_metrics(board_csv):
+    engine = GameEngine(GameBoard(board_csv), seed=3)
+    for _ in range(6):
+        engine.add_player()
+    rng = random.Random(3)
+
+    for _ in range(60):
+        intents = []
+        for pid in engine.alive():
+            player = engine.players[pid]
+            action = rng.choice(engine.possible_actions(pid))
+            target = None
+            if action in MOVES or action in ATTACKS:
+                target = (
+                    min(max(player.x + rng.randint(-3, 3), 0), 35),
+                    min(max(player.y + rng.randint(-3, 3), 0), 35),
+                )
+            intents.append(Intent(pid, action, target))
+        engine.step(intents)
+        if engine.is_over():
+            break
+
+    stats = engine.stats()
+    assert stats["turns"] == engine.turn
+    assert stats["player_turns"] >= engine.turn
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+    for player in engine.players:
+        assert player.x == -1 or engine.board.is_in_bounds(player.x, player.y)
+
+
+def test_stats_empty():
+    assert plain_engine().stats()["turns"] == 0
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+import player as player_module
+from game_board import GameBoard
+from player import Player
+
+
+def separate_checks(p, board, tx, ty):
+    """
+    The three independent checks the combined search replaces.
+    """
+    if p._attack_cells_or_none(board, tx, ty) is None:
+        return False
+    h2h = player_module.BALANCE["h2h"]
+    return (
+        p.can_get_by_walk(board, tx, ty, h2h["walk_ap"])
+        or p.can_get_by_swim(board, tx, ty, h2h["swim_ap"])
+        or p.can_get_by_changing_stance(board, tx, ty, h2h["stance_ap"])
+    )
+
+
+@pytest.fixture(scope="module", params=["cached", "uncached"])
+def board(request, board_csv):
+    # The uncached board exercises the lockstep search
+    return GameBoard(board_csv, reach_cache_size=256 if request.param == "cached" else 0)
+
+
+def nearby_pairs(board, rng, count):
+    for _ in range(count):
+        x, y = rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT)
+        tx = min(max(x + rng.randint(-7, 7), 0), board.WIDTH - 1)
+        ty = min(max(y + rng.randint(-7, 7), 0), board.HEIGHT - 1)
+        yield Player(x=x, y=y), tx, ty
+
+
+def test_combined_search_matches_separate_checks(board):
+    for p, tx, ty in nearby_pairs(board, random.Random(18), 1500):
+        assert p.can_attack_hand_to_hand(board, tx, ty) == separate_checks(p, board, tx, ty)
+
+
+@pytest.mark.parametrize("budgets", [
+    {"walk_ap": 2, "swim_ap": 5, "stance_ap": 1},
+    {"walk_ap": 0, "swim_ap": 3, "stance_ap": 0},
+])
+def test_combined_search_follows_balance(board, monkeypatch, budgets):
+    monkeypatch.setitem(player_module.BALANCE, "h2h", budgets)
+    for p, tx, ty in nearby_pairs(board, random.Random(19), 600):
+        assert p.can_attack_hand_to_hand(board, tx, ty) == separate_checks(p, board, tx, ty)
+
+
+def test_batch_matches_single_checks(board):
+    rng = random.Random(20)
+    targets = [(x, y) for y in range(board.HEIGHT) for x in range(board.WIDTH)]
+    for _ in range(8):
+        p = Player(x=rng.randrange(board.WIDTH), y=rng.randrange(board.HEIGHT))
+        expected = [p.can_attack_hand_to_hand(board, tx, ty) for tx, ty in targets]
+        assert p.can_attack_hand_to_hand_batch(board, targets) == expected
+
+
+def test_batch_from_off_board_attacker(board):
+    assert Player().can_attack_hand_to_hand_batch(board, iter([(0, 0), (1, 1)])) == [False, False]
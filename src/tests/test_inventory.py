@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from inventory import Inventory
+from player import Player
+
+
+def test_matches_list_semantics_under_random_operations():
+    rng = random.Random(21)
+    names = ["gun", "bullet", "rpg", "rocket", "medkit"]
+    inv, ref = Inventory(), []
+
+    for _ in range(3000):
+        op = rng.random()
+        item = rng.choice(names)
+        if op < 0.45:
+            inv.append(item)
+            ref.append(item)
+        elif op < 0.75:
+            if item in ref:
+                inv.remove(item)
+                ref.remove(item)
+            else:
+                with pytest.raises(ValueError):
+                    inv.remove(item)
+        elif ref:
+            assert inv.pop() == ref.pop()
+
+        assert inv == ref
+        assert (item in inv) == (item in ref)
+        assert inv.count(item) == ref.count(item)
+        assert inv.distinct() == len(set(ref))
+
+
+def test_list_like_helpers():
+    inv = Inventory(["a", "b", "a"])
+    assert list(inv) == ["a", "b", "a"]
+    assert inv[-1] == "a" and len(inv) == 3
+    assert repr(inv) == "['a', 'b', 'a']"
+    assert inv != ["a", "b"]
+    inv.clear()
+    assert inv == [] and not inv
+    with pytest.raises(IndexError):
+        inv.pop()
+
+
+def test_on_change_fires_after_each_mutation():
+    seen = []
+    inv = Inventory(["x"], on_change=lambda i: seen.append(list(i)))
+    inv.append("y")
+    inv.remove("x")
+    inv.pop()
+    assert seen == [["x", "y"], ["y"], []]
+
+
+def test_player_is_slotted_and_accepts_lists():
+    p = Player(weapons=["gun"])
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(AttributeError):
+        p.has_car = True
+
+    p.weapons = ["rpg", "rocket"]
+    assert isinstance(p.weapons, Inventory)
+    assert p.weapons == ["rpg", "rocket"]
+
+
+def test_derived_flags_follow_mutations():
+    p = Player(x=0, y=0, weapons=["gun"], parts=["RED", "RED"], home=(0, 0))
+    assert not p.has_gun_and_bullets and p.distinct_part_colours == 1
+
+    p.add_weapon("bullet")
+    assert p.has_gun_and_bullets
+
+    assert p.transfer_home_item(category="weapon", direction="to_home", identifier="gun")
+    assert not p.has_gun_and_bullets
+
+    p.weapons = ["rpg", "rocket"]
+    assert p.has_rpg_and_rocket
+
+    p.add_part("BLUE")
+    p.parts.append("GREEN")
+    assert p.distinct_part_colours == 3
+    p.remove_part()
+    assert p.distinct_part_colours == 2
+
+
+def test_snapshot_still_holds_plain_lists():
+    p = Player(weapons=["gun", "bullet"], parts=["RED"], inventory=["medkit"])
+    carried = p.snapshot({"carried_inventory"})["carried_inventory"]
+    assert carried == {"money": 1500, "weapons": ["gun", "bullet"], "parts": ["RED"], "inventory": ["medkit"]}
+    assert all(type(v) is list for k, v in carried.items() if k != "money")
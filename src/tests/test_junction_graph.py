@@ -0,0 +1,98 @@
+import random
+from collections import deque
+
+import pytest
+
+from game_board import GameBoard
+from player import Player
+
+
+def bfs_distances(board, network, start):
+    mask = board.network_mask(network)
+    dist = {start: 0}
+    q = deque([start])
+    while q:
+        x, y = q.popleft()
+        for n in board.neighbors(x, y):
+            if n not in dist and mask >> (n[1] * board.WIDTH + n[0]) & 1:
+                dist[n] = dist[(x, y)] + 1
+                q.append(n)
+    return dist
+
+
+def road_board(width, height, cells):
+    b = GameBoard(width=width, height=height)
+    for x, y in cells:
+        b.set_terrain(x, y, road=True)
+    return b
+
+
+@pytest.mark.parametrize("network", ["road", "railroad"])
+def test_distances_match_bfs(board, network):
+    graph = board.junction_graph(network)
+    cells = board.cells_in_mask(board.network_mask(network))
+
+    rng = random.Random(network)
+    for start in rng.sample(cells, 15):
+        expected = bfs_distances(board, network, start)
+        assert graph.distances_from(start) == expected
+        for target in rng.sample(cells, 20):
+            assert graph.distance(start, target) == expected.get(target)
+
+
+def test_road_contracts_to_few_junctions(board):
+    graph = board.junction_graph("road")
+    cells = board.cells_in_mask(board.network_mask("road"))
+    assert len(graph.junctions) * 10 < len(cells)
+
+
+def test_distances_from_respects_limit(board):
+    graph = board.junction_graph("road")
+    start = board.cells_in_mask(board.network_mask("road"))[0]
+    full = graph.distances_from(start)
+    assert graph.distances_from(start, 5) == {c: d for c, d in full.items() if d <= 5}
+
+
+def test_pure_loop_gets_one_junction():
+    ring = [(x, 0) for x in range(4)] + [(3, 1), (3, 2)] + [(x, 2) for x in range(3)] + [(0, 1)]
+    b = road_board(5, 4, ring)
+    graph = b.junction_graph("road")
+
+    assert len(graph.junctions) == 1
+    assert graph.distance((0, 0), (3, 2)) == 5
+    assert graph.distance((1, 0), (1, 2)) == 4
+    assert graph.distance((0, 0), (4, 3)) is None
+
+
+def test_loop_hanging_off_a_dead_end():
+    # Dead end (0, 1) -> junction (1, 1) -> loop back to (1, 1)
+    cells = [(0, 1), (1, 1), (2, 1), (2, 0), (1, 0)]
+    b = road_board(4, 3, cells)
+    graph = b.junction_graph("road")
+
+    assert graph.distance((0, 1), (2, 0)) == 3
+    assert graph.distance((2, 1), (1, 0)) == 2
+    assert graph.distances_from((0, 1)) == bfs_distances(b, "road", (0, 1))
+
+
+def test_graph_rebuilt_after_membership_change():
+    b = road_board(6, 1, [(x, 0) for x in range(6)])
+    graph = b.junction_graph("road")
+    assert graph.distance((0, 0), (5, 0)) == 5
+
+    b.set_terrain(2, 0, forest=True)
+    assert b.junction_graph("road") is graph
+
+    b.set_terrain(2, 0, road=False)
+    assert b.junction_graph("road") is not graph
+    assert b.junction_graph("road").distance((0, 0), (5, 0)) is None
+
+
+def test_car_and_train_checks_use_the_graph():
+    b = road_board(8, 8, [(x, 3) for x in range(8)] + [(3, y) for y in range(8)])
+    p = Player(x=0, y=3, on_car=True)
+
+    assert p.can_get_by_car(b, 3, 7, 7)
+    assert not p.can_get_by_car(b, 3, 7, 6)
+    assert "road" in b._junction_graphs
+    assert p.can_get_by_car(b, 3, 7, 6) == p.can_get_by_car(b, 3, 7, 6, strategy="bfs")
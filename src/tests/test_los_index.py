@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from game_board import GameBoard
+from player import Player
+
+
+class CellOnlyBoard:
+    """
+    Hides los_index so Player falls back to the cell-by-cell scan.
+    """
+
+    def __init__(self, board):
+        self._board = board
+        self.WIDTH, self.HEIGHT = board.WIDTH, board.HEIGHT
+
+    def is_in_bounds(self, x, y):
+        return self._board.is_in_bounds(x, y)
+
+    def get_cell(self, x, y):
+        return self._board.get_cell(x, y)
+
+
+def armed_player(x, y):
+    p = Player(x=x, y=y)
+    p.weapons = ["gun", "bullet", "rpg", "rocket"]
+    return p
+
+
+def assert_attacks_match(board, rng, shots=400):
+    slow = CellOnlyBoard(board)
+    for _ in range(shots):
+        p = armed_player(rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT))
+        if rng.random() < 0.5:
+            tx, ty = p.x + rng.randint(-1, 1), rng.randrange(board.HEIGHT)
+        else:
+            tx, ty = rng.randrange(board.WIDTH), p.y + rng.randint(-1, 1)
+        tx = min(max(tx, 0), board.WIDTH - 1)
+        ty = min(max(ty, 0), board.HEIGHT - 1)
+
+        assert p.can_attack_with_gun(board, tx, ty) == p.can_attack_with_gun(slow, tx, ty)
+        assert p.can_attack_with_rocket(board, tx, ty) == p.can_attack_with_rocket(slow, tx, ty)
+
+
+def test_counts_on_shipped_board(board):
+    index = board.los_index()
+    for y in range(board.HEIGHT):
+        expected = sum(board.get_cell(x, y).is_forest() for x in range(3, 20))
+        assert index.count("forest", 3, y, 19, y) == expected
+        assert index.count("forest", 19, y, 3, y) == expected
+    for x in range(board.WIDTH):
+        expected = sum(board.get_cell(x, y).is_building() for y in range(board.HEIGHT))
+        assert index.count("building", x, 0, x, board.HEIGHT - 1) == expected
+
+
+def test_diagonal_run_rejected():
+    with pytest.raises(ValueError):
+        GameBoard(width=3, height=3).los_index().count("forest", 0, 0, 2, 2)
+
+
+@pytest.mark.parametrize("backend", ["cells", "array"])
+def test_attacks_match_cell_scan(backend, board_csv):
+    board = GameBoard.from_csv(board_csv, backend=backend)
+    assert_attacks_match(board, random.Random(15))
+
+
+def test_index_follows_builds_and_terrain_edits(board_csv):
+    board = GameBoard(board_csv)
+    index = board.los_index()
+    rng = random.Random(7)
+
+    for _ in range(30):
+        x, y = rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT)
+        if rng.random() < 0.5:
+            board.get_cell(x, y).build()
+        else:
+            board.set_terrain(x, y, forest=rng.random() < 0.5)
+
+    assert board.los_index() is index
+    assert_attacks_match(board, random.Random(8))
+
+
+def test_forest_allowed_on_last_scanned_cell():
+    b = GameBoard(width=6, height=1)
+    index = b.los_index()
+    b.set_terrain(3, 0, forest=True)
+
+    assert index.blocked((1, 0), (3, 0))
+    assert not index.blocked((1, 0), (3, 0), allow_forest_on_last_scanned_cell=True)
+    assert not index.blocked((3, 0), (3, 0), allow_forest_on_last_scanned_cell=True)
+    assert index.blocked((4, 0), (2, 0), allow_forest_on_last_scanned_cell=True)
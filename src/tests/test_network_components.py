@@ -0,0 +1,96 @@
+import pytest
+
+from game_board import GameBoard, NETWORK_RULES
+from player import Player
+
+
+def flood(board, network, start):
+    rule = NETWORK_RULES[network]
+    seen = {start}
+    stack = [start]
+    while stack:
+        x, y = stack.pop()
+        for n in board.neighbors(x, y):
+            if n not in seen and rule(board.get_cell(*n)):
+                seen.add(n)
+                stack.append(n)
+    return seen
+
+
+def two_road_segments():
+    # ==.==  (gap at x=2)
+    b = GameBoard(width=5, height=1)
+    for x in (0, 1, 3, 4):
+        b.set_terrain(x, 0, road=True)
+    return b
+
+
+@pytest.mark.parametrize("network", sorted(NETWORK_RULES))
+def test_labels_match_flood_fill_on_shipped_board(network, board):
+    labels = board.component_labels(network)
+    rule = NETWORK_RULES[network]
+
+    checked = set()
+    for cell in board.iter_cells():
+        xy = (cell.x, cell.y)
+        if not rule(cell):
+            assert board.component_id(network, *xy) == -1
+            continue
+        if xy in checked:
+            continue
+        component = flood(board, network, xy)
+        ids = {labels[board.index_of(*c)] for c in component}
+        assert len(ids) == 1
+        checked |= component
+
+
+def test_same_component_requires_membership():
+    b = two_road_segments()
+    assert b.same_component("road", (0, 0), (1, 0))
+    assert not b.same_component("road", (0, 0), (3, 0))
+    assert not b.same_component("road", (2, 0), (2, 0))
+
+
+def test_unknown_network_rejected():
+    with pytest.raises(ValueError):
+        GameBoard(width=2, height=2).component_labels("air")
+
+
+def test_disconnected_target_rejected_before_any_search():
+    b = two_road_segments()
+    p = Player(x=0, y=0, on_car=True)
+
+    assert p.can_get_by_car(b, 3, 0, 10) is False
+    assert b.reach_cache.misses == 0
+
+    assert p.can_get_by_car(b, 1, 0, 10) is True
+
+
+def test_edit_joining_networks_relabels():
+    b = two_road_segments()
+    assert not b.same_component("road", (0, 0), (4, 0))
+
+    b.set_terrain(2, 0, road=True)
+    assert b.same_component("road", (0, 0), (4, 0))
+    assert Player(x=0, y=0, on_car=True).can_get_by_car(b, 4, 0, 4) is True
+
+
+def test_build_keeps_labels():
+    b = GameBoard(width=3, height=3)
+    labels = b.component_labels("walkable")
+    b.get_cell(1, 1).build()
+    assert b.component_labels("walkable") is labels
+
+
+def test_array_backend_edits_after_networks_are_built():
+    b = GameBoard(width=5, height=1, backend="array")
+    for x in (0, 1, 3, 4):
+        b.set_terrain(x, 0, road=True)
+    for network in NETWORK_RULES:
+        b.component_labels(network)
+    b.junction_graph("road")
+
+    b.get_cell(2, 0).build()
+    b.set_terrain(2, 0, road=True)
+    assert b.same_component("road", (0, 0), (4, 0))
+    assert b.junction_graph("road").has_cell(b.index_of(2, 0))
@@ -0,0 +1,73 @@
+import pytest
+
+from game_board import GameBoard
+from player import Player
+
+
+def land_cell(board):
+    return next(
+        (c.x, c.y) for c in board.iter_cells()
+        if not c.is_water() and 8 < c.x < 28 and 8 < c.y < 28
+    )
+
+
+def test_walk_distances_on_open_plain():
+    b = GameBoard(width=5, height=5)
+    p = Player(x=2, y=2)
+
+    reach = p.reachable_cells(b, "walk", 2)
+
+    assert reach[(2, 2)] == 0
+    assert reach[(2, 0)] == 2
+    assert reach[(3, 3)] == 2
+    assert (0, 0) not in reach
+    assert len(reach) == 13
+
+
+def test_zero_action_points_returns_only_start():
+    b = GameBoard(width=3, height=3)
+    assert Player(x=1, y=1).reachable_cells(b, "walk", 0) == {(1, 1): 0}
+
+
+def test_vehicle_modes_require_flag():
+    b = GameBoard(width=3, height=1)
+    for x in range(3):
+        b.set_terrain(x, 0, road=True)
+
+    assert Player(x=0, y=0).reachable_cells(b, "car", 5) == {}
+    reach = Player(x=0, y=0, on_car=True).reachable_cells(b, "car", 5)
+    assert reach == {(0, 0): 0, (1, 0): 1, (2, 0): 2}
+
+
+def test_start_cell_must_suit_the_mode():
+    b = GameBoard(width=3, height=3)
+    assert Player(x=1, y=1).reachable_cells(b, "swim", 3) == {}
+
+
+@pytest.mark.parametrize("ap", [-1, 1.5, "2"])
+def test_invalid_action_points_give_empty_result(ap):
+    b = GameBoard(width=3, height=3)
+    assert Player(x=1, y=1).reachable_cells(b, "walk", ap) == {}
+
+
+def test_off_board_player_gives_empty_result():
+    b = GameBoard(width=3, height=3)
+    assert Player().reachable_cells(b, "walk", 3) == {}
+
+
+def test_unknown_mode_raises():
+    b = GameBoard(width=3, height=3)
+    with pytest.raises(ValueError):
+        Player(x=1, y=1).reachable_cells(b, "fly", 3)
+
+
+@pytest.mark.parametrize("backend", ["cells", "array"])
+def test_reachable_set_agrees_with_can_get_by_walk(backend, board_csv):
+    b = GameBoard(board_csv, backend=backend)
+    x, y = land_cell(b)
+    p = Player(x=x, y=y)
+
+    reach = p.reachable_cells(b, "walk", 6)
+    for ty in range(y - 7, y + 8):
+        for tx in range(x - 7, x + 8):
+            assert ((tx, ty) in reach) == p.can_get_by_walk(b, tx, ty, 6)
@@ -0,0 +1,124 @@
+import json
+import random
+
+from player import Player
+from player_table import PlayerTable
+
+
+def reference_snapshot(p):
+    has_home = p.home != (-1, -1)
+    return {
+        "state": {"x": p.x, "y": p.y, "wound": p.wound, "has_home": has_home, **({"home": p.home} if has_home else {})},
+        "status": {f: getattr(p, f) for f in ("on_land", "on_water", "on_car", "on_boat", "on_train")},
+        "carried_inventory": {
+            "money": p.money, "weapons": list(p.weapons), "parts": list(p.parts), "inventory": list(p.inventory),
+        },
+        "home_inventory": {
+            "is_at_home": (p.x, p.y) == p.home, "home_money": p.home_money, "weapons": list(p.home_weapons),
+            "parts": list(p.home_parts), "inventory": list(p.home_inventory),
+        } if has_home else {},
+    }
+
+
+def random_mutation(p, rng):
+    table = p.table
+    choice = rng.randrange(9)
+    if choice == 0:
+        p.x, p.y = rng.randrange(5), rng.randrange(5)
+    elif choice == 1:
+        p.money += rng.randint(-5, 5)
+    elif choice == 2:
+        p.home = rng.choice([(-1, -1), (1, 1), (p.x, p.y)])
+    elif choice == 3:
+        p.add_weapon(rng.choice(["gun", "bullets", "knife"]))
+    elif choice == 4:
+        p.remove_weapon()
+    elif choice == 5:
+        p.transfer_home_item(category="weapon", direction=rng.choice(["to_home", "to_player"]), identifier="gun")
+    elif choice == 6:
+        setattr(p, rng.choice(["on_land", "on_water", "on_car"]), rng.random() < 0.5)
+    elif choice == 7:
+        table.translate(1, 0, rows=[p.row])
+    else:
+        table.apply_damage([p.row], rng.randint(-1, 2))
+
+
+def test_cached_snapshot_tracks_every_mutation():
+    rng = random.Random(23)
+    table = PlayerTable()
+    players = [Player(x=1, y=1, home=(1, 1), table=table) for _ in range(3)]
+
+    for _ in range(600):
+        p = rng.choice(players)
+        random_mutation(p, rng)
+        q = rng.choice(players)
+        assert q.snapshot() == reference_snapshot(q)
+        assert q.snapshot_json() == json.dumps(q.snapshot(), separators=(",", ":"), sort_keys=True)
+
+
+def test_delta_reports_only_changed_fields():
+    p = Player(x=2, y=2, home=(2, 2), weapons=["gun"])
+    assert p.snapshot_delta(0) == p.snapshot()
+
+    v = p.version
+    assert p.snapshot_delta(v) == {}
+
+    p.money -= 100
+    p.add_weapon("bullets")
+    assert p.snapshot_delta(v) == {"carried_inventory": {"money": 1400, "weapons": ["gun", "bullets"]}}
+
+    v = p.version
+    p.x = 3
+    assert p.snapshot_delta(v) == {"state": {"x": 3}, "home_inventory": {"is_at_home": False}}
+
+    v = p.version
+    p.home = (-1, -1)
+    assert p.snapshot_delta(v) == {
+        "state": {"x": 3, "y": 2, "wound": 0, "has_home": False},
+        "home_inventory": {},
+        "removed": {
+            "state": ["home"],
+            "home_inventory": ["is_at_home", "home_money", "weapons", "parts", "inventory"],
+        },
+    }
+
+
+def apply_delta(snapshot, delta):
+    for section, keys in delta.get("removed", {}).items():
+        for key in keys:
+            snapshot[section].pop(key, None)
+    for section, values in delta.items():
+        if section != "removed":
+            snapshot[section].update(values)
+    return snapshot
+
+
+def test_deltas_rebuild_the_snapshot():
+    rng = random.Random(5)
+    p = Player(x=1, y=1, weapons=["gun"])
+    client = p.snapshot()
+    v = p.version
+
+    for _ in range(400):
+        if rng.random() < 0.3:
+            p.home = rng.choice([(-1, -1), (1, 1), (2, 3)])
+        else:
+            random_mutation(p, rng)
+        client = apply_delta(client, p.snapshot_delta(v))
+        v = p.version
+        assert client == p.snapshot()
+
+
+def test_sections_and_cache_isolation():
+    p = Player(weapons=["gun"])
+    first = p.snapshot({"carried_inventory"})
+    first["carried_inventory"]["weapons"].append("tampered")
+
+    assert list(p.snapshot({"carried_inventory"})) == ["carried_inventory"]
+    assert p.snapshot()["carried_inventory"]["weapons"] == ["gun"]
+    assert p.snapshot_json({"status"}).startswith('{"status":{"on_boat":false')
+
+
+def test_str_keeps_indented_format():
+    p = Player(x=1, y=2)
+    assert str(p) == json.dumps(p.snapshot(), indent=2, sort_keys=True)
@@ -0,0 +1,156 @@
+import weakref
+
+import pytest
+
+from constants import GUN_KIT
+from game_board import GameBoard
+from player import Player
+from player_table import PlayerTable
+
+
+def lobby(size=6):
+    table = PlayerTable()
+    players = [
+        Player(x=i, y=i, on_water=i % 2 == 1, on_land=i % 2 == 0, table=table)
+        for i in range(size)
+    ]
+    return table, players
+
+
+def test_players_are_rows_of_a_shared_table():
+    table, players = lobby()
+    assert len(table) == 6
+    assert [p.row for p in players] == list(range(6))
+    assert all(p.table is table for p in players)
+
+    players[2].money = 40
+    players[2].home = (7, 8)
+    players[2].on_car = True
+    assert table.money[2] == 40
+    assert (table.home_x[2], table.home_y[2]) == (7, 8)
+    assert table.on_car[2] == 1 and players[2].on_car is True
+
+
+def test_standalone_players_share_one_table():
+    a, b = Player(x=1), Player(x=2)
+    assert a.table is b.table
+    assert a.row != b.row and (a.x, b.x) == (1, 2)
+
+
+def test_rows_are_released_and_reused():
+    table, players = lobby(3)
+    players[1].add_weapon("gun")
+    players[1].money = 5
+
+    # The table holds no strong reference: dropping the player frees its row
+    ref = weakref.ref(players[1])
+    del players[1]
+    assert ref() is None
+    assert table.free_rows == [1]
+    assert table.weapons[1] is None and table.on_water[1] == 0
+    assert table.players_where("on_land") == [players[0], players[1]]
+
+    p = Player(table=table)
+    assert p.row == 1 and len(table) == 3
+    assert (p.money, list(p.weapons)) == (1500, [])
+
+
+def test_release_row_ignores_later_owner():
+    table, players = lobby(2)
+    old = players[0]
+    table.release_row(old.row)
+    new = Player(x=5, table=table)
+    assert new.row == old.row
+
+    # The stale proxy going away must not free the new player's row
+    row = new.row
+    del old, players
+    assert row not in table.free_rows
+    assert table.player[row]() is new and new.x == 5
+
+
+def test_non_int_values_are_kept():
+    table, players = lobby(2)
+    p = Player(x=1.5, money=10**30, table=table)
+    assert (p.x, p.money) == (1.5, 10**30)
+    assert [q.x for q in players] == [0, 1]
+
+    table.translate(1, 0)
+    assert p.x == 2.5 and players[1].x == 2
+    p.home = (0.5, 1)
+    assert p.home == (0.5, 1)
+
+
+def test_rows_where_flags():
+    table, players = lobby()
+    assert table.rows_where("on_water") == [1, 3, 5]
+    assert table.players_where("on_land") == players[0::2]
+    with pytest.raises(ValueError):
+        table.rows_where("x")
+
+
+def test_batch_moves_update_tracked_players():
+    board = GameBoard(width=10, height=10)
+    table, players = lobby()
+    board.track_player(players[1])
+
+    table.translate(2, 0)
+    assert [p.x for p in players] == [2, 3, 4, 5, 6, 7]
+    assert board.players_on(3, 1) == [players[1]]
+
+    table.translate(0, 1, rows=[1, 4])
+    assert (players[1].y, players[4].y, players[0].y) == (2, 5, 0)
+    assert board.players_on(3, 2) == [players[1]]
+
+    table.set_positions([1], [(9, 9)])
+    assert board.players_on(9, 9) == [players[1]]
+
+
+def test_batch_damage_matches_apply_damage():
+    table, players = lobby(4)
+    players[1].wound = 1
+    singles = [Player(wound=p.wound) for p in players]
+
+    table.apply_damage([0, 1, 2, 3], 2)
+    for p in singles:
+        p.apply_damage(2)
+    assert [p.wound for p in players] == [p.wound for p in singles] == [2, 1, 2, 2]
+
+    table.apply_damage([0, 1], 0)
+    assert [p.wound for p in players] == [1, 0, 2, 2]
+
+
+def test_inventories_and_derived_flags_live_in_the_table():
+    table = PlayerTable()
+    p = Player(weapons=["gun", "bullet"], parts=["RED", "BLUE"], table=table)
+    q = Player(table=table)
+
+    assert table.has_gun_and_bullets[p.row] == 1 and p.has_gun_and_bullets
+    assert p.distinct_part_colours == 2
+    assert table.weapons[q.row] is None  # empty inventories are not stored
+    q.add_weapon("rpg")
+    q.add_weapon("rocket")
+    assert q.has_rpg_and_rocket and q.weapons == ["rpg", "rocket"]
+
+
+def test_empty_inventories_stay_out_of_the_table():
+    table = PlayerTable()
+    p = Player(x=1, y=1, home=(1, 1), table=table)
+    p.snapshot()
+    p.snapshot_json()
+    assert list(p.weapons) == [] and "gun" not in p.parts
+    assert table.weapons[p.row] is None and table.home_parts[p.row] is None
+
+    # A handed-out empty inventory attaches on its first change...
+    weapons = p.weapons
+    weapons.append("gun")
+    assert table.weapons[p.row] is weapons and p.weapons == ["gun"]
+
+    # ...and detaches once it is empty again
+    weapons.pop()
+    assert table.weapons[p.row] is None and p.weapons == []
+    weapons.extend(GUN_KIT)
+    assert p.has_gun_and_bullets and p.weapons == list(GUN_KIT)
+
+    p.parts = []
+    assert table.parts[p.row] is None
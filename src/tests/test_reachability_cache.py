@@ -0,0 +1,154 @@
+import pytest
+
+from game_board import GameBoard
+from player import Player
+from reachability_cache import ReachabilityCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ReachabilityCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["misses"] == 1
+
+
+def test_zero_size_disables_cache():
+    cache = ReachabilityCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_resize_trims_and_negative_size_rejected():
+    cache = ReachabilityCache(maxsize=3)
+    for k in "abc":
+        cache.put(k, k)
+    cache.resize(1)
+    assert len(cache) == 1 and cache.get("c") == "c"
+
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+    with pytest.raises(ValueError):
+        ReachabilityCache(maxsize=-1)
+
+
+def test_repeated_queries_hit_the_board_cache():
+    b = GameBoard(width=8, height=8)
+    p = Player(x=3, y=3)
+
+    first = p.reachable_cells(b, "walk", 4)
+    second = p.reachable_cells(b, "walk", 4)
+
+    assert first is second
+    assert b.reach_cache.stats()["hits"] == 1
+    assert b.reach_cache.stats()["misses"] == 1
+
+
+def test_cached_result_is_read_only():
+    b = GameBoard(width=4, height=4)
+    reach = Player(x=0, y=0).reachable_cells(b, "walk", 2)
+    with pytest.raises(TypeError):
+        reach[(3, 3)] = 1  # type: ignore[index]
+
+
+def test_every_result_is_read_only():
+    b = GameBoard(width=4, height=4)
+    b.reach_cache = None
+    results = [
+        Player(x=0, y=0).reachable_cells(b, "walk", 2),   # uncached search
+        Player(x=0, y=0).reachable_cells(b, "walk", -1),  # bad AP
+        Player().reachable_cells(b, "walk", 2),           # off board
+        Player(x=0, y=0).reachable_cells(b, "car", 2),    # no car
+        Player(x=0, y=0).reachable_cells(b, "swim", 2),   # not at sea
+    ]
+    for reach in results:
+        with pytest.raises(TypeError):
+            reach[(1, 1)] = 1  # type: ignore[index]
+
+
+def test_players_on_same_cell_share_entries():
+    b = GameBoard(width=6, height=6)
+    Player(x=2, y=2).can_get_by_walk(b, 4, 4, 6)
+    Player(x=2, y=2).can_get_by_walk(b, 0, 0, 6)
+
+    assert b.reach_cache.hits == 1
+
+
+def test_build_bumps_generation_and_invalidates():
+    b = GameBoard(width=3, height=1)
+    b.set_terrain(1, 0, road=True)
+    p = Player(x=0, y=0, on_car=True)
+    b.set_terrain(0, 0, road=True)
+    generation = b.generation
+
+    assert p.reachable_cells(b, "car", 3) == {(0, 0): 0, (1, 0): 1}
+
+    b.set_terrain(2, 0, road=True)
+    assert b.generation > generation
+    assert p.reachable_cells(b, "car", 3) == {(0, 0): 0, (1, 0): 1, (2, 0): 2}
+
+    generation = b.generation
+    Player(x=2, y=0).build_home(b)  # road is not buildable
+    assert b.generation == generation
+
+    b2 = GameBoard(width=3, height=3)
+    b2.get_cell(0, 0).build()
+    assert b2.generation == 1
+
+
+def test_attack_checks_use_cache():
+    b = GameBoard(width=8, height=8)
+    p = Player(x=3, y=3)
+    for tx in range(8):
+        p.can_attack_hand_to_hand(b, tx, 3)
+
+    assert b.reach_cache.hits >= 6
+
+
+def test_single_attack_check_searches_before_caching():
+    b = GameBoard(width=8, height=8)
+    p = Player(x=3, y=3)
+
+    # First miss: answered by the lockstep search, nothing stored
+    assert p.can_attack_hand_to_hand(b, 5, 3)
+    assert (len(b.reach_cache), b.reach_cache.misses) == (0, 1)
+
+    # Asked again from the same cell: the walk reach is stored
+    assert p.can_attack_hand_to_hand(b, 3, 7)
+    assert len(b.reach_cache) == 1
+    assert p.can_attack_hand_to_hand(b, 0, 3)
+    assert b.reach_cache.hits == 1
+
+
+def test_probe_reports_repeated_keys():
+    cache = ReachabilityCache(maxsize=2)
+    assert not cache.probe("a")
+    assert cache.probe("a")
+    assert not cache.probe("a")
+
+    for key in ("b", "c", "d"):
+        cache.probe(key)
+    assert not cache.probe("b")  # aged out like an entry
+
+
+def test_batch_attack_checks_use_cache():
+    b = GameBoard(width=8, height=8)
+    p = Player(x=3, y=3)
+    for ty in range(4):
+        p.can_attack_hand_to_hand_batch(b, [(tx, ty) for tx in range(8)])
+
+    # One walk search; the swim search never starts on land
+    assert (b.reach_cache.misses, b.reach_cache.hits) == (1, 3)
+
+
+def test_cache_size_is_configurable():
+    b = GameBoard(width=4, height=4, reach_cache_size=1)
+    Player(x=0, y=0).reachable_cells(b, "walk", 2)
+    Player(x=1, y=0).reachable_cells(b, "walk", 2)
+    assert len(b.reach_cache) == 1
@@ -0,0 +1,133 @@
+import heapq
+import random
+from fractions import Fraction
+
+import pytest
+
+from game_board import GameBoard
+from route_planner import RoutePlanner
+
+
+def reference_cost(board, start, target, budgets):
+    """
+    Textbook Dijkstra on (x, y, swimming) states with Fraction costs.
+    """
+    step = {move: Fraction(1, n) for move, n in budgets.items()}
+
+    def walkable(c):
+        return not c.is_water() or c.is_road()
+
+    sx, sy = start
+    cell = board.get_cell(sx, sy)
+    heap = []
+    if walkable(cell):
+        heap.append((Fraction(0), sx, sy, False))
+    if cell.is_sea():
+        heap.append((Fraction(0), sx, sy, True))
+    seen = set()
+    while heap:
+        d, x, y, swimming = heapq.heappop(heap)
+        if (x, y, swimming) in seen:
+            continue
+        seen.add((x, y, swimming))
+        if (x, y) == target:
+            return d
+        here = board.get_cell(x, y)
+        for nx, ny in board.neighbors(x, y):
+            there = board.get_cell(nx, ny)
+            if swimming:
+                if there.is_sea():
+                    heapq.heappush(heap, (d + step["swim"], nx, ny, True))
+                if there.is_shore():
+                    heapq.heappush(heap, (d + step["stance"], nx, ny, False))
+            else:
+                if walkable(there):
+                    heapq.heappush(heap, (d + step["walk"], nx, ny, False))
+                if here.is_shore() and there.is_sea():
+                    heapq.heappush(heap, (d + step["stance"], nx, ny, True))
+    return None
+
+
+def test_costs_follow_balance():
+    planner = RoutePlanner(GameBoard(width=3, height=3))
+    assert planner.unit == 6
+    assert planner.step_costs == {"walk": 1, "swim": 2, "stance": 6}
+
+
+def test_walk_route_on_open_plain():
+    b = GameBoard(width=5, height=5)
+    route = RoutePlanner(b).plan((0, 0), (3, 1))
+
+    assert route.path[0] == (0, 0) and route.path[-1] == (3, 1)
+    assert len(route.path) == 5
+    assert route.moves == ["walk"] * 4
+    assert route.cost == Fraction(4, 6)
+    assert route.breakdown == {"walk": 4, "swim": 0, "stance": 0}
+
+
+def test_route_crosses_strait_with_stance_changes():
+    b = GameBoard(width=5, height=1)
+    b.set_terrain(2, 0, sea=True, plain=False)
+
+    route = RoutePlanner(b).plan((0, 0), (4, 0))
+
+    assert route.path == [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)]
+    assert route.moves == ["walk", "stance", "stance", "walk"]
+    assert route.cost == Fraction(2, 6) + 2
+
+
+def test_swimming_beats_a_long_walk():
+    # Walking around the bay takes 12 steps (2 actions); crossing it
+    # takes two stance changes and six swim steps.
+    b = GameBoard(width=9, height=3)
+    for x in range(1, 8):
+        b.set_terrain(x, 0, sea=True, plain=False)
+        b.set_terrain(x, 1, sea=True, plain=False)
+
+    cheap = RoutePlanner(b, {"walk_ap": 6, "swim_ap": 12, "stance_ap": 6}).plan((0, 0), (8, 0))
+    assert cheap.breakdown == {"walk": 0, "swim": 6, "stance": 2}
+    assert cheap.cost == Fraction(2, 6) + Fraction(6, 12)
+
+    default = RoutePlanner(b).plan((0, 0), (8, 0))
+    assert default.breakdown == {"walk": 12, "swim": 0, "stance": 0}
+
+
+def test_max_cost_and_unreachable_targets():
+    b = GameBoard(width=6, height=1)
+    planner = RoutePlanner(b)
+
+    assert planner.plan((0, 0), (5, 0), max_cost=Fraction(5, 6)) is not None
+    assert planner.plan((0, 0), (5, 0), max_cost=Fraction(4, 6)) is None
+    assert planner.plan((0, 0), (9, 0)) is None
+
+    b.set_terrain(3, 0, swamp=True, plain=False)
+    assert planner.plan((0, 0), (5, 0)) is None
+
+
+def test_same_cell_route_is_free():
+    route = RoutePlanner(GameBoard(width=2, height=2)).plan((1, 1), (1, 1))
+    assert route.path == [(1, 1)] and route.cost == 0
+
+
+def test_invalid_budgets_rejected():
+    with pytest.raises(ValueError):
+        RoutePlanner(GameBoard(width=2, height=2), {"walk_ap": 0, "swim_ap": 3, "stance_ap": 1})
+
+
+def test_matches_reference_dijkstra(board):
+    rng = random.Random(13)
+    planner = RoutePlanner(board)
+    budgets = {"walk": 6, "swim": 3, "stance": 1}
+    for _ in range(40):
+        start = (rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT))
+        target = (rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT))
+
+        route = planner.plan(start, target)
+        expected = reference_cost(board, start, target, budgets)
+
+        if expected is None:
+            assert route is None
+            continue
+        assert route.cost == expected
+        assert route.path[0] == start and route.path[-1] == target
+        assert all(abs(ax - bx) + abs(ay - by) == 1 for (ax, ay), (bx, by) in zip(route.path, route.path[1:]))
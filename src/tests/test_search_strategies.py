@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from constants import MOVEMENT_NETWORKS
+from game_board import GameBoard
+from player import MOVEMENT_MODES, Player
+from search import SEARCH_STRATEGIES, astar_search, bfs_search
+
+
+CHECKS = {
+    "car": Player.can_get_by_car,
+    "train": Player.can_get_by_train,
+    "boat": Player.can_get_by_boat,
+    "walk": Player.can_get_by_walk,
+    "swim": Player.can_get_by_swim,
+}
+
+
+@pytest.fixture(scope="module")
+def rail_board(board_csv):
+    # The shipped railroad runs diagonally (no 4-connected steps); lay a
+    # straight line so train searches have somewhere to go
+    b = GameBoard(board_csv)
+    for x in range(4, 32):
+        b.set_terrain(x, 18, railroad=True)
+    for y in range(6, 30):
+        b.set_terrain(20, y, railroad=True)
+    return b
+
+
+def equipped_player(x, y):
+    p = Player(x=x, y=y)
+    p.on_car = p.on_train = p.on_boat = True
+    return p
+
+
+@pytest.mark.parametrize("mode", sorted(CHECKS))
+@pytest.mark.parametrize("strategy", sorted(SEARCH_STRATEGIES))
+def test_strategies_agree_with_default(board, rail_board, mode, strategy):
+    if mode == "train":
+        board = rail_board
+    rng = random.Random(f"{mode}-{strategy}")
+    check = CHECKS[mode]
+    network = board.cells_in_mask(board.network_mask(MOVEMENT_NETWORKS[mode]))
+    answers = set()
+    for _ in range(150):
+        # Mostly on-network pairs, so the searches themselves are compared
+        if rng.random() < 0.8:
+            (x, y), (tx, ty) = rng.choice(network), rng.choice(network)
+        else:
+            x, y = rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT)
+            tx, ty = rng.randrange(board.WIDTH), rng.randrange(board.HEIGHT)
+        p = equipped_player(x, y)
+        ap = rng.randint(0, 19)
+        answer = check(p, board, tx, ty, ap, strategy=strategy)
+        assert answer == check(p, board, tx, ty, ap)
+        answers.add((answer, (x, y) == (tx, ty)))
+    assert (True, False) in answers and (False, False) in answers
+
+
+def test_class_level_strategy_is_used(board, monkeypatch):
+    calls = []
+
+    def spy(board, start, target, max_cost, passable):
+        calls.append((start, target, max_cost))
+        return bfs_search(board, start, target, max_cost, passable)
+
+    monkeypatch.setitem(SEARCH_STRATEGIES, "spy", spy)
+    monkeypatch.setattr(Player, "search_strategy", "spy")
+
+    b = GameBoard(width=6, height=6)
+    assert Player(x=0, y=0).can_get_by_walk(b, 5, 0, 5)
+    assert calls == [((0, 0), (5, 0), 5)]
+
+
+def test_unknown_strategy_raises():
+    b = GameBoard(width=4, height=4)
+    with pytest.raises(ValueError):
+        Player(x=0, y=0).can_get_by_walk(b, 3, 0, 3, strategy="dfs")
+
+
+def test_astar_expands_fewer_nodes_on_straight_line():
+    b = GameBoard(width=40, height=40)
+    walkable = MOVEMENT_MODES["walk"][1]
+
+    bfs = bfs_search(b, (5, 20), (30, 20), 30, walkable)
+    astar = astar_search(b, (5, 20), (30, 20), 30, walkable)
+
+    assert bfs.found and astar.found
+    assert astar.expanded < bfs.expanded
+
+
+@pytest.mark.parametrize("strategy", sorted(SEARCH_STRATEGIES))
+def test_detour_around_wall(strategy):
+    b = GameBoard(width=7, height=7)
+    for y in range(6):
+        b.set_terrain(3, y, sea=True, plain=False)
+    walkable = MOVEMENT_MODES["walk"][1]
+    search = SEARCH_STRATEGIES[strategy]
+
+    # Straight distance is 6, the detour through row 6 costs 18.
+    assert not search(b, (0, 0), (6, 0), 17, walkable).found
+    assert search(b, (0, 0), (6, 0), 18, walkable).found
+
+
+class FakeCell:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+    def is_water(self):
+        return False
+
+    def is_sea(self):
+        return False
+
+
+class FakeBoard:
+    WIDTH = 5
+    HEIGHT = 5
+
+    def is_in_bounds(self, x, y):
+        return 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT
+
+    def get_cell(self, x, y):
+        return FakeCell(x, y)
+
+    def neighbors(self, x, y):
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if self.is_in_bounds(x + dx, y + dy):
+                yield (x + dx, y + dy)
+
+
+@pytest.mark.parametrize("strategy", sorted(SEARCH_STRATEGIES))
+def test_strategies_work_on_minimal_board(strategy):
+    p = Player(x=0, y=0)
+    assert p.can_get_by_walk(FakeBoard(), 4, 4, 8, strategy=strategy)
+    assert not p.can_get_by_walk(FakeBoard(), 4, 4, 7, strategy=strategy)
@@ -0,0 +1,85 @@
+import pytest
+
+from bitboard import spread4
+from game_board import GameBoard
+
+
+def reference_shores(board):
+    """
+    Straightforward per-cell definition of a shore.
+    """
+    result = set()
+    for y in range(board.HEIGHT):
+        for x in range(board.WIDTH):
+            if board.get_cell(x, y).is_water():
+                continue
+            if any(board.get_cell(nx, ny).is_water() for nx, ny in board.neighbors(x, y)):
+                result.add((x, y))
+    return result
+
+
+@pytest.fixture(params=["cells", "array"])
+def backend(request):
+    return request.param
+
+
+def test_spread4_does_not_wrap_rows():
+    # 3x2 board, bit at (2, 0) must not leak into (0, 1)
+    mask = 1 << 2
+    assert spread4(mask, 3, 2) == (1 << 1) | (1 << 5)
+
+    # bit at (0, 1) must not leak into (2, 0)
+    mask = 1 << 3
+    assert spread4(mask, 3, 2) == (1 << 0) | (1 << 4)
+
+
+def test_vectorized_recompute_matches_reference_on_shipped_board(backend, board_csv):
+    b = GameBoard(board_csv, backend=backend)
+    assert set(b.shore_cells()) == reference_shores(b)
+
+
+def test_set_terrain_water_updates_neighbourhood(backend):
+    b = GameBoard(width=5, height=5, backend=backend)
+    assert b.shore_cells() == []
+
+    b.set_terrain(2, 2, sea=True, plain=False)
+
+    assert set(b.shore_cells()) == {(1, 2), (3, 2), (2, 1), (2, 3)}
+    assert not b.get_cell(2, 2).is_shore()
+    assert set(b.shore_cells()) == reference_shores(b)
+
+
+def test_set_terrain_removing_water_clears_shores(backend):
+    b = GameBoard(width=5, height=5, backend=backend)
+    b.set_terrain(2, 2, swamp=True, plain=False)
+    b.set_terrain(2, 2, swamp=False, plain=True)
+
+    assert b.shore_cells() == []
+
+
+def test_incremental_updates_match_full_recompute(backend, board_csv):
+    b = GameBoard(board_csv, backend=backend)
+
+    edits = [(5, 5, {"sea": True}), (6, 5, {"swamp": True}), (5, 5, {"sea": False}), (1, 1, {"sea": True})]
+    for x, y, changes in edits:
+        b.set_terrain(x, y, **changes)
+        assert set(b.shore_cells()) == reference_shores(b)
+
+    incremental = b.mask("shore")
+    b._recompute_shores()
+    assert b.mask("shore") == incremental
+
+
+def test_set_terrain_rejects_shore_and_unknown_layers():
+    b = GameBoard(width=3, height=3)
+
+    with pytest.raises(ValueError):
+        b.set_terrain(1, 1, shore=True)
+    with pytest.raises(ValueError):
+        b.set_terrain(1, 1, lava=True)
+
+
+def test_set_terrain_rejects_out_of_bounds():
+    b = GameBoard(width=3, height=3)
+    with pytest.raises(ValueError):
+        b.set_terrain(3, 0, sea=True)
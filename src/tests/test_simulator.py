@@ -0,0 +1,129 @@
+from multiprocessing import shared_memory
+
+import pytest
+
+from board_binary import BINARY_LAYERS
+from constants import BALANCE
+from game_board import GameBoard
+from simulator import (
+    MatchStats,
+    SharedBoard,
+    Simulator,
+    _Worker,
+    attach_layers,
+    balance_overrides,
+    plan_units,
+    play_match,
+)
+
+
+def without_time(result):
+    return result._replace(seconds=0)
+
+
+def test_shared_board_round_trip(board):
+    layers = board.to_layers()
+    with SharedBoard(layers) as shared:
+        shm, attached = attach_layers(shared.spec)
+        try:
+            for name in BINARY_LAYERS:
+                assert bytes(attached.layer(name)) == bytes(layers.layer(name))
+        finally:
+            for name in BINARY_LAYERS:
+                attached.layer(name).release()
+            shm.close()
+
+
+def test_reset_board_undoes_terrain_edits(board):
+    with SharedBoard(board.to_layers()) as shared:
+        worker = _Worker(shared.spec)
+        try:
+            wb = worker.board
+            x, y = next(
+                (x, y) for y in range(wb.HEIGHT) for x in range(wb.WIDTH)
+                if wb.get_cell(x, y).is_buildable()
+            )
+            assert wb.get_cell(x, y).build()
+            generation = wb.generation
+            assert bytes(wb.layers.building) != bytes(worker.shared.building)
+
+            worker.reset_board()
+            assert wb.generation > generation
+            for name in BINARY_LAYERS:
+                assert bytes(wb.layers.layer(name)) == bytes(worker.shared.layer(name))
+            assert wb.get_cell(x, y).is_buildable()
+        finally:
+            worker.close()
+
+
+def test_failed_pool_start_releases_shared_memory(board, monkeypatch):
+    created = []
+    real_init = SharedBoard.__init__
+
+    def spy(self, layers):
+        real_init(self, layers)
+        created.append(self.shm.name)
+
+    monkeypatch.setattr(SharedBoard, "__init__", spy)
+    with pytest.raises(ValueError):
+        Simulator(board, workers=-1)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=created[0])
+
+
+def test_same_seed_replays_match(board_csv):
+    first = play_match(GameBoard(board_csv), 5, players=3, max_turns=80)
+    again = play_match(GameBoard(board_csv), 5, players=3, max_turns=80)
+    assert without_time(first) == without_time(again)
+    assert 0 < first.turns <= 80
+
+
+def test_in_process_run_matches_fresh_boards(board, board_csv):
+    units = list(plan_units(6, chunk=4, base_seed=10, max_turns=60))
+    assert [list(u.seeds) for u in units] == [[10, 11, 12, 13], [14, 15]]
+
+    with Simulator(board, workers=0) as sim:
+        results = [without_time(r) for r in sim.run(units)]
+
+    expected = [
+        without_time(play_match(GameBoard(board_csv), seed, max_turns=60))
+        for seed in range(10, 16)
+    ]
+    assert results == expected
+
+
+def test_pool_run_matches_in_process(board):
+    units = list(plan_units(4, chunk=2, max_turns=40, label="pool"))
+    with Simulator(board, workers=2) as sim:
+        pooled = sorted(without_time(r) for r in sim.run(units))
+    with Simulator(board, workers=0) as sim:
+        local = sorted(without_time(r) for r in sim.run(units))
+    assert pooled == local
+
+
+def test_balance_overrides_are_scoped():
+    gun_range = BALANCE["gun"]["range"]
+    with balance_overrides({"gun": {"range": gun_range + 5}}):
+        assert BALANCE["gun"]["range"] == gun_range + 5
+    assert BALANCE["gun"]["range"] == gun_range
+
+    with pytest.raises(ValueError):
+        with balance_overrides({"laser": {"range": 1}}):
+            pass
+    assert BALANCE["gun"]["range"] == gun_range
+
+
+def test_match_stats_summary(board):
+    stats = MatchStats()
+    with Simulator(board, workers=0) as sim:
+        stats.extend(sim.run(plan_units(5, chunk=5, max_turns=30, label="a")))
+        stats.extend(sim.run(plan_units(3, chunk=5, max_turns=30, label="b",
+                                        overrides={"gun": {"range": 9}})))
+
+    summary = stats.summary()
+    assert len(stats) == 8
+    assert summary["a"]["matches"] == 5 and summary["b"]["matches"] == 3
+    for label in ("a", "b"):
+        s = summary[label]
+        assert s["draws"] + round(sum(s["win_rate"].values()) * s["matches"]) == s["matches"]
+        assert s["turns_p50"] <= s["turns_p95"] <= s["turns_max"] <= 30
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from game_board import GameBoard
+from helicopter_part import HelicopterPart
+from player import Player
+from player_actions import PlayerActionProvider
+from spatial_index import SpatialIndex
+
+
+class Token:
+    pass
+
+
+def test_cell_lookup_and_moves():
+    index = SpatialIndex(10, 10, bucket_size=4)
+    a, b = Token(), Token()
+    index.add(a, 2, 3)
+    index.add(b, 2, 3)
+
+    assert index.at(2, 3) == [a, b]
+    index.move(a, 9, 9)
+    assert index.at(2, 3) == [b]
+    assert index.at(9, 9) == [a]
+
+    index.move(b, -1, -1)
+    assert b in index and index.at(2, 3) == []
+    index.remove(b)
+    assert b not in index and len(index) == 1
+
+
+def test_within_matches_brute_force():
+    rng = random.Random(19)
+    index = SpatialIndex(40, 30, bucket_size=6)
+    positions = {}
+    for _ in range(200):
+        token = Token()
+        positions[token] = (rng.randrange(40), rng.randrange(30))
+        index.add(token, *positions[token])
+
+    for _ in range(50):
+        x, y, r = rng.randrange(40), rng.randrange(30), rng.randint(0, 12)
+        expected = {t for t, (tx, ty) in positions.items() if abs(tx - x) + abs(ty - y) <= r}
+        found = index.within(x, y, r)
+        assert len(found) == len(expected) and set(found) == expected
+
+
+def test_invalid_bucket_size():
+    with pytest.raises(ValueError):
+        SpatialIndex(4, 4, bucket_size=0)
+
+
+def test_parts_follow_place_and_remove():
+    board = GameBoard(width=6, height=6)
+    other = GameBoard(width=6, height=6)
+    part = HelicopterPart("red")
+
+    part.place_on_board(board, 1, 2)
+    assert board.has_part_at(1, 2)
+    assert board.parts_on(1, 2) == [part]
+
+    part.place_on_board(other, 4, 4)
+    assert not board.has_part_at(1, 2)
+    assert other.has_part_at(4, 4)
+
+    part.remove_from_board()
+    assert not other.has_part_at(4, 4)
+    assert part not in other.spatial_index()
+
+
+def test_tracked_players_follow_coordinate_changes():
+    board = GameBoard(width=20, height=20)
+    near, far = Player(x=3, y=3), Player(x=15, y=15)
+    board.track_player(near)
+    board.track_player(far)
+    HelicopterPart("blue").place_on_board(board, 3, 4)
+
+    assert board.players_on(3, 3) == [near]
+    assert board.players_within(3, 3, 5) == [near]
+
+    far.x, far.y = 5, 4
+    assert board.players_within(3, 3, 5) == [near, far]
+
+    board.untrack_player(far)
+    far.x = 3
+    assert board.players_within(3, 3, 5) == [near]
+
+
+def test_possible_actions_see_parts_on_game_board():
+    board = GameBoard(width=5, height=5)
+    p = Player(x=2, y=2, on_land=True)
+    assert "pickup part" not in PlayerActionProvider.possible_actions(p, board)
+
+    HelicopterPart("green").place_on_board(board, 2, 2)
+    assert "pickup part" in PlayerActionProvider.possible_actions(p, board)
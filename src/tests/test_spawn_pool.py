@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from constants import BUILDING_TYPE
+from game_board import GameBoard
+from spawn_pool import SpawnPool
+
+
+def test_pool_add_discard_and_membership():
+    pool = SpawnPool([1, 2, 3])
+    pool.add(2)
+    assert len(pool) == 3
+
+    pool.discard(1)
+    pool.discard(99)
+    assert sorted(pool) == [2, 3]
+    assert 1 not in pool and 3 in pool
+
+    pool.discard(3)
+    pool.discard(2)
+    assert len(pool) == 0
+
+
+def test_building_removes_cell_from_both_pools():
+    b = GameBoard(width=3, height=3)
+    i = b.index_of(1, 1)
+    assert i in b.spawn_pool(True) and i in b.spawn_pool(False)
+
+    assert b.get_cell(1, 1).build() is True
+
+    assert i not in b.spawn_pool(True)
+    assert i not in b.spawn_pool(False)
+
+
+def test_building_through_array_view_updates_pool():
+    b = GameBoard(width=3, height=3, backend="array")
+    pool = b.spawn_pool(True)
+    b.get_cell(2, 0).build()
+    assert b.index_of(2, 0) not in pool
+
+
+def test_set_terrain_swamp_only_affects_player_pool():
+    b = GameBoard(width=3, height=3)
+    player_pool, part_pool = b.spawn_pool(True), b.spawn_pool(False)
+
+    b.set_terrain(0, 0, swamp=True, plain=False)
+    assert b.index_of(0, 0) not in player_pool
+    assert b.index_of(0, 0) in part_pool
+
+    b.set_terrain(0, 0, swamp=False, plain=True)
+    assert b.index_of(0, 0) in player_pool
+
+
+def test_drop_raises_when_no_cell_is_eligible():
+    b = GameBoard(width=2, height=1)
+    b.set_terrain(0, 0, building=BUILDING_TYPE["bank"])
+    b.set_terrain(1, 0, swamp=True)
+
+    with pytest.raises(ValueError):
+        b.drop_to_island(is_player=True)
+    assert b.drop_to_island(is_player=False) == (1, 0)
+
+
+def test_drop_many_unique_never_collides():
+    b = GameBoard(width=10, height=10)
+    b.get_cell(3, 3).build()
+
+    random.seed(1)
+    drops = b.drop_many(99, is_player=True, unique=True)
+    assert len(set(drops)) == 99
+    assert (3, 3) not in drops
+
+    with pytest.raises(ValueError):
+        b.drop_many(100, is_player=True, unique=True)
+
+
+def test_drop_many_with_collisions_allowed():
+    b = GameBoard(width=2, height=2)
+    random.seed(2)
+    drops = b.drop_many(50, is_player=False)
+    assert len(drops) == 50
+    assert set(drops) <= {(0, 0), (1, 0), (0, 1), (1, 1)}
+
+
+def test_reset_spawn_pools_restores_board_order():
+    b = GameBoard(width=3, height=3)
+    fresh = list(b.spawn_pool(is_player=True))
+
+    b.set_terrain(0, 0, building=BUILDING_TYPE["shop"])
+    b.set_terrain(0, 0, building=BUILDING_TYPE["none"])
+    assert list(b.spawn_pool(is_player=True)) != fresh
+
+    b.reset_spawn_pools()
+    assert list(b.spawn_pool(is_player=True)) == fresh
@@ -0,0 +1,47 @@
+import random
+
+from game_board import GameBoard
+from player import Player
+from threat_map import ThreatMap
+
+
+CHECKS = {
+    "h2h": Player.can_attack_hand_to_hand,
+    "gun": Player.can_attack_with_gun,
+    "rocket": Player.can_attack_with_rocket,
+}
+
+
+def test_counts_and_holders_match_pairwise_checks(board):
+    rng = random.Random(17)
+    enemies = []
+    for _ in range(6):
+        p = Player(x=rng.randrange(board.WIDTH), y=rng.randrange(board.HEIGHT))
+        p.weapons = ["gun", "bullet", "rpg", "rocket"]
+        enemies.append(p)
+
+    threats = ThreatMap(board, enemies)
+
+    for y in range(board.HEIGHT):
+        for x in range(board.WIDTH):
+            total = 0
+            for weapon, check in CHECKS.items():
+                able = [p for p in enemies if check(p, board, x, y)]
+                assert threats.count(x, y, weapon) == len(able)
+                assert threats.threatened_by(x, y, weapon) == able
+                total += len(able)
+            assert threats.count(x, y) == total
+
+
+def test_any_weapon_holders_and_safe_cells():
+    b = GameBoard(width=20, height=1)
+    gunner = Player(x=0, y=0)
+    gunner.weapons = ["gun", "bullet"]
+    brawler = Player(x=19, y=0)
+
+    threats = ThreatMap(b, [gunner, brawler])
+
+    assert threats.threatened_by(3, 0) == [gunner]
+    assert threats.count(3, 0) == 2  # gun and h2h
+    assert threats.threatened_by(15, 0) == [brawler]
+    assert threats.safe_cells() == [(x, 0) for x in range(7, 13)]
@@ -0,0 +1,62 @@
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+# Weapons in Player.attack_reach order
+WEAPONS = ("h2h", "gun", "rocket")
+
+
+class ThreatMap:
+    """
+    How many, and which, of a set of players can attack each cell.
+
+    counts[weapon] is a dense per-cell array (index y * WIDTH + x) and
+    total sums the weapons, so "how dangerous is this cell" is a single
+    index. holders[weapon][i] is a bitmask over `players` (bit k is
+    players[k]) for "who threatens this cell". Built from one
+    Player.attack_reach per player.
+    """
+
+    def __init__(self, board, players: Sequence):
+        self.width = board.WIDTH
+        size = board.WIDTH * board.HEIGHT
+        self.players = list(players)
+        self.counts: Dict[str, array] = {w: array("H", bytes(2 * size)) for w in WEAPONS}
+        self.holders: Dict[str, List[int]] = {w: [0] * size for w in WEAPONS}
+        self.total = array("H", bytes(2 * size))
+
+        width = self.width
+        for k, player in enumerate(self.players):
+            bit = 1 << k
+            for weapon, cells in player.attack_reach(board).items():
+                counts = self.counts[weapon]
+                holders = self.holders[weapon]
+                for x, y in cells:
+                    i = y * width + x
+                    counts[i] += 1
+                    holders[i] |= bit
+                    self.total[i] += 1
+
+    def count(self, x: int, y: int, weapon: Optional[str] = None) -> int:
+        """
+        Threats on (x, y) with `weapon`, or with any weapon when None
+        (a player threatening a cell with two weapons counts twice).
+        """
+        i = y * self.width + x
+        if weapon is None:
+            return self.total[i]
+        return self.counts[weapon][i]
+
+    def threatened_by(self, x: int, y: int, weapon: Optional[str] = None) -> List:
+        """
+        Players able to attack (x, y), with `weapon` or with any weapon.
+        """
+        i = y * self.width + x
+        weapons = WEAPONS if weapon is None else (weapon,)
+        mask = 0
+        for w in weapons:
+            mask |= self.holders[w][i]
+        return [p for k, p in enumerate(self.players) if mask >> k & 1]
+
+    def safe_cells(self) -> List[tuple]:
+        width = self.width
+        return [(i % width, i // width) for i, n in enumerate(self.total) if n == 0]